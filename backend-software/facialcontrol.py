@@ -1,17 +1,32 @@
 import cv2
-import numpy as np
-import pyautogui
-import mediapipe as mp
 import time
 import tkinter as tk
 # Might use CustomTkinter to style better
-from collections import deque
 import sys
-import win32gui
-import win32con
-import win32process
+import os
 import threading
 
+# pyautogui needs a display and win32 is Windows-only; headless replay runs
+# (e.g. CI on Linux) go through the FakeActuator instead
+try:
+    import pyautogui
+except Exception:
+    pyautogui = None
+try:
+    import win32gui
+    import win32con
+    import win32process
+except ImportError:
+    win32gui = win32con = win32process = None
+
+# Shared tracking engine lives in the class-based app
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "class-based-app"))
+from engine.pipeline import TrackingEngine, CALIBRATED
+from engine.gestures import CLICK, TOGGLE_KEYBOARD
+from engine.latency import LatencyRecorder
+from engine.metrics import METRICS, start_from_env as start_metrics_server
+from engine.startup import CameraOpener
+
 # Just need to implement app functions right now 
 
 def get_active_window_handle():
@@ -237,6 +252,7 @@ class VirtualKeyboard:
     
     def toggle(self):
         """Toggle keyboard visibility"""
+        METRICS.keyboard_toggles.inc()
         if self.visible:
             self.hide()
         else:
@@ -255,42 +271,56 @@ class VirtualKeyboard:
 The above features may be moved to a configuration section
 """
 
-class FacialMouseController:
-    def __init__(self):
-        # Screen dimensions
-        self.screen_width, self.screen_height = pyautogui.size()
-        
-        # Initialize MediaPipe Face Mesh
-        self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        
-        # Smoothing Points
-        # ====== These features could be included to a settings configuration ========
-        # All adjustable 
-        self.smoothing_factor = 10  
-        self.x_points = deque(maxlen=self.smoothing_factor)
-        self.y_points = deque(maxlen=self.smoothing_factor)
-        self.base_sensitivity = 3.5
-        self.sensitivity = self.base_sensitivity
-        
-        
-        self.click_threshold = 0.05  
-        self.last_click_time = 0
-        self.click_cooldown = 0.5  # Minimum time between clicks (seconds)
+class HeadlessKeyboard:
+    """Stand-in for VirtualKeyboard when running without a display"""
+    def __init__(self, sensitivity):
+        self.visible = False
+        self.sensitivity = sensitivity
+    
+    def toggle(self):
+        self.visible = not self.visible
+    
+    def get_sensitivity(self):
+        return self.sensitivity
 
-                # This may need to be changed as I introduce more commands (mouth opens)
-        # Might interfere
+class FacialMouseController:
+    def __init__(self, headless=False, actuator=None):
+        # headless skips every window (replay runs with a FakeActuator)
+        self.headless = headless
 
+        # The webcam negotiates its mode in the background while Face Mesh loads
+        self.camera_opener = None
+        if not headless:
+            self.camera_opener = CameraOpener(0, reprobe=os.getenv("LIBERATE_CAMERA_REPROBE") == "1")
+        
+        # Capture, landmarks, smoothing, calibration and gestures live in the shared
+        # tracking engine; this class is the OpenCV window and keyboard front end.
+        # Only the nose and lips are read here, so the iris refinement model is skipped.
+        # Weighted smoothing, the full screen and a 5 s keyboard toggle cooldown
+        # keep this front end's original feel
+        self.engine = TrackingEngine(
+            actuator=actuator,
+            features=("cursor", "click"),
+            smoothing="weighted",
+            safe_margin=0,
+            cursor_hz=int(os.getenv("LIBERATE_CURSOR_HZ", "120")),
+            workers=int(os.getenv("LIBERATE_FACEMESH_WORKERS", "0")),
+            power_save=os.getenv("LIBERATE_POWER_SAVE", "1") != "0",
+            motion_gate=os.getenv("LIBERATE_MOTION_GATE", "1") != "0",
+            optical_flow=os.getenv("LIBERATE_OPTICAL_FLOW") == "1",
+            toggle_cooldown=5,
+            pointer_mode=os.getenv("LIBERATE_POINTER", "head"),
+            gain_curve=os.getenv("LIBERATE_GAIN_CURVE") or None,
+            drift_correction=os.getenv("LIBERATE_DRIFT_CORRECTION", "0") == "1"
+        )
+        # First real frame shouldn't pay the graph setup
+        self.engine.warm_up()
         
         # Might want to hide the OpenCV live camera to improve performance 
         self.paused = False
-        cv2.namedWindow("Facial Mouse Control", cv2.WINDOW_NORMAL)
-        cv2.resizeWindow("Facial Mouse Control", 640, 480)
+        if not self.headless:
+            cv2.namedWindow("Facial Mouse Control", cv2.WINDOW_NORMAL)
+            cv2.resizeWindow("Facial Mouse Control", 640, 480)
         
         """
         Landmark features may be removed to improve performance
@@ -299,35 +329,17 @@ class FacialMouseController:
         self.show_nose_position = True
         self.show_mouth_status = True
         self.show_debug_info = True
-
-        # Calibration - setting where the center point for the mouse is relative to the face (webcam)
-        
-        self.calibrated = False
-        self.neutral_x = 0.5
-        self.neutral_y = 0.5
-        self.calibration_frames = 30
-        self.calibration_count = 0
-        self.calibration_data_x = []
-        self.calibration_data_y = []
         
         # Virtual keyboard - root window invisible but needed for tk operations
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide the root window
-        self.root.attributes('-alpha', 0.0)  # Make fully transparent
-        self.root.title("Facial Mouse Controller Base")
-        self.keyboard = VirtualKeyboard(self.root)
-        
-        # Open mouth 3 times to toggle the keyboard 
-        """
-        Command Toggle 1 
-        """
-        self.mouth_open_count = 0
-        self.mouth_open_sequence = []
-        self.mouth_open_time_window = 2.0  # Time window for consecutive mouth opens (seconds)
-        self.last_mouth_open_time = 0
-        self.last_keyboard_toggle_time = 0
-        self.keyboard_toggle_cooldown = 5  
-        # Seconds between keyboard toggles
+        if self.headless:
+            self.root = None
+            self.keyboard = HeadlessKeyboard(self.engine.sensitivity)
+        else:
+            self.root = tk.Tk()
+            self.root.withdraw()  # Hide the root window
+            self.root.attributes('-alpha', 0.0)  # Make fully transparent
+            self.root.title("Facial Mouse Controller Base")
+            self.keyboard = VirtualKeyboard(self.root)
         
         # Showing that the keystroke has been clicked 
         self.showing_click_feedback = False
@@ -342,22 +354,38 @@ class FacialMouseController:
         self.frame_skip = 0 
         self.frame_counter = 0
         
+        # LIBERATE_LATENCY_REPORT=1 prints motion-to-photon percentiles on exit
+        if os.getenv("LIBERATE_LATENCY_REPORT") == "1":
+            self.engine.latency = LatencyRecorder()
+        
+        # LIBERATE_METRICS=9464 (or unix:/path.sock) serves counters on localhost
+        self.metrics_server = None if self.headless else start_metrics_server()
+        
         # Trackbars for these features
         # Might be put into the settings as well
-        cv2.createTrackbar('Sensitivity', 'Facial Mouse Control', 35, 80, self.update_sensitivity)
-        cv2.createTrackbar('Click Threshold', 'Facial Mouse Control', 5, 15, self.update_threshold)
+        if not self.headless:
+            cv2.createTrackbar('Sensitivity', 'Facial Mouse Control', 35, 80, self.update_sensitivity)
+            cv2.createTrackbar('Click Threshold', 'Facial Mouse Control', 5, 15, self.update_threshold)
+    
+    @property
+    def calibrated(self):
+        return self.engine.calibrated
         
     def update_sensitivity(self, value):
         """Callback for sensitivity trackbar"""
-        self.sensitivity = value / 10.0
+        self.engine.sensitivity = value / 10.0
         
     def update_threshold(self, value):
         """Callback for threshold trackbar"""
-        self.click_threshold = value / 100.0
+        self.engine.mouth.click_threshold = value / 100.0
         
     def start(self):
         # Opening the program to allow webcam features 
-        cap = cv2.VideoCapture(0)
+        # Low-latency camera mode (probed once per device, then cached)
+        if self.camera_opener:
+            cap = self.engine.attach(self.camera_opener.result())
+        else:
+            cap = self.engine.open_camera(0, reprobe=os.getenv("LIBERATE_CAMERA_REPROBE") == "1")
         
         if not cap.isOpened():
             print("Error: Could not open webcam.")
@@ -380,44 +408,24 @@ class FacialMouseController:
         Manually close the app 
         """
         
+        self.engine.start()
         while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
+            frame = self.engine.read_frame()
+            if frame is None:
                 break
-                
-            frame = cv2.flip(frame, 1)
             
              # ======= PERFORMANCE OPTIMIZATION =======
             # Skipping frames if needed 
 
             """
             Works by not processing the frames, reducing the amount of resources needed 
+            Skipped frames are still shown
             """
 
             self.frame_counter += 1
-            if self.frame_counter % (self.frame_skip + 1) != 0:
-                # Still show the frame but don't process it
-                self.display_status_on_frame(frame)
-                cv2.imshow("Facial Mouse Control", frame)
-                
-                # Check for key presses
-                key = cv2.waitKey(1) & 0xFF
-                self.handle_key_press(key)
-                
-                # Update the Tkinter UI
-                try:
-                    self.root.update_idletasks()
-                    self.root.update()
-                except:
-                    pass
-                
-                continue
-            
-            # Process frame for calibration or normal operation
-            if not self.calibrated:
-                self.calibrate_frame(frame)
-            elif not self.paused:
+            if self.frame_counter % (self.frame_skip + 1) == 0:
                 self.process_frame(frame)
+            self.engine.end_frame()
         
             key = cv2.waitKey(1) & 0xFF
             self.handle_key_press(key)
@@ -426,24 +434,29 @@ class FacialMouseController:
             
             cv2.imshow("Facial Mouse Control", frame)
             
-            # Update the Tkinter UI
-            try:
-                self.root.update_idletasks()
-                self.root.update()
-            except:
-                pass
+            # Update the Tkinter UI (there is none when headless)
+            if self.root is not None:
+                try:
+                    self.root.update_idletasks()
+                    self.root.update()
+                except tk.TclError:
+                    pass
         
         # Clean up
-        cap.release()
+        self.engine.release()
+        if self.engine.latency:
+            print(self.engine.latency.format_report("FacialMouseController motion-to-photon latency"))
         cv2.destroyAllWindows()
-        self.root.destroy()
+        if self.root is not None:
+            self.root.destroy()
     
     # Error handling for the keyboard commands like p for pause and such 
     def handle_key_press(self, key):
         """Handle keyboard input"""
         if key == ord('q'):
             cv2.destroyAllWindows()
-            self.root.quit()
+            if self.root is not None:
+                self.root.quit()
             sys.exit(0)
         elif key == ord('p'):
             self.paused = not self.paused
@@ -467,7 +480,8 @@ class FacialMouseController:
         
         # Show calibration or running status
         if not self.calibrated:
-            cv2.putText(frame, f"CALIBRATING... {self.calibration_count}/{self.calibration_frames}", 
+            calibrator = self.engine.calibrator
+            cv2.putText(frame, f"CALIBRATING... {calibrator.count}/{calibrator.frames}", 
                       (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
         else:
             status_text = "PAUSED" if self.paused else "RUNNING"
@@ -481,257 +495,145 @@ class FacialMouseController:
         
         # Show settings if debug info is enabled
         if self.show_debug_info:
-            cv2.putText(frame, f"Sensitivity: {self.sensitivity:.1f}", (10, frame_height - 70), 
+            cv2.putText(frame, f"Sensitivity: {self.engine.sensitivity:.1f}", (10, frame_height - 70), 
                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 1)
-            cv2.putText(frame, f"Click threshold: {self.click_threshold:.2f}", (10, frame_height - 40), 
+            cv2.putText(frame, f"Click threshold: {self.engine.mouth.click_threshold:.2f}", (10, frame_height - 40), 
                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 1)
             cv2.putText(frame, "Controls: P=Pause C=Calibrate K=Keyboard D=Debug Q=Quit", 
                       (10, frame_height - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
     
     def reset_calibration(self):
         """Reset calibration data to start fresh"""
-        self.calibrated = False
-        self.calibration_count = 0
-        self.calibration_data_x = []
-        self.calibration_data_y = []
-        
-    def calibrate_frame(self, frame):
-        """Process a frame during calibration phase"""
-        # Convert to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self.engine.recalibrate()
         
-        # Process the frame with MediaPipe Face Mesh
-        results = self.face_mesh.process(rgb_frame)
+    def process_frame(self, frame):
+        """Run a frame through the engine (calibrating first) and draw the result"""
+        # Paused: keep showing the camera but leave the mouse alone
+        if self.paused and self.calibrated:
+            return
         
-        if results.multi_face_landmarks:
-            landmarks = results.multi_face_landmarks[0].landmark
-            
-            # Get nose tip for calibration
-            nose_x = landmarks[1].x
-            nose_y = landmarks[1].y
-            
-            # Store calibration data
-            self.calibration_data_x.append(nose_x)
-            self.calibration_data_y.append(nose_y)
-            self.calibration_count += 1
-            
-            # Mark nose position on frame
-            frame_height, frame_width = frame.shape[:2]
-            nose_screen_x = int(nose_x * frame_width)
-            nose_screen_y = int(nose_y * frame_height)
-            cv2.circle(frame, (nose_screen_x, nose_screen_y), 5, (0, 255, 255), -1)
-            
-            # Mark center target
-            center_x = frame_width // 2
-            center_y = frame_height // 2
-            cv2.drawMarker(frame, (center_x, center_y), (0, 255, 255), 
-                         markerType=cv2.MARKER_CROSS, markerSize=20, thickness=2)
-            
-            # Draw guidance rectangle for calibration
-            rect_size = min(frame_width, frame_height) // 4
-            cv2.rectangle(frame, 
-                        (center_x - rect_size, center_y - rect_size),
-                        (center_x + rect_size, center_y + rect_size),
-                        (0, 255, 255), 1)
-            
-            # Once we have enough frames, complete calibration
-            if self.calibration_count >= self.calibration_frames:
-                # Calculate average neutral position (removing outliers)
-                sorted_x = sorted(self.calibration_data_x)
-                sorted_y = sorted(self.calibration_data_y)
-                
-                # Remove potential outliers (20% from each end)
-                trim_size = int(self.calibration_frames * 0.2)
-                trimmed_x = sorted_x[trim_size:-trim_size]
-                trimmed_y = sorted_y[trim_size:-trim_size]
-                
-                self.neutral_x = sum(trimmed_x) / len(trimmed_x)
-                self.neutral_y = sum(trimmed_y) / len(trimmed_y)
-                
-                self.calibrated = True
-                print(f"Calibration complete! Neutral position set at ({self.neutral_x:.3f}, {self.neutral_y:.3f})")
-                
-                # Clear any queued positions
-                self.x_points.clear()
-                self.y_points.clear()
+        # Use keyboard sensitivity if available
+        if self.keyboard.visible:
+            try:
+                self.engine.sensitivity = self.keyboard.get_sensitivity()
+            except:
+                # Fallback if getting sensitivity fails
+                pass
         
-    def process_frame(self, frame):
-        """Process a frame during normal operation"""
-        # Convert to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        result = self.engine.process(frame)
         frame_height, frame_width = frame.shape[:2]
+        current_time = time.time()
         
-        # Process the frame with MediaPipe Face Mesh
-        results = self.face_mesh.process(rgb_frame)
+        if result.calibrating:
+            self.draw_calibration(frame, result)
+            if CALIBRATED in result.events:
+                calibrator = self.engine.calibrator
+                print(f"Calibration complete! Neutral position set at ({calibrator.neutral_x:.3f}, {calibrator.neutral_y:.3f})")
+            return
         
-        if not results.multi_face_landmarks:
+        if not result.face_found:
             # No face detected
             if self.show_debug_info:
                 cv2.putText(frame, "No face detected", (frame_width // 2 - 100, frame_height // 2), 
                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
             return
-            
-        landmarks = results.multi_face_landmarks[0].landmark
         
-        # Get nose tip (landmark 1)
-        nose_x = landmarks[1].x
-        nose_y = landmarks[1].y
+        nose_screen_x = int(result.nose[0] * frame_width)
+        nose_screen_y = int(result.nose[1] * frame_height)
         
         # Display nose position
         if self.show_nose_position:
-            nose_screen_x = int(nose_x * frame_width)
-            nose_screen_y = int(nose_y * frame_height)
             cv2.circle(frame, (nose_screen_x, nose_screen_y), 5, (0, 255, 0), -1)
         
-        # Use keyboard sensitivity if available
-        if self.keyboard.visible:
-            try:
-                self.sensitivity = self.keyboard.get_sensitivity()
-            except:
-                # Fallback if getting sensitivity fails
-                pass
-        
-        # Map to screen coordinates with enhanced sensitivity
-        # Center point calibration (use calibrated neutral position)
-        offset_x = (nose_x - self.neutral_x) * self.sensitivity
-        offset_y = (nose_y - self.neutral_y) * self.sensitivity
-        
-        # Calculate target position with exponential mapping for finer control
-        target_x = self.screen_width * (0.5 + offset_x)
-        target_y = self.screen_height * (0.5 + offset_y)
-        
-        # Add to smoothing queue
-        self.x_points.append(target_x)
-        self.y_points.append(target_y)
-        
-        # Enhanced smoothing with weighted average (recent positions have more influence)
-        if len(self.x_points) > 3:  
-            weights = np.linspace(0.5, 1.0, len(self.x_points))
-            weights = weights / weights.sum()  
-            
-            smoothed_x = sum(x * w for x, w in zip(self.x_points, weights))
-            smoothed_y = sum(y * w for y, w in zip(self.y_points, weights))
-        else:
-            # Simple average for the first few frames
-            smoothed_x = sum(self.x_points) / len(self.x_points)
-            smoothed_y = sum(self.y_points) / len(self.y_points)
-        
-        # Ensure coordinates are within screen bounds
-        smoothed_x = max(0, min(smoothed_x, self.screen_width))
-        smoothed_y = max(0, min(smoothed_y, self.screen_height))
-        
-        # Move cursor
-        try:
-            pyautogui.moveTo(int(smoothed_x), int(smoothed_y))
-        except Exception as e:
-            if self.show_debug_info:
-                cv2.putText(frame, f"Mouse error: {str(e)}", (10, frame_height - 100), 
-                          cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 1)
-        
-        # Detect mouth open for click and keyboard toggle
-        upper_lip = landmarks[13]
-        lower_lip = landmarks[14]
-        mouth_distance = abs(upper_lip.y - lower_lip.y)
-        
-        # Face height for relative measurement
-        face_height = abs(landmarks[10].y - landmarks[152].y)
-        relative_mouth_distance = mouth_distance / face_height
+        if self.show_mouth_status:
+            self.draw_mouth_status(frame, result)
         
-        # Current time for timing operations
-        current_time = time.time()
+        if result.mouth_open and self.engine.mouth.sequence:
+            # Display count of recent mouth opens
+            cv2.putText(frame, f"MOUTH OPENS: {len(self.engine.mouth.sequence)}/3", 
+                      (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
         
-        # Display mouth status
-        mouth_open = relative_mouth_distance > self.click_threshold
-        if self.show_mouth_status:
-            mouth_status = "MOUTH: OPEN" if mouth_open else "MOUTH: CLOSED"
-            cv2.putText(frame, mouth_status, (10, 60), 
-                      cv2.FONT_HERSHEY_SIMPLEX, 0.7, 
-                      (0, 0, 255) if mouth_open else (255, 0, 0), 2)
-            
-            # Show mouth distance indicator
-            indicator_x = 120
-            indicator_y = 90
-            indicator_width = 100
-            indicator_height = 15
-            """
-            These landmarks, shapes may not be needed, are just indicators that the application is functioning as is 
-            """
-            # Background bar
-            cv2.rectangle(frame, 
-                        (indicator_x, indicator_y), 
-                        (indicator_x + indicator_width, indicator_y + indicator_height),
-                        (50, 50, 50), -1)
-            
-            # Fill bar based on mouth distance
-            fill_width = int(min(1.0, relative_mouth_distance / (self.click_threshold * 1.5)) * indicator_width)
-            cv2.rectangle(frame, 
-                        (indicator_x, indicator_y),
-                        (indicator_x + fill_width, indicator_y + indicator_height),
-                        (0, 255, 0) if mouth_open else (0, 170, 255), -1)
-            
-            # Threshold line
-            threshold_x = indicator_x + int(self.click_threshold / (self.click_threshold * 1.5) * indicator_width)
-            cv2.line(frame, 
-                   (threshold_x, indicator_y - 2), 
-                   (threshold_x, indicator_y + indicator_height + 2),
-                   (255, 255, 255), 1)
-        
-        # Mouth open detection and tracking
-        if mouth_open:
-            # If this is a new mouth opening (not continuous from previous frame)
-            if (len(self.mouth_open_sequence) == 0 or 
-                current_time - self.last_mouth_open_time > 0.5): 
-                
-                self.mouth_open_sequence.append(current_time)
-                self.last_mouth_open_time = current_time
-                
-                # Remove any opens that are too old (outside the time window)
-                while (len(self.mouth_open_sequence) > 0 and 
-                       current_time - self.mouth_open_sequence[0] > self.mouth_open_time_window):
-                    self.mouth_open_sequence.pop(0)
-                
-                # Display count of recent mouth opens
-                cv2.putText(frame, f"MOUTH OPENS: {len(self.mouth_open_sequence)}/3", 
-                          (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-                
-                # Check for 3 consecutive mouth opens in the time window
-                if (len(self.mouth_open_sequence) >= 3 and 
-                    current_time - self.last_keyboard_toggle_time > self.keyboard_toggle_cooldown):
-                    self.keyboard.toggle()
-                    self.last_keyboard_toggle_time = current_time
-                    # Reset sequence after toggling
-                    self.mouth_open_sequence = []
-                    
-                    # Visual feedback for keyboard toggle
-                    keyboard_status = "KEYBOARD: " + ("HIDDEN" if not self.keyboard.visible else "VISIBLE")
-                    cv2.putText(frame, keyboard_status, (frame_width - 300, 90), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+        if TOGGLE_KEYBOARD in result.events:
+            self.keyboard.toggle()
             
-            # Check for click (regular single mouth open)
-            if (len(self.mouth_open_sequence) == 1 and 
-                current_time - self.last_click_time > self.click_cooldown):
-                try:
-                    pyautogui.click()
-                    self.last_click_time = current_time
-                    self.showing_click_feedback = True
-                    self.click_feedback_start = current_time
-                    
-                    cv2.putText(frame, "CLICK!", 
-                              (nose_screen_x - 30, nose_screen_y - 20), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-                    
-                except Exception as e:
-                    if self.show_debug_info:
-                        cv2.putText(frame, f"Click error: {str(e)}", (10, frame_height - 130), 
-                                  cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 1)
+            # Visual feedback for keyboard toggle
+            keyboard_status = "KEYBOARD: " + ("HIDDEN" if not self.keyboard.visible else "VISIBLE")
+            cv2.putText(frame, keyboard_status, (frame_width - 300, 90), 
+                      cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+        
+        if CLICK in result.events:
+            self.showing_click_feedback = True
+            self.click_feedback_start = current_time
+            cv2.putText(frame, "CLICK!", 
+                      (nose_screen_x - 30, nose_screen_y - 20), 
+                      cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
         
         # Show click feedback if active
         if self.showing_click_feedback:
             if current_time - self.click_feedback_start < self.click_feedback_duration:
-                cv2.circle(frame, (int(nose_x * frame_width), int(nose_y * frame_height)), 
-                         20, (0, 255, 255), 2)
+                cv2.circle(frame, (nose_screen_x, nose_screen_y), 20, (0, 255, 255), 2)
             else:
                 self.showing_click_feedback = False
+    
+    def draw_calibration(self, frame, result):
+        """Nose position, center target and guidance box while calibrating"""
+        if not result.face_found:
+            return
+        frame_height, frame_width = frame.shape[:2]
+        
+        # Mark nose position on frame
+        nose_screen_x = int(result.nose[0] * frame_width)
+        nose_screen_y = int(result.nose[1] * frame_height)
+        cv2.circle(frame, (nose_screen_x, nose_screen_y), 5, (0, 255, 255), -1)
+        
+        # Mark center target
+        center_x = frame_width // 2
+        center_y = frame_height // 2
+        cv2.drawMarker(frame, (center_x, center_y), (0, 255, 255), 
+                     markerType=cv2.MARKER_CROSS, markerSize=20, thickness=2)
+        
+        # Draw guidance rectangle for calibration
+        rect_size = min(frame_width, frame_height) // 4
+        cv2.rectangle(frame, 
+                    (center_x - rect_size, center_y - rect_size),
+                    (center_x + rect_size, center_y + rect_size),
+                    (0, 255, 255), 1)
+    
+    def draw_mouth_status(self, frame, result):
+        """Mouth open/closed text and a bar showing the opening against the threshold"""
+        click_threshold = self.engine.mouth.click_threshold
+        mouth_status = "MOUTH: OPEN" if result.mouth_open else "MOUTH: CLOSED"
+        cv2.putText(frame, mouth_status, (10, 60), 
+                  cv2.FONT_HERSHEY_SIMPLEX, 0.7, 
+                  (0, 0, 255) if result.mouth_open else (255, 0, 0), 2)
+        
+        # Show mouth distance indicator
+        indicator_x = 120
+        indicator_y = 90
+        indicator_width = 100
+        indicator_height = 15
+        """
+        These landmarks, shapes may not be needed, are just indicators that the application is functioning as is 
+        """
+        # Background bar
+        cv2.rectangle(frame, 
+                    (indicator_x, indicator_y), 
+                    (indicator_x + indicator_width, indicator_y + indicator_height),
+                    (50, 50, 50), -1)
+        
+        # Fill bar based on mouth distance
+        fill_width = int(min(1.0, result.mouth_ratio / (click_threshold * 1.5)) * indicator_width)
+        cv2.rectangle(frame, 
+                    (indicator_x, indicator_y),
+                    (indicator_x + fill_width, indicator_y + indicator_height),
+                    (0, 255, 0) if result.mouth_open else (0, 170, 255), -1)
+        
+        # Threshold line
+        threshold_x = indicator_x + int(indicator_width / 1.5)
+        cv2.line(frame, 
+               (threshold_x, indicator_y - 2), 
+               (threshold_x, indicator_y + indicator_height + 2),
+               (255, 255, 255), 1)
 
 if __name__ == "__main__":
     controller = FacialMouseController()
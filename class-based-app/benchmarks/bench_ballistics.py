@@ -0,0 +1,71 @@
+"""Pointing time and overshoot of the linear mapping vs each gain curve preset.
+
+Replays a recorded session through TrackingEngine once per setting, on the
+recording's own clock, and splits each cursor trace into movements between
+the places the cursor settled (held within --width px for --hold seconds).
+Reports movement time, throughput and overshoot (how far the cursor went
+past where it settled, in px and as a share of the movement):
+    python -m benchmarks.bench_ballistics --video session.mp4
+
+Also prints the lookup-table cost per gain lookup, which needs no video:
+    python -m benchmarks.bench_ballistics
+"""
+import time
+
+from benchmarks.common import base_parser, cursor_trace, percentile, pointing_trials
+from engine.actuator import FakeActuator
+from engine.ballistics import PRESETS, GainCurve
+from engine.pipeline import TrackingEngine
+
+
+def lookup_cost(samples=200000):
+    """Seconds per gain lookup: LUT vs interpolating the control points every call"""
+    curve = GainCurve(PRESETS["balanced"])
+    speeds = [i / samples * 1.2 for i in range(samples)]
+    start = time.perf_counter()
+    for speed in speeds:
+        curve.gain(speed)
+    table = (time.perf_counter() - start) / samples
+    start = time.perf_counter()
+    for speed in speeds:
+        curve._interpolate(speed)
+    direct = (time.perf_counter() - start) / samples
+    return table, direct
+
+
+def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--width", type=float, default=60, help="Target width in pixels")
+    parser.add_argument("--hold", type=float, default=0.3, help="Seconds still that count as acquired")
+    parser.add_argument("--curve", action="append", choices=sorted(PRESETS),
+                        help="Preset to compare with the linear mapping (repeatable, default: all)")
+    args = parser.parse_args()
+
+    table, direct = lookup_cost()
+    print(f"gain lookup: table {table * 1e9:.0f} ns, interpolated {direct * 1e9:.0f} ns")
+    if not args.video:
+        return
+
+    print(f"{'curve':<10}{'moves':>7}{'MT ms':>8}{'p95 MT':>8}{'TP bit/s':>10}"
+          f"{'overshoot px':>14}{'p95 px':>8}{'% of D':>8}")
+    for curve in [None] + (args.curve or list(PRESETS)):
+        engine = TrackingEngine(actuator=FakeActuator(), features=("cursor",), gain_curve=curve,
+                                power_save=False, motion_gate=False)
+        points = cursor_trace(engine, args.video, args.frames)
+        engine.release()
+        name = curve or "absolute"
+        trials = pointing_trials(points, args.width, args.hold)
+        if not trials:
+            print(f"{name:<10}{0:>7}  no movements found")
+            continue
+        times = [trial["time"] * 1000 for trial in trials]
+        overshoots = [trial["overshoot"] for trial in trials]
+        relative = sum(t["overshoot"] / t["distance"] for t in trials) / len(trials)
+        throughput = sum(trial["id"] / trial["time"] for trial in trials) / len(trials)
+        print(f"{name:<10}{len(trials):>7}{sum(times) / len(times):>8.0f}{percentile(times, 95):>8.0f}"
+              f"{throughput:>10.2f}{sum(overshoots) / len(overshoots):>14.1f}"
+              f"{percentile(overshoots, 95):>8.1f}{relative * 100:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""End-to-end TrackingEngine throughput, per configuration.
+
+Runs the shared engine headless (FakeActuator, no windows) the way both front
+ends drive it and reports frames/s, per-frame time, Face Mesh calls and
+per-stage averages for each inference-skipping option:
+    python -m benchmarks.bench_engine --video session.mp4
+
+Without --video, synthetic frames exercise the no-face path only.
+"""
+import time
+
+from benchmarks.common import base_parser, load_frames, percentile, replay_session
+from engine.actuator import FakeActuator
+from engine.metrics import METRICS
+from engine.pipeline import TrackingEngine
+from engine.profiling import FrameProfiler
+
+CONFIGS = {
+    "baseline": dict(power_save=False, motion_gate=False),
+    "power_save": dict(power_save=True, motion_gate=False),
+    "motion_gate": dict(power_save=False, motion_gate=True),
+    "optical_flow": dict(power_save=False, motion_gate=False, optical_flow=True),
+    "all": dict(power_save=True, motion_gate=True, optical_flow=True),
+}
+
+
+def run(config, args, frames):
+    engine = TrackingEngine(actuator=FakeActuator(), **CONFIGS[config])
+    engine.profiler = FrameProfiler(window=args.frames, enabled=True)
+    engine.detector.profiler = engine.profiler
+    frame_times = []
+    inferences = METRICS.frames_processed.value
+
+    def on_frame(frame, result):
+        frame_times.append(time.perf_counter() - engine.profiler.frame_times[-1])
+
+    start = time.perf_counter()
+    if args.video:
+        count = replay_session(engine, args.video, args.frames, on_frame=on_frame)
+    else:
+        count = len(frames)
+        for frame in frames:
+            engine.begin_frame()
+            result = engine.process(frame)
+            on_frame(frame, result)
+            engine.end_frame()
+    elapsed = time.perf_counter() - start
+
+    inferences = METRICS.frames_processed.value - inferences
+    summary = engine.profiler.summary()
+    engine.release()
+    return count, elapsed, frame_times, inferences, summary, engine.actuator
+
+
+def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--config", action="append", choices=sorted(CONFIGS),
+                        help="Configuration to run (repeatable, default: all of them)")
+    args = parser.parse_args()
+    frames = None if args.video else load_frames(None, args.frames)
+
+    print(f"{'config':<14}{'fps':>8}{'p50 ms':>9}{'p95 ms':>9}{'mesh %':>8}"
+          f"{'moves':>7}{'clicks':>8}  stages (ms)")
+    for config in args.config or list(CONFIGS):
+        count, elapsed, frame_times, inferences, summary, actuator = run(config, args, frames)
+        ms = [t * 1000 for t in frame_times]
+        stages = " ".join(f"{stage}={value:.1f}" for stage, value in summary["stages_ms"].items())
+        print(f"{config:<14}{count / elapsed:>8.1f}{percentile(ms, 50):>9.2f}{percentile(ms, 95):>9.2f}"
+              f"{inferences / max(count, 1) * 100:>7.0f}%{actuator.count('move_to'):>7}"
+              f"{actuator.count('click'):>8}  {stages}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Face Mesh throughput and added latency per worker count.
+
+Run from class-based-app/:
+    python -m benchmarks.bench_facemesh_pool --video session.mp4 --workers 1 2 4
+"""
+import time
+
+import cv2
+import mediapipe as mp
+
+from benchmarks.common import Timer, base_parser, load_frames, percentile
+from engine.facemesh_pool import FaceMeshPool
+
+FACE_MESH_OPTIONS = dict(
+    max_num_faces=1,
+    refine_landmarks=True,
+    min_detection_confidence=0.5,
+    min_tracking_confidence=0.5
+)
+
+
+def run_serial(rgb_frames):
+    face_mesh = mp.solutions.face_mesh.FaceMesh(**FACE_MESH_OPTIONS)
+    latencies = []
+    with Timer() as timer:
+        for rgb in rgb_frames:
+            start = time.perf_counter()
+            face_mesh.process(rgb)
+            latencies.append(time.perf_counter() - start)
+    face_mesh.close()
+    return len(rgb_frames) / timer.elapsed, latencies
+
+
+def run_pool(rgb_frames, workers):
+    pool = FaceMeshPool(workers, **FACE_MESH_OPTIONS)
+    # Let every worker load its model before timing
+    for rgb in rgb_frames[:workers]:
+        pool.submit(rgb)
+    pool.drain()
+
+    results = []
+    with Timer() as timer:
+        for rgb in rgb_frames:
+            results.extend(pool.submit(rgb))
+            results.extend(pool.collect())
+        results.extend(pool.drain())
+    pool.close()
+
+    timestamps = [r.timestamp for r in results]
+    assert timestamps == sorted(timestamps), "results released out of capture order"
+    return len(rgb_frames) / timer.elapsed, [r.latency for r in results]
+
+
+def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.frames)
+    rgb_frames = [cv2.cvtColor(f, cv2.COLOR_BGR2RGB) for f in frames]
+
+    serial_fps, serial_lat = run_serial(rgb_frames)
+    base_p50 = percentile(serial_lat, 50)
+    print(f"{'mode':<12}{'fps':>8}{'p50 ms':>10}{'p95 ms':>10}{'added ms':>10}")
+    print(f"{'serial':<12}{serial_fps:>8.1f}{base_p50 * 1000:>10.1f}"
+          f"{percentile(serial_lat, 95) * 1000:>10.1f}{0.0:>10.1f}")
+
+    for workers in args.workers:
+        fps, lat = run_pool(rgb_frames, workers)
+        p50 = percentile(lat, 50)
+        print(f"{f'pool x{workers}':<12}{fps:>8.1f}{p50 * 1000:>10.1f}"
+              f"{percentile(lat, 95) * 1000:>10.1f}{(p50 - base_p50) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
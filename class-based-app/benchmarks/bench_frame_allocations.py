@@ -0,0 +1,180 @@
+"""Per-frame allocations on the preview/tracking frame path, via tracemalloc.
+
+Drives the real code: TrackingEngine.read_frame() into a shared-memory
+preview slot, LandmarkDetector.detect() and the gestures through
+TrackingEngine.process(), the tracking overlay, and main.py's preview
+conversion and image update. Compares it with the old allocate-per-step
+path and exits non-zero if the engine path is not flat in steady state, so
+it doubles as a regression check:
+    python -m benchmarks.bench_frame_allocations --frames 300
+
+Face Mesh itself is replaced by a stub returning a fixed face: its tensors
+live in C++ and are not traced anyway. Actions go to a FakeActuator and no
+camera or Tk window is opened, but main.py is imported for its preview
+code, so the app's dependencies must be installed.
+"""
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from benchmarks.common import base_parser, load_frames
+from engine.actuator import FakeActuator
+from engine.buffers import FrameBuffers
+from engine.facemesh_pool import FaceLandmarks, FaceMeshResult, Landmark
+from engine.landmarks import (NOSE_TIP, UPPER_LIP, LOWER_LIP, LEFT_CHEEK, RIGHT_CHEEK, FOREHEAD, CHIN,
+                              LEFT_EYE_TOP, LEFT_EYE_BOTTOM, RIGHT_EYE_TOP, RIGHT_EYE_BOTTOM)
+from engine.overlay import draw_tracking_overlay
+from engine.pipeline import TrackingEngine
+from engine.replay import ReplayCapture
+from engine.shared_frames import SharedFrameRing
+from main import FacialMouseApp
+
+# Anything above this per frame means a full-size array slipped back in
+# (a single 640x480 BGR frame is ~900 KiB)
+MAX_STEADY_STATE_BYTES = 64 * 1024
+
+
+class SyntheticCapture:
+    """Decodes into the caller's buffer the way cv2.VideoCapture.read(image) does"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.index = 0
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        return 30.0 if prop == cv2.CAP_PROP_FPS else 0.0
+
+    def set(self, prop, value):
+        return True
+
+    def release(self):
+        pass
+
+    def read(self, image=None):
+        source = self.frames[self.index % len(self.frames)]
+        self.index += 1
+        if image is None or image.shape != source.shape:
+            return True, source.copy()
+        np.copyto(image, source)
+        return True, image
+
+
+class StubFaceMesh:
+    """A still, front-facing face with the mouth closed, built once"""
+
+    def __init__(self):
+        points = {
+            NOSE_TIP: (0.5, 0.5), UPPER_LIP: (0.5, 0.6), LOWER_LIP: (0.5, 0.605),
+            LEFT_CHEEK: (0.4, 0.55), RIGHT_CHEEK: (0.6, 0.55), FOREHEAD: (0.5, 0.3), CHIN: (0.5, 0.7),
+            LEFT_EYE_TOP: (0.42, 0.44), LEFT_EYE_BOTTOM: (0.42, 0.46),
+            RIGHT_EYE_TOP: (0.58, 0.44), RIGHT_EYE_BOTTOM: (0.58, 0.46),
+        }
+        landmarks = [Landmark(*points.get(i, (0.5, 0.5)), 0.0) for i in range(478)]
+        self.result = FaceMeshResult(None, [FaceLandmarks(landmarks)], 0.0)
+
+    def process(self, rgb_frame):
+        return self.result
+
+    def close(self):
+        pass
+
+
+class NullPhoto:
+    """Stands in for the ImageTk.PhotoImage of the preview label (no Tk here)"""
+
+    def paste(self, image):
+        pass
+
+
+def legacy_path(cap, state):
+    _, frame = cap.read()
+    frame = cv2.flip(frame, 1)
+    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # track_face
+    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # check_mouth_open
+    cv2.putText(frame, "Mouth: closed", (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 1)
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # preview
+    state["image"] = Image.fromarray(rgb)
+
+
+def engine_path(cap, state):
+    # Tracking side, as TrackingService.step does it
+    engine, ring = state["engine"], state["ring"]
+    frame = engine.read_frame(dst=ring.begin_write())
+    result = engine.process(frame)
+    draw_tracking_overlay(frame, result, engine)
+    engine.end_frame()
+    ring.publish()
+    engine.actuator.actions.clear()
+
+    # UI side, as FacialMouseApp.update_camera_preview does it
+    app = state["app"]
+    if ring.read(lambda view: FacialMouseApp.convert_preview(app, view)):
+        FacialMouseApp.show_preview(app, app.preview_rgb)
+
+
+def open_engine_path(cap, frames):
+    engine = TrackingEngine(actuator=FakeActuator(), power_save=False, motion_gate=False)
+    engine.detector.face_mesh.close()
+    engine.detector.face_mesh = StubFaceMesh()
+    engine.attach(cap)
+    shape = frames[0].shape
+    width, height = shape[1], shape[0]
+    app = SimpleNamespace(preview_buffers=FrameBuffers(), preview_rgb=None,
+                          preview_image=Image.new("RGB", (width, height)), preview_photo=NullPhoto())
+    return {"engine": engine, "ring": SharedFrameRing(shape, other_process=False), "app": app}
+
+
+def measure(path, state, cap, count, warmup=40):
+    # Warm-up also covers calibration, so the measured frames run the gestures
+    for _ in range(warmup):
+        path(cap, state)
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    worst_peak = 0
+    for _ in range(count):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        path(cap, state)
+        _, peak = tracemalloc.get_traced_memory()
+        worst_peak = max(worst_peak, peak - before)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return worst_peak, current - baseline
+
+
+def main():
+    args = base_parser(__doc__).parse_args()
+    frames = load_frames(args.video, min(args.frames, 30))
+
+    def capture():
+        return ReplayCapture(args.video, realtime=False, loop=True) if args.video else SyntheticCapture(frames)
+
+    print(f"{'path':<10}{'peak/frame KiB':>16}{'net growth KiB':>16}")
+    peak, growth = measure(legacy_path, {}, capture(), args.frames)
+    print(f"{'legacy':<10}{peak / 1024:>16.1f}{growth / 1024:>16.1f}")
+
+    cap = capture()
+    state = open_engine_path(cap, frames)
+    try:
+        peak, growth = measure(engine_path, state, cap, args.frames)
+    finally:
+        state["engine"].release()
+        state["ring"].close()
+    print(f"{'engine':<10}{peak / 1024:>16.1f}{growth / 1024:>16.1f}")
+
+    if peak > MAX_STEADY_STATE_BYTES or growth > MAX_STEADY_STATE_BYTES:
+        print("FAIL: engine frame path allocates in steady state")
+        sys.exit(1)
+    print("OK: engine frame path is allocation-flat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Head-only pointing vs gaze jump + head fine positioning, Fitts'-law style.
+
+Replays a recorded session through TrackingEngine once per pointer mode, on
+the recording's own clock, and segments each cursor trace into fixations
+(the cursor holding still within --width px for --hold seconds). Every
+fixation is treated as an acquired target of width W at distance D from the
+previous one; the movement time MT is the gap between the two fixations.
+Reports mean MT, index of difficulty ID = log2(D / W + 1) and throughput
+ID / MT (bits/s):
+    python -m benchmarks.bench_gaze_pointer --video session.mp4
+
+Record the session looking at (and then pointing at) targets spread across
+the screen so both modes see the same eye and head movements.
+"""
+from benchmarks.common import base_parser, cursor_trace, percentile, pointing_trials
+from engine.actuator import FakeActuator
+from engine.gaze import GAZE_JUMP
+from engine.pipeline import TrackingEngine
+
+
+def trace(mode, args):
+    """Cursor trace of one pointer mode, plus the number of gaze jumps"""
+    engine = TrackingEngine(actuator=FakeActuator(), pointer_mode=mode, power_save=False,
+                            motion_gate=False)
+    jumps = []
+    points = cursor_trace(engine, args.video, args.frames,
+                          on_result=lambda result: jumps.extend(e for e in result.events if e == GAZE_JUMP))
+    engine.release()
+    return points, len(jumps)
+
+
+def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--width", type=float, default=60, help="Target width in pixels")
+    parser.add_argument("--hold", type=float, default=0.3, help="Seconds still that count as acquired")
+    args = parser.parse_args()
+    if not args.video:
+        raise SystemExit("--video is required: pointing needs a recorded face")
+
+    print(f"{'mode':<8}{'targets':>8}{'jumps':>7}{'mean D':>8}{'ID bits':>9}"
+          f"{'MT ms':>8}{'p95 MT':>8}{'TP bit/s':>10}")
+    for mode in ("head", "gaze"):
+        points, jumps = trace(mode, args)
+        trials = pointing_trials(points, args.width, args.hold)
+        if not trials:
+            print(f"{mode:<8}{0:>8}{jumps:>7}  no targets found")
+            continue
+        times = [trial["time"] * 1000 for trial in trials]
+        throughput = sum(trial["id"] / trial["time"] for trial in trials) / len(trials)
+        print(f"{mode:<8}{len(trials):>8}{jumps:>7}{sum(t['distance'] for t in trials) / len(trials):>8.0f}"
+              f"{sum(t['id'] for t in trials) / len(trials):>9.2f}{sum(times) / len(times):>8.0f}"
+              f"{percentile(times, 95):>8.0f}{throughput:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
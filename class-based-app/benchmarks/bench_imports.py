@@ -0,0 +1,72 @@
+"""Import time of the app's entry modules, from `python -X importtime`.
+
+Each module is imported in a fresh interpreter. Reports the total, the
+slowest top-level packages, and fails (exit code 1) if a module that should
+load lazily shows up, so heavy voice/LLM imports can't creep back into
+startup:
+    python -m benchmarks.bench_imports
+    python -m benchmarks.bench_imports --module main --top 15
+"""
+import argparse
+import subprocess
+import sys
+
+# Imported on first use (listening, the first Gemini request), never at startup
+LAZY = ("speech_recognition", "google.generativeai")
+
+
+def import_times(module):
+    """{module name: cumulative us} for one fresh import, plus the total in us"""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                             capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    times = {}
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        times[name.strip()] = int(cumulative_us)
+        # Nested imports are indented two spaces per level; only count the outermost
+        if not name[1:].startswith(" "):
+            total += int(cumulative_us)
+    return times, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", action="append",
+                        help="Module to import (repeatable, default: main and core.voiceassist)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.module or ["main", "core.voiceassist"]:
+        try:
+            times, total = import_times(module)
+        except RuntimeError as e:
+            print(f"{module}: import failed ({e})")
+            failed = True
+            continue
+
+        print(f"{module}: {total / 1000:.0f} ms")
+        packages = {}
+        for name, cumulative in times.items():
+            if "." not in name:
+                packages[name] = cumulative
+        for name, cumulative in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+        loaded = [name for name in LAZY if name in times]
+        if loaded:
+            print(f"  eagerly imported: {', '.join(loaded)}")
+            failed = True
+        print()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Gemini response time with the response cache: miss, memory hit, disk hit.
+
+    python -m benchmarks.bench_llm_cache --delay 1.2 --phrases 20
+
+Uses the stub model, which sleeps `--delay` seconds per request (a typical
+Gemini round trip), so it needs no API key. Disk hits are timed on a fresh
+cache over the same directory, like the first request after restarting.
+The transcripts are repeated with different spacing to check they hit the
+same entries.
+"""
+import argparse
+import tempfile
+import time
+
+from benchmarks.common import percentile
+from core.llm_cache import ResponseCache
+from core.llm_stub import StubModel
+from core.voiceassist import GRAMMAR_PROMPT, generate_cached
+
+
+def timed(model, cache, texts):
+    timings = []
+    for text in texts:
+        start = time.perf_counter()
+        generate_cached(lambda: model, cache, GRAMMAR_PROMPT, "grammar", text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--delay", type=float, default=1.2, help="Seconds per fake Gemini request")
+    parser.add_argument("--phrases", type=int, default=20, help="Distinct transcripts")
+    args = parser.parse_args()
+
+    texts = [f"this is dictated phrase number {i} for the grammar check" for i in range(args.phrases)]
+    variants = ["  " + text.replace(" ", "  ") + "\n" for text in texts]
+    model = StubModel(first_delay=args.delay, chunk_delay=0.0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(directory)
+        rows = [
+            ("miss", timed(model, cache, texts)),
+            ("memory hit", timed(model, cache, variants)),
+            ("disk hit", timed(model, ResponseCache(directory), texts)),
+        ]
+
+    print(f"{'':<12}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, ms in rows:
+        print(f"{name:<12}{percentile(ms, 50):>10.2f}{percentile(ms, 95):>10.2f}")
+    print(f"\nrequests sent to the model: {model.requests} of {3 * args.phrases}")
+
+
+if __name__ == "__main__":
+    main()
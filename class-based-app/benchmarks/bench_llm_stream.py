@@ -0,0 +1,75 @@
+"""Time to first typed character, waiting for the whole Gemini answer vs streaming it.
+
+    python -m benchmarks.bench_llm_stream --first-delay 0.8 --chunk-delay 0.15 --chars 2000
+
+Uses the stub model (no API key) and a fake target that takes `--char-ms`
+per typed character, so it measures the ordering of generation and typing
+rather than a real window. "blocking" is the old behaviour: generate the
+whole answer, then type it; "streaming" types each chunk as it arrives.
+"""
+import argparse
+import threading
+import time
+from queue import Queue
+
+from core.llm_stub import StubModel
+from core.voiceassist import generate_cached, stream_cached
+
+PROMPT = "{text}"
+
+
+class FakeTarget:
+    def __init__(self, char_ms):
+        self.char_seconds = char_ms / 1000
+        self.first_char_at = None
+        self.typed = 0
+
+    def type(self, text):
+        if text and self.first_char_at is None:
+            self.first_char_at = time.perf_counter()
+        time.sleep(len(text) * self.char_seconds)
+        self.typed += len(text)
+
+
+def blocking(model, target, text):
+    target.type(generate_cached(lambda: model, None, PROMPT, "bench", text))
+
+
+def streaming(model, target, text):
+    # Same producer thread + queue as VoiceTypingAssistant.stream_to_target
+    chunks = Queue()
+
+    def produce():
+        for chunk in stream_cached(lambda: model, None, PROMPT, "bench", text):
+            chunks.put(chunk)
+        chunks.put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while (chunk := chunks.get()) is not None:
+        target.type(chunk)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--first-delay", type=float, default=0.8, help="Seconds to the first chunk")
+    parser.add_argument("--chunk-delay", type=float, default=0.15, help="Seconds between chunks")
+    parser.add_argument("--chunk-chars", type=int, default=120, help="Characters per chunk")
+    parser.add_argument("--chars", type=int, default=2000, help="Length of the answer")
+    parser.add_argument("--char-ms", type=float, default=1.0, help="Typing time per character")
+    args = parser.parse_args()
+
+    text = ("The quick brown fox jumps over the lazy dog. " * (args.chars // 45 + 1))[:args.chars]
+    print(f"{'':<11}{'first char s':>14}{'done s':>9}")
+    for name, deliver in (("blocking", blocking), ("streaming", streaming)):
+        model = StubModel(chunk_chars=args.chunk_chars, first_delay=args.first_delay,
+                          chunk_delay=args.chunk_delay)
+        target = FakeTarget(args.char_ms)
+        start = time.perf_counter()
+        deliver(model, target, text)
+        done = time.perf_counter() - start
+        assert target.typed == len(text)
+        print(f"{name:<11}{target.first_char_at - start:>14.2f}{done:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
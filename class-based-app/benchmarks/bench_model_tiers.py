@@ -0,0 +1,42 @@
+"""Face Mesh cost per model tier.
+
+    python -m benchmarks.bench_model_tiers --video session.mp4
+"""
+import time
+
+import cv2
+import mediapipe as mp
+
+from benchmarks.common import base_parser, load_frames, percentile
+from engine.model_tiers import TIERS, face_mesh_options
+
+
+def run_tier(tier, rgb_frames):
+    face_mesh = mp.solutions.face_mesh.FaceMesh(**face_mesh_options(tier))
+    face_mesh.process(rgb_frames[0])  # model load / first-call setup
+    latencies = []
+    found = 0
+    for rgb in rgb_frames:
+        start = time.perf_counter()
+        results = face_mesh.process(rgb)
+        latencies.append(time.perf_counter() - start)
+        found += bool(results.multi_face_landmarks)
+    face_mesh.close()
+    return latencies, found
+
+
+def main():
+    args = base_parser(__doc__).parse_args()
+    frames = load_frames(args.video, args.frames)
+    rgb_frames = [cv2.cvtColor(f, cv2.COLOR_BGR2RGB) for f in frames]
+
+    print(f"{'tier':<12}{'landmarks':>10}{'p50 ms':>9}{'p95 ms':>9}{'fps':>8}{'faces':>8}")
+    for tier in TIERS:
+        latencies, found = run_tier(tier, rgb_frames)
+        mean = sum(latencies) / len(latencies)
+        print(f"{tier.name:<12}{tier.landmark_count:>10}{percentile(latencies, 50) * 1000:>9.1f}"
+              f"{percentile(latencies, 95) * 1000:>9.1f}{1 / mean:>8.1f}{found:>8}")
+
+
+if __name__ == "__main__":
+    main()
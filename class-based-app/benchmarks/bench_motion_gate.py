@@ -0,0 +1,36 @@
+"""Fraction of Face Mesh inferences the motion gate skips on recorded sessions.
+
+Each session is replayed twice (gate on / off, power saving off in both) and
+the mouth-open clicks are compared, so a gate that misses clicks shows up:
+    python -m benchmarks.bench_motion_gate --video reading.mp4 --video typing.mp4
+"""
+import argparse
+
+from benchmarks.common import replay_session
+from engine.actuator import FakeActuator
+from engine.pipeline import TrackingEngine
+
+
+def replay(path, gate, max_frames):
+    engine = TrackingEngine(actuator=FakeActuator(), power_save=False, motion_gate=gate)
+    frames = replay_session(engine, path, max_frames)
+    engine.release()
+    return engine.detector.motion_gate, engine.actuator.count("click"), frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--video", action="append", required=True, help="Recorded session (repeatable)")
+    parser.add_argument("--frames", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'session':<30}{'frames':>8}{'skipped':>9}{'clicks on':>11}{'clicks off':>12}")
+    for path in args.video:
+        gate, clicks_on, frames = replay(path, True, args.frames)
+        _, clicks_off, _ = replay(path, False, args.frames)
+        print(f"{path[-30:]:<30}{frames:>8}{gate.skip_rate() * 100:>8.1f}%"
+              f"{clicks_on:>11}{clicks_off:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Motion-to-photon latency on a replayed session, with a fake actuator.
+
+Runs headless (no display, no real mouse) so it works in CI on Linux:
+    python -m benchmarks.bench_motion_to_photon --video session.mp4 --app both
+
+For live numbers set LIBERATE_LATENCY_REPORT=1 and run either app normally;
+the report is printed on exit.
+"""
+import os
+import sys
+
+from benchmarks.common import base_parser, replay_session
+from engine.actuator import FakeActuator
+from engine.latency import LatencyRecorder
+from engine.pipeline import TrackingEngine
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend-software")
+
+
+def replay(engine, args):
+    # Cursor moves land on the FakeActuator synchronously, not via the predictor thread
+    engine.cursor_predictor = None
+    recorder = LatencyRecorder()
+    engine.latency = recorder
+    replay_session(engine, args.video, args.frames, realtime=args.realtime)
+    dropped = engine.cap.dropped
+    engine.release()
+    return recorder, engine.actuator, dropped
+
+
+def replay_app(args):
+    """FacialMouseApp's engine configuration"""
+    return replay(TrackingEngine(actuator=FakeActuator(), safe_margin=15), args)
+
+
+def replay_controller(args):
+    """FacialMouseController's engine configuration, with every window disabled"""
+    sys.path.insert(0, BACKEND_DIR)
+    from facialcontrol import FacialMouseController
+
+    controller = FacialMouseController(headless=True, actuator=FakeActuator())
+    return replay(controller.engine, args)
+
+
+def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--app", choices=["app", "controller", "both"], default="both")
+    parser.add_argument("--no-realtime", dest="realtime", action="store_false",
+                        help="Feed frames as fast as possible instead of at the recorded rate")
+    args = parser.parse_args()
+    if not args.video:
+        parser.error("--video is required: synthetic frames contain no face to track")
+
+    runs = []
+    if args.app in ("app", "both"):
+        runs.append(("FacialMouseApp", replay_app))
+    if args.app in ("controller", "both"):
+        runs.append(("FacialMouseController", replay_controller))
+
+    for name, run in runs:
+        recorder, actuator, dropped = run(args)
+        print(recorder.format_report(f"{name} motion-to-photon latency"))
+        print(f"moves={actuator.count('move_to')} clicks={actuator.count('click')} "
+              f"dropped frames={dropped}\n")
+
+
+if __name__ == "__main__":
+    main()
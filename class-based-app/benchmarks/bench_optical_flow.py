@@ -0,0 +1,51 @@
+"""Hybrid Face Mesh + optical flow vs Face Mesh on every frame.
+
+Replays each session through both modes and reports the share of frames that
+needed a Face Mesh keyframe, time per frame, how far the flow cursor strays
+from the full-inference cursor, and clicks detected in each mode:
+    python -m benchmarks.bench_optical_flow --video session.mp4
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.common import replay_session
+from engine.actuator import FakeActuator
+from engine.pipeline import TrackingEngine
+
+
+def replay(path, optical_flow, max_frames):
+    engine = TrackingEngine(actuator=FakeActuator(), power_save=False, motion_gate=False,
+                            optical_flow=optical_flow)
+    cursor = []
+    start = time.perf_counter()
+    frames = replay_session(engine, path, max_frames,
+                            on_frame=lambda frame, result: cursor.append(result.cursor))
+    busy = time.perf_counter() - start
+    engine.release()
+    return engine.detector.flow, cursor, engine.actuator.count("click"), busy / max(frames, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--video", action="append", required=True, help="Recorded session (repeatable)")
+    parser.add_argument("--frames", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'session':<24}{'keyframes':>10}{'ms/frame':>10}{'mesh ms':>9}"
+          f"{'err px':>8}{'max px':>8}{'clicks':>8}{'mesh':>6}")
+    for path in args.video:
+        flow, flow_cursor, flow_clicks, flow_ms = replay(path, True, args.frames)
+        _, mesh_cursor, mesh_clicks, mesh_ms = replay(path, False, args.frames)
+
+        errors = [np.hypot(a[0] - b[0], a[1] - b[1])
+                  for a, b in zip(flow_cursor, mesh_cursor) if a and b]
+        mean_err = float(np.mean(errors)) if errors else 0.0
+        max_err = float(np.max(errors)) if errors else 0.0
+        print(f"{path[-24:]:<24}{flow.keyframe_rate() * 100:>9.1f}%{flow_ms * 1000:>10.1f}"
+              f"{mesh_ms * 1000:>9.1f}{mean_err:>8.1f}{max_err:>8.1f}{flow_clicks:>8}{mesh_clicks:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Per-phrase latency of each speech recognition backend on the same WAV files.
+
+    python -m benchmarks.bench_recognizers --wav fixtures/ --backend stub --backend local
+
+--wav takes files or directories of .wav files (mono PCM). Without it, a
+few synthetic tone phrases are generated: enough to time the stub and the
+model/network overhead, though real backends will not find words in them.
+The first phrase of each backend is reported separately as "cold" (model
+load, connection setup).
+"""
+import argparse
+import math
+import os
+import struct
+import tempfile
+import time
+import wave
+
+from benchmarks.common import percentile
+from core.recognizers import BACKENDS, create_recognizer
+
+
+def synthetic_wavs(directory, seconds=(1.0, 2.0, 3.0), rate=16000):
+    paths = []
+    for index, length in enumerate(seconds):
+        path = os.path.join(directory, f"tone_{index}.wav")
+        samples = (int(8000 * math.sin(2 * math.pi * 220 * i / rate)) for i in range(int(length * rate)))
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(rate)
+            f.writeframes(b"".join(struct.pack("<h", s) for s in samples))
+        paths.append(path)
+    return paths
+
+
+def wav_paths(inputs):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(os.path.join(item, name) for name in os.listdir(item) if name.endswith(".wav")))
+        else:
+            paths.append(item)
+    return paths
+
+
+def load_audio(recognizer, paths):
+    import speech_recognition as sr
+
+    phrases = []
+    for path in paths:
+        with sr.AudioFile(path) as source:
+            phrases.append((os.path.basename(path), recognizer.record(source)))
+    return phrases
+
+
+def run(backend, phrases, repeat):
+    timings, errors, sample = [], 0, None
+    for _ in range(repeat):
+        for _, audio in phrases:
+            start = time.perf_counter()
+            try:
+                text = backend.recognize(audio)
+                sample = sample or text
+            except Exception:
+                errors += 1
+            timings.append(time.perf_counter() - start)
+    return timings, errors, sample
+
+
+def main():
+    import speech_recognition as sr
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wav", action="append", help="WAV file or directory (repeatable)")
+    parser.add_argument("--backend", action="append", choices=BACKENDS,
+                        help="Backend to time (repeatable, default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the phrases")
+    args = parser.parse_args()
+
+    recognizer = sr.Recognizer()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = wav_paths(args.wav) if args.wav else synthetic_wavs(directory)
+        phrases = load_audio(recognizer, paths)
+    print(f"{len(phrases)} phrases, {args.repeat} passes\n")
+
+    print(f"{'backend':<13}{'cold ms':>9}{'p50 ms':>9}{'p95 ms':>9}{'errors':>8}  first transcript")
+    for name in args.backend or BACKENDS:
+        backend = create_recognizer(name, recognizer)
+        timings, errors, sample = run(backend, phrases, args.repeat)
+        ms = [t * 1000 for t in timings[1:]] or [timings[0] * 1000]
+        print(f"{name:<13}{timings[0] * 1000:>9.0f}{percentile(ms, 50):>9.0f}{percentile(ms, 95):>9.0f}"
+              f"{errors:>8}  {(sample or '-')[:40]}")
+
+
+if __name__ == "__main__":
+    main()
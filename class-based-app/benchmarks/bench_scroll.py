@@ -0,0 +1,86 @@
+"""Continuous scroll engine vs the old fixed 30-unit steps every 0.15 s.
+
+Simulates holding scroll mode at a constant deflection (virtual time, no
+camera needed) and reports how long a document of --distance wheel units
+takes, plus step sizes (smaller, more frequent steps = smoother motion).
+Exits non-zero if continuous scrolling is slower than the fixed steps at
+any of the deflections, so it doubles as a regression check on the tuning:
+    python -m benchmarks.bench_scroll --distance 20000
+"""
+import argparse
+import sys
+
+from engine.actuator import FakeActuator
+from engine.gestures import ScrollGesture
+from engine.scroller import ScrollEngine
+
+FRAME_RATE = 30
+TICK_RATE = 60
+LIMIT = 600.0   # seconds of simulated time before giving up
+
+
+def legacy(deflection, distance):
+    """Old behaviour: any gaze outside the neutral band scrolls 30 units per 0.15 s"""
+    steps = []
+    last = 0.0
+    now = 0.0
+    while len(steps) * 30 < distance and now < LIMIT:
+        now += 1.0 / FRAME_RATE
+        if abs(deflection) > 0 and now - last > 0.15:
+            last = now
+            steps.append(30)
+    return now, steps
+
+
+def continuous(deflection, distance):
+    """ScrollEngine ticking at TICK_RATE, velocity refreshed every frame"""
+    actuator = FakeActuator()
+    gesture = ScrollGesture()
+    scroller = ScrollEngine(actuator, rate_hz=TICK_RATE)
+    velocity = gesture.velocity(deflection)
+    steps = []
+    scrolled = 0
+    now = 0.0
+    next_frame = 0.0
+    while scrolled < distance and now < LIMIT:
+        if now >= next_frame:
+            scroller.update(velocity, now=now)     # not running: steps inline
+            next_frame += 1.0 / FRAME_RATE
+        else:
+            scroller.step(now)
+        for _, name, call in actuator.actions:
+            steps.append(call[0])
+            scrolled += call[0]
+        actuator.actions.clear()
+        now += 1.0 / TICK_RATE
+    return now, steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--distance", type=int, default=20000, help="Document length in wheel units")
+    args = parser.parse_args()
+
+    slower = []
+    print(f"{'deflection':<12}{'mode':<12}{'seconds':>9}{'steps/s':>9}{'mean step':>11}{'max step':>10}")
+    for deflection in (0.25, 0.5, 0.75, 1.0):
+        times = {}
+        for mode, run in (("fixed", legacy), ("continuous", continuous)):
+            seconds, steps = run(deflection, args.distance)
+            times[mode] = seconds if steps else float("inf")
+            if not steps:
+                print(f"{deflection:<12}{mode:<12}{'never':>9}")
+                continue
+            print(f"{deflection:<12}{mode:<12}{seconds:>9.1f}{len(steps) / seconds:>9.1f}"
+                  f"{sum(steps) / len(steps):>11.1f}{max(steps):>10}")
+        if times["continuous"] > times["fixed"]:
+            slower.append(deflection)
+
+    if slower:
+        print(f"FAIL: continuous scrolling is slower than the fixed steps at deflection {slower}")
+        sys.exit(1)
+    print("OK: continuous scrolling is at least as fast as the fixed steps")
+
+
+if __name__ == "__main__":
+    main()
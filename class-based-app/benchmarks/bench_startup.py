@@ -0,0 +1,104 @@
+"""Time from launch to the first tracked frame, sequential vs parallel startup.
+
+Each run is a fresh Python process (so imports and model loading are paid
+every time) that times, from process start, until Face Mesh has run on a
+real camera frame:
+    sequential  UI build, then Face Mesh load, then camera open (the old order)
+    parallel    camera opens and Face Mesh loads + warms up in the background
+                while the UI builds
+
+The UI build is simulated by sleeping --ui-seconds on the main thread:
+    python -m benchmarks.bench_startup --ui-seconds 1.5 --runs 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+START = time.perf_counter()
+MODES = ("sequential", "parallel")
+
+
+def first_tracked_frame(engine):
+    """Read frames until one goes through Face Mesh; returns that frame's inference time"""
+    from engine.metrics import METRICS
+
+    for _ in range(100):
+        frame = engine.read_frame()
+        if frame is None:
+            continue
+        processed = METRICS.frames_processed.value
+        inference_start = time.perf_counter()
+        engine.process(frame, actions=False)
+        engine.end_frame()
+        if METRICS.frames_processed.value > processed:
+            return time.perf_counter() - inference_start
+    raise SystemExit("No frame reached Face Mesh")
+
+
+def child(mode, device, ui_seconds):
+    from engine.actuator import FakeActuator
+    from engine.startup import start_engine
+
+    options = dict(actuator=FakeActuator(), power_save=False, motion_gate=False)
+    timings = {}
+    if mode == "sequential":
+        from engine.pipeline import TrackingEngine
+
+        time.sleep(ui_seconds)
+        step = time.perf_counter()
+        engine = TrackingEngine(**options)
+        timings["model"] = time.perf_counter() - step
+        step = time.perf_counter()
+        engine.open_camera(device)
+        timings["camera"] = time.perf_counter() - step
+    else:
+        started = {}
+        worker = threading.Thread(target=lambda: started.update(result=start_engine(options, device)))
+        worker.start()
+        time.sleep(ui_seconds)
+        worker.join()
+        engine, timings = started["result"]
+
+    if not engine.cap.isOpened():
+        raise SystemExit("Could not open webcam")
+    timings["first_inference"] = first_tracked_frame(engine)
+    timings["first_frame"] = time.perf_counter() - START
+    engine.release()
+    print(json.dumps(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--device", type=int, default=0, help="Camera index")
+    parser.add_argument("--ui-seconds", type=float, default=1.0, help="Simulated UI build time")
+    parser.add_argument("--runs", type=int, default=3, help="Launches per mode")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.device, args.ui_seconds)
+        return
+
+    print(f"{'mode':<12}{'first frame s':>15}{'model s':>9}{'warm-up s':>11}{'camera s':>10}{'1st infer ms':>14}")
+    for mode in MODES:
+        runs = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_startup", "--child", mode,
+                 "--device", str(args.device), "--ui-seconds", str(args.ui_seconds)],
+                capture_output=True, text=True, cwd=os.getcwd(), check=True
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+
+        def mean(key):
+            return sum(run.get(key, 0.0) for run in runs) / len(runs)
+
+        print(f"{mode:<12}{mean('first_frame'):>15.2f}{mean('model'):>9.2f}{mean('warm_up'):>11.2f}"
+              f"{mean('camera'):>10.2f}{mean('first_inference') * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
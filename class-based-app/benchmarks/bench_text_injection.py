@@ -0,0 +1,65 @@
+"""Characters per second of each text injection strategy, typed into a real window.
+
+    python -m benchmarks.bench_text_injection --target vscode --chars 2000
+
+Needs a desktop session: after the countdown, each strategy types the same
+snippet into whatever has focus (open an empty editor or document first),
+one after another. Move the mouse into a screen corner to abort. Only the
+chosen strategy runs, without falling back, so a missing clipboard shows up
+as an error instead of being hidden.
+"""
+import argparse
+import time
+
+from core.injection import STRATEGIES, TARGETS, create_injector
+
+SNIPPET = '''def moving_average(values, window=5):
+    """Mean of each run of `window` values"""
+    total = sum(values[:window])
+    averages = [total / window]
+    for i in range(window, len(values)):
+        total += values[i] - values[i - window]
+        averages.append(total / window)
+    return averages
+
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", choices=sorted(TARGETS), default="vscode",
+                        help="Target whose typing settings the char strategy uses")
+    parser.add_argument("--strategy", action="append", choices=STRATEGIES,
+                        help="Strategy to time (repeatable, default: all)")
+    parser.add_argument("--chars", type=int, default=2000, help="Characters per strategy")
+    parser.add_argument("--countdown", type=float, default=5.0, help="Seconds to focus the target window")
+    args = parser.parse_args()
+
+    text = (SNIPPET * (args.chars // len(SNIPPET) + 1))[:args.chars]
+    print(f"Focus an empty {args.target} window; typing starts in {args.countdown:.0f} s")
+    time.sleep(args.countdown)
+
+    results = []
+    for name in args.strategy or STRATEGIES:
+        injector = create_injector(name, args.target)
+        start = time.perf_counter()
+        try:
+            if hasattr(injector, "begin"):
+                injector.begin()
+            injector.inject(text + "\n")
+            seconds = time.perf_counter() - start
+            if hasattr(injector, "end"):
+                injector.end()
+            results.append((name, f"{seconds:>9.2f}{args.chars / seconds:>10.0f}"))
+        except Exception as e:
+            if type(e).__name__ == "FailSafeException":
+                raise
+            results.append((name, f"  failed: {e}"))
+
+    print(f"\n{'strategy':<11}{'seconds':>9}{'chars/s':>10}")
+    for name, row in results:
+        print(f"{name:<11}{row}")
+
+
+if __name__ == "__main__":
+    main()
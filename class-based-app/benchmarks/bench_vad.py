@@ -0,0 +1,155 @@
+"""Phrase segmentation: streaming VAD vs speech_recognition's listen().
+
+Feeds the same audio to both, the way the microphone would deliver it, and
+reports per phrase how long after the speech ended the phrase was handed to
+recognition, plus how many phrase boundaries fell inside a word:
+    python -m benchmarks.bench_vad
+    python -m benchmarks.bench_vad --wav dictation.wav
+
+The default audio is synthetic (voiced bursts as words, short gaps between
+words, longer pauses between phrases and one long run-on utterance) with
+known word boundaries. A --wav file has no ground truth, so only the
+emission times and phrase lengths are listed.
+"""
+import argparse
+import os
+import tempfile
+import wave
+
+import numpy as np
+
+from benchmarks.common import percentile
+from core.vad import StreamingVAD
+
+RATE = 16000
+CHUNK = 1024      # samples per microphone read, as sr.Microphone
+
+
+def synthetic_dictation(seed=0):
+    """(int16 samples, [(start, end)] word spans in seconds)"""
+    rng = np.random.default_rng(seed)
+    parts, words, position = [], [], 0.0
+
+    def add(seconds, word):
+        nonlocal position
+        t = np.arange(int(seconds * RATE)) / RATE
+        noise = rng.normal(0, 60, len(t))
+        if word:
+            pitch = rng.uniform(110, 220)
+            envelope = 0.6 + 0.4 * np.sin(2 * np.pi * rng.uniform(3, 6) * t)
+            noise += np.sin(2 * np.pi * pitch * t) * 3000 * envelope
+            words.append((position, position + seconds))
+        parts.append(noise)
+        position += seconds
+
+    add(1.0, False)
+    for phrase_words in (3, 5, 2, 4):
+        for _ in range(phrase_words):
+            add(rng.uniform(0.25, 0.6), True)
+            add(rng.uniform(0.08, 0.18), False)
+        add(rng.uniform(0.6, 1.2), False)
+    for _ in range(30):          # ~12 s without a long pause
+        add(rng.uniform(0.25, 0.5), True)
+        add(rng.uniform(0.08, 0.16), False)
+    add(1.0, False)
+    return np.clip(np.concatenate(parts), -32768, 32767).astype(np.int16), words
+
+
+def run_vad(samples):
+    """[(emitted at, start, end)] in stream seconds"""
+    vad = StreamingVAD(sample_rate=RATE)
+    phrases = []
+    for offset in range(0, len(samples), CHUNK):
+        vad.feed(samples[offset:offset + CHUNK].tobytes())
+        now = min(offset + CHUNK, len(samples)) / RATE
+        phrases.extend((now, start, end) for start, end in vad.spans)
+    vad.flush()
+    phrases.extend((len(samples) / RATE, start, end) for start, end in vad.spans)
+    return phrases
+
+
+def run_listen(path):
+    """speech_recognition's listen() as the app used it (1 s noise adjust, timeout=1, limit 5 s)"""
+    import speech_recognition as sr
+
+    recognizer = sr.Recognizer()
+    phrases = []
+    with sr.AudioFile(path) as source:
+        stream = source.stream
+        consumed = [0]
+
+        class CountingStream:
+            def read(self, size=-1):
+                data = stream.read(size)
+                consumed[0] += len(data) // 2
+                return data
+
+        source.stream = CountingStream()
+        recognizer.adjust_for_ambient_noise(source, duration=1)
+        while consumed[0] < source.DURATION * RATE:
+            try:
+                audio = recognizer.listen(source, timeout=1, phrase_time_limit=5)
+            except sr.WaitTimeoutError:
+                continue
+            now = consumed[0] / RATE
+            length = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+            phrases.append((now, now - length, now))
+            if not audio.frame_data:
+                break
+    return phrases
+
+
+def score(phrases, words):
+    """Lag after the last word of each phrase, and boundaries that cut a word"""
+    lags, cuts = [], 0
+    for emitted, start, end in phrases:
+        inside = [w for w in words if w[0] < end and w[1] > start]
+        if inside:
+            lags.append(emitted - max(min(w[1], end) for w in inside))
+        cuts += sum(1 for w in words if w[0] + 0.03 < end < w[1] - 0.03)
+        cuts += sum(1 for w in words if w[0] + 0.03 < start < w[1] - 0.03)
+    return lags, cuts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wav", help="16 kHz mono 16-bit recording to segment instead of synthetic audio")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.wav:
+            with wave.open(args.wav) as f:
+                samples = np.frombuffer(f.readframes(f.getnframes()), dtype=np.int16)
+            path, words = args.wav, None
+        else:
+            samples, words = synthetic_dictation()
+            path = os.path.join(directory, "dictation.wav")
+            with wave.open(path, "wb") as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(RATE)
+                f.writeframes(samples.tobytes())
+
+        results = [("vad", run_vad(samples))]
+        try:
+            results.append(("listen", run_listen(path)))
+        except ImportError:
+            print("speech_recognition not installed; timing the VAD only")
+
+    print(f"{len(samples) / RATE:.1f} s of audio\n")
+    if words is None:
+        for name, phrases in results:
+            print(f"{name}: {len(phrases)} phrases")
+            for emitted, start, end in phrases:
+                print(f"  {start:6.2f}-{end:6.2f} s, sent at {emitted:6.2f} s")
+        return
+
+    print(f"{'segmenter':<11}{'phrases':>8}{'lag p50 ms':>12}{'lag p95 ms':>12}{'words cut':>11}")
+    for name, phrases in results:
+        lags, cuts = score(phrases, words)
+        ms = [lag * 1000 for lag in lags]
+        print(f"{name:<11}{len(phrases):>8}{percentile(ms, 50):>12.0f}{percentile(ms, 95):>12.0f}{cuts:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import math
+import time
+
+import cv2
+import numpy as np
+
+
+def load_frames(video_path=None, count=300, width=640, height=480):
+    """Load BGR frames from a recorded video, or synthesize noise frames"""
+    frames = []
+    if video_path:
+        cap = cv2.VideoCapture(video_path)
+        while len(frames) < count:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(cv2.flip(frame, 1))
+        cap.release()
+        if not frames:
+            raise SystemExit(f"Could not read any frames from {video_path}")
+        return frames
+
+    rng = np.random.default_rng(0)
+    for _ in range(count):
+        frames.append(rng.integers(0, 255, (height, width, 3), dtype=np.uint8))
+    return frames
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    return float(np.percentile(values, pct))
+
+
+def base_parser(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--video", help="Recorded session to replay (default: synthetic frames)")
+    parser.add_argument("--frames", type=int, default=300, help="Number of frames to run")
+    return parser
+
+
+class Timer:
+    """Context manager that records elapsed wall time in seconds"""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
+
+
+def replay_session(engine, path, max_frames=100000, realtime=False, on_frame=None):
+    """Drive a TrackingEngine over a recorded session the way a front end does.
+
+    on_frame(frame, result) runs after each process(); returns the frame count.
+    """
+    from engine.replay import ReplayCapture
+
+    engine.attach(ReplayCapture(path, realtime=realtime))
+    frames = 0
+    while frames < max_frames:
+        frame = engine.read_frame()
+        if frame is None:
+            break
+        result = engine.process(frame)
+        if on_frame:
+            on_frame(frame, result)
+        engine.end_frame()
+        frames += 1
+    return frames
+
+
+def cursor_trace(engine, path, max_frames=100000, on_result=None):
+    """Replay a session on the recording's own clock; returns [(t, x, y)] cursor targets.
+
+    on_result(result) runs after each process(), e.g. to count events.
+    """
+    from engine.replay import ReplayCapture
+
+    cap = ReplayCapture(path, realtime=False)
+    engine.attach(cap)
+    points = []
+    while cap.frame_index < max_frames:
+        frame = engine.read_frame()
+        if frame is None:
+            break
+        now = cap.frame_index / cap.fps
+        result = engine.process(frame, now=now)
+        if result.cursor is not None:
+            points.append((now,) + tuple(result.cursor))
+        if on_result:
+            on_result(result)
+        engine.end_frame()
+    return points
+
+
+def fixations(points, width, hold):
+    """[(start, end, x, y)] runs where the cursor stays within width/2 of where it settled"""
+    found = []
+    i = 0
+    while i < len(points):
+        t0, x0, y0 = points[i]
+        j = i
+        while j + 1 < len(points) and math.hypot(points[j + 1][1] - x0, points[j + 1][2] - y0) <= width / 2:
+            j += 1
+        if points[j][0] - t0 >= hold:
+            found.append((t0, points[j][0], x0, y0))
+            i = j + 1
+        else:
+            i += 1
+    return found
+
+
+def pointing_trials(points, width, hold):
+    """Fitts'-style trials between consecutive fixations of a cursor trace.
+
+    Each fixation is an acquired target of the given width. Returns dicts with
+    the movement time, distance, index of difficulty log2(D / W + 1) and the
+    overshoot: how far (px) the cursor went past the target along the
+    direction of the movement before settling.
+    """
+    fixes = fixations(points, width, hold)
+    trials = []
+    for previous, current in zip(fixes, fixes[1:]):
+        dx, dy = current[2] - previous[2], current[3] - previous[3]
+        distance = math.hypot(dx, dy)
+        movement_time = current[0] - previous[1]
+        if distance < width or movement_time <= 0:
+            continue
+        # Projection of every point of the movement onto the movement direction
+        ux, uy = dx / distance, dy / distance
+        travel = [(x - previous[2]) * ux + (y - previous[3]) * uy
+                  for t, x, y in points if previous[1] < t <= current[0]]
+        trials.append({
+            "time": movement_time,
+            "distance": distance,
+            "id": math.log2(distance / width + 1),
+            "overshoot": max(0.0, max(travel, default=distance) - distance),
+        })
+    return trials
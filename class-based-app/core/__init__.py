@@ -1,3 +1,10 @@
-from .voiceassist import VoiceAssistantCore
+__all__ = ["VoiceAssistantCore"]
 
-__all__ = ["VoiceAssistantCore"]
\ No newline at end of file
+
+def __getattr__(name):
+    # The voice stack pulls in Gemini, speech_recognition and pyautogui, so only
+    # load it when asked for; headless tracking only needs the engine package
+    if name == "VoiceAssistantCore":
+        from .voiceassist import VoiceAssistantCore
+        return VoiceAssistantCore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,215 @@
+import logging
+import os
+import sys
+import time
+
+from engine.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Ways of getting text into another app, fastest first. pyautogui (and
+# pyperclip, which it installs) are imported on first use like in voiceassist.
+STRATEGIES = ("clipboard", "bulk", "char")
+
+# Strategy order and per-character typing settings for each target app.
+# Pasting also stops VS Code from auto-indenting every typed line a second time.
+TARGETS = {
+    "docs": {"strategies": ("clipboard", "bulk", "char"), "char_interval": 0.02, "line_delay": 0.0},
+    "vscode": {"strategies": ("clipboard", "bulk", "char"), "char_interval": 0.05, "line_delay": 0.1},
+}
+
+
+def untypeable(text):
+    """Characters pyautogui.write() would silently skip: it only presses keys it has names for"""
+    import pyautogui
+
+    return sorted(set(text).difference(pyautogui.KEYBOARD_KEYS))
+
+
+def check_typeable(text):
+    missing = untypeable(text)
+    if missing:
+        raise ValueError(f"Can't type {''.join(missing)!r} as key presses")
+
+
+class ClipboardInjector:
+    """Pastes each piece of text at once.
+
+    The target reads the clipboard asynchronously after the synthesized
+    Ctrl/Cmd+V (a browser tab can take a few hundred ms), so every paste
+    waits `settle` seconds before the clipboard may change again. The
+    user's clipboard is saved by begin() and put back once by end(), after
+    the last paste. pyperclip only sees text: an empty or non-text clipboard
+    (an image, files) reads as "" and is left as the last pasted text rather
+    than wiped. Fails (so the next strategy takes over) when there is no
+    clipboard, e.g. Linux without xclip/xsel; a paste that lands wrong in
+    the target can't be detected.
+    """
+
+    name = "clipboard"
+
+    def __init__(self, settle=0.3, restore=True):
+        self.settle = settle
+        self.restore = restore
+        self.saved = None
+
+    def begin(self):
+        import pyperclip
+
+        self.saved = pyperclip.paste() if self.restore else None
+
+    def inject(self, text):
+        import pyautogui
+        import pyperclip
+
+        pyperclip.copy(text)
+        pyautogui.hotkey("command" if sys.platform == "darwin" else "ctrl", "v")
+        time.sleep(self.settle)
+
+    def end(self):
+        import pyperclip
+
+        if self.saved:
+            pyperclip.copy(self.saved)
+        self.saved = None
+
+
+class BulkInjector:
+    """Types key by key with no delay between keys, in blocks so the failsafe stays responsive.
+
+    Only keyboard keys can be typed: text with anything else (accents,
+    curly quotes, emoji) raises ValueError before a key is pressed.
+    """
+
+    name = "bulk"
+
+    def __init__(self, block=500):
+        self.block = block
+
+    def inject(self, text):
+        import pyautogui
+
+        check_typeable(text)
+        for i in range(0, len(text), self.block):
+            pyautogui.write(text[i:i + self.block])
+
+
+class CharInjector:
+    """The original typing: a pause after every key and after every line (keyboard keys only, like bulk)"""
+
+    name = "char"
+
+    def __init__(self, interval=0.05, line_delay=0.1, block=200, block_delay=0.1):
+        self.interval = interval
+        self.line_delay = line_delay
+        self.block = block
+        self.block_delay = block_delay
+
+    def inject(self, text):
+        import pyautogui
+
+        check_typeable(text)
+        for index, line in enumerate(text.split("\n")):
+            if index:
+                pyautogui.press("enter")
+                time.sleep(self.line_delay)
+            for i in range(0, len(line), self.block):
+                pyautogui.write(line[i:i + self.block], interval=self.interval)
+                if i + self.block < len(line):
+                    time.sleep(self.block_delay)
+
+
+def create_injector(name, target):
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown text injection strategy: {name}")
+    if name == "clipboard":
+        return ClipboardInjector()
+    if name == "bulk":
+        return BulkInjector()
+    settings = TARGETS[target]
+    return CharInjector(interval=settings["char_interval"], line_delay=settings["line_delay"])
+
+
+class TextInjector:
+    """Sends text to a target app with the fastest strategy that works there.
+
+    Strategies are tried in the target's order; one that raises is dropped
+    for the rest of the session and the same text goes to the next. A
+    ValueError only means that strategy can't produce this text (typing
+    strategies and non-keyboard characters), so the next one takes it
+    without dropping the first. Moving the mouse into a screen corner
+    (pyautogui's failsafe) still aborts.
+    Characters and seconds are kept per strategy for throughput().
+
+    Wrap the pieces of one answer in begin()/end() so the clipboard is saved
+    and restored once, not between pieces.
+    """
+
+    def __init__(self, target, strategy=None):
+        if target not in TARGETS:
+            raise ValueError(f"Unknown text injection target: {target}")
+        order = TARGETS[target]["strategies"]
+        if strategy is not None:
+            # A forced strategy goes first; the others stay behind it as fallbacks
+            order = (strategy,) + tuple(name for name in order if name != strategy)
+        self.target = target
+        self.strategies = [create_injector(name, target) for name in order]
+        self.stats = {}     # strategy name -> [characters, seconds]
+
+    @property
+    def strategy(self):
+        return self.strategies[0].name if self.strategies else None
+
+    def begin(self):
+        for injector in list(self.strategies):
+            if hasattr(injector, "begin"):
+                try:
+                    injector.begin()
+                except Exception as e:
+                    logger.warning(f"{injector.name} text injection unavailable ({e}), falling back")
+                    self.strategies.remove(injector)
+
+    def end(self):
+        for injector in self.strategies:
+            if hasattr(injector, "end"):
+                try:
+                    injector.end()
+                except Exception as e:
+                    logger.warning(f"Could not finish {injector.name} text injection ({e})")
+
+    def inject(self, text):
+        """Type or paste text; returns the name of the strategy that did it"""
+        import pyautogui
+
+        if not text:
+            return self.strategy
+        for injector in list(self.strategies):
+            start = time.perf_counter()
+            try:
+                injector.inject(text)
+            except pyautogui.FailSafeException:
+                raise
+            except ValueError as e:
+                logger.warning(f"{injector.name} text injection skipped ({e}), falling back")
+                continue
+            except Exception as e:
+                logger.warning(f"{injector.name} text injection failed ({e}), falling back")
+                self.strategies.remove(injector)
+                continue
+            seconds = time.perf_counter() - start
+            chars, total = self.stats.get(injector.name, (0, 0.0))
+            self.stats[injector.name] = [chars + len(text), total + seconds]
+            METRICS.voice_chars_injected.inc(len(text))
+            METRICS.voice_injection_seconds.observe(seconds)
+            return injector.name
+        raise RuntimeError(f"No text injection strategy can send this text to {self.target}")
+
+    def throughput(self):
+        """{strategy name: characters per second} over everything injected so far"""
+        return {name: chars / seconds if seconds else float("inf")
+                for name, (chars, seconds) in self.stats.items()}
+
+
+def text_injector_from_env(target):
+    # LIBERATE_TEXT_INJECTION: clipboard, bulk or char puts that strategy first
+    return TextInjector(target, strategy=os.getenv("LIBERATE_TEXT_INJECTION") or None)
@@ -5,6 +5,7 @@ import threading
 import win32gui
 from pynput import keyboard
 from ctypes import windll
+from engine.metrics import METRICS
 
 # High DPI awareness
 windll.shcore.SetProcessDpiAwareness(1)
@@ -188,6 +189,7 @@ class VirtualKeyboard(ctk.CTkToplevel):
     
     def toggle(self):
         """Toggle keyboard visibility"""
+        METRICS.keyboard_toggles.inc()
         if self.visible:
             self.hide()
         else:
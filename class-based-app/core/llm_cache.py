@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from engine.metrics import METRICS
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".liberate", "llm_cache")
+
+
+def normalize_text(text):
+    """Transcripts differing only in spacing give the same answer.
+
+    Case is kept: it matters to both prompts (proper nouns to fix,
+    identifiers like userName vs username).
+    """
+    return " ".join(text.split())
+
+
+def cache_key(template, mode, text):
+    """Content address of a request: prompt template, mode and normalized text"""
+    digest = hashlib.sha256()
+    for part in (template, mode, normalize_text(text)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """LRU of LLM responses in memory, backed by one JSON file per response on disk.
+
+    Entries older than `ttl` seconds are ignored and removed. Memory holds at
+    most `max_entries` responses (least recently used go first); the disk
+    store is trimmed to `max_bytes` by dropping the least recently used
+    files (a hit touches the file's mtime).
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_entries=256, max_bytes=20 * 1024 * 1024,
+                 ttl=7 * 24 * 3600):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.memory = OrderedDict()     # key -> (created, response)
+        self.lock = threading.Lock()
+        self.disk_bytes = None          # measured on the first write
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, template, mode, text):
+        key = cache_key(template, mode, text)
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self.memory.move_to_end(key)
+                    METRICS.voice_llm_cache_hits.inc()
+                    return entry[1]
+                del self.memory[key]
+
+        entry = self._read(key, now)
+        if entry is None:
+            METRICS.voice_llm_cache_misses.inc()
+            return None
+        with self.lock:
+            self._remember(key, entry)
+        METRICS.voice_llm_cache_hits.inc()
+        return entry[1]
+
+    def put(self, template, mode, text, response):
+        key = cache_key(template, mode, text)
+        entry = (time.time(), response)
+        with self.lock:
+            self._remember(key, entry)
+        self._write(key, entry)
+
+    def _remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _read(self, key, now):
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if now - data.get("created", 0) > self.ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data["created"], data["response"]
+
+    def _write(self, key, entry):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            payload = json.dumps({"created": entry[0], "response": entry[1]})
+            # Write then rename so a crash never leaves half a file behind
+            temp_path = self._path(key) + ".tmp"
+            with open(temp_path, "w") as f:
+                f.write(payload)
+            os.replace(temp_path, self._path(key))
+            with self.lock:
+                if self.disk_bytes is None:
+                    self.disk_bytes = sum(size for _, size, _ in self._files())
+                else:
+                    self.disk_bytes += len(payload)
+                if self.disk_bytes > self.max_bytes:
+                    self._trim()
+        except OSError as e:
+            print(f"Could not cache LLM response: {e}")
+
+    def _files(self):
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _trim(self):
+        """Drop least recently used files until the store is 80% of max_bytes"""
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes * 0.8:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self.disk_bytes = total
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            if os.path.isdir(self.directory):
+                for _, _, path in self._files():
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self.disk_bytes = 0
+
+
+def response_cache_from_env():
+    """ResponseCache unless LIBERATE_LLM_CACHE=0; LIBERATE_LLM_CACHE_TTL_HOURS sets the TTL"""
+    if os.getenv("LIBERATE_LLM_CACHE", "1") == "0":
+        return None
+    ttl_hours = float(os.getenv("LIBERATE_LLM_CACHE_TTL_HOURS", str(7 * 24)))
+    return ResponseCache(ttl=ttl_hours * 3600)
@@ -0,0 +1,43 @@
+import time
+
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubModel:
+    """Stands in for a Gemini GenerativeModel in tests and benchmarks (no key, no network).
+
+    Answers responses[prompt] for known prompts and otherwise echoes the
+    prompt. With stream=True the answer comes back in `chunk_chars` pieces,
+    the first after `first_delay` seconds and the rest `chunk_delay` apart,
+    like Gemini's streamed chunks; without it, the whole answer arrives once
+    the last chunk would have.
+    """
+
+    def __init__(self, responses=None, chunk_chars=40, first_delay=0.5, chunk_delay=0.05):
+        self.responses = responses or {}
+        self.chunk_chars = chunk_chars
+        self.first_delay = first_delay
+        self.chunk_delay = chunk_delay
+        self.requests = 0
+
+    def answer(self, prompt):
+        return self.responses.get(prompt, prompt)
+
+    def generate_content(self, prompt, stream=False):
+        self.requests += 1
+        text = self.answer(prompt)
+        chunks = [text[i:i + self.chunk_chars] for i in range(0, len(text), self.chunk_chars)] or [""]
+        if stream:
+            return self._stream(chunks)
+        time.sleep(self.first_delay + self.chunk_delay * (len(chunks) - 1))
+        return StubResponse(text)
+
+    def _stream(self, chunks):
+        time.sleep(self.first_delay)
+        for index, chunk in enumerate(chunks):
+            if index:
+                time.sleep(self.chunk_delay)
+            yield StubResponse(chunk)
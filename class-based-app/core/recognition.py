@@ -0,0 +1,87 @@
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from queue import Queue
+
+from engine.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+class RecognitionPipeline:
+    """Recognizes captured phrases on a pool of worker threads, in capture order.
+
+    submit() queues a phrase and returns immediately. Workers block on the
+    queue (no polling) and recognize up to `workers` phrases at once, so a
+    slow network round trip doesn't hold up the phrases behind it. Finished
+    phrases wait until every earlier one is done, then on_result(text, error)
+    runs for each in capture order. At most `max_pending` phrases can be
+    queued before submit() blocks. on_result should be quick (it holds up
+    the other workers' commits); an exception from it is logged and never
+    stops a worker.
+    """
+
+    def __init__(self, recognize, on_result, workers=2, max_pending=16):
+        self.recognize = recognize          # audio -> text, may raise
+        self.on_result = on_result          # (text, error) -> None, called in capture order
+        self.queue = Queue(maxsize=max_pending)
+        self.sequence = itertools.count()
+        self.next_commit = 0
+        self.finished = {}                  # sequence -> (text, error, captured_at)
+        self.commit_lock = threading.Lock()
+        self.pending = 0
+        self.latencies = deque(maxlen=50)   # seconds from capture to commit, newest last
+        self.threads = [
+            threading.Thread(target=self._work, name=f"liberate-recognizer-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    @property
+    def depth(self):
+        """Phrases captured but not yet committed (queued or being recognized)"""
+        return self.pending
+
+    def submit(self, audio):
+        with self.commit_lock:
+            self.pending += 1
+            METRICS.voice_queue_depth.set(self.pending)
+        self.queue.put((next(self.sequence), audio, time.perf_counter()))
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            sequence, audio, captured_at = item
+            text, error = None, None
+            try:
+                with METRICS.voice_recognition_seconds.time():
+                    text = self.recognize(audio)
+            except Exception as e:
+                error = e
+            self._commit(sequence, text, error, captured_at)
+
+    def _commit(self, sequence, text, error, captured_at):
+        # The lock also keeps on_result calls from overlapping, so they stay in order
+        with self.commit_lock:
+            self.finished[sequence] = (text, error, captured_at)
+            while self.next_commit in self.finished:
+                text, error, captured_at = self.finished.pop(self.next_commit)
+                self.next_commit += 1
+                self.pending -= 1
+                latency = time.perf_counter() - captured_at
+                self.latencies.append(latency)
+                METRICS.voice_phrase_latency_seconds.observe(latency)
+                METRICS.voice_queue_depth.set(self.pending)
+                try:
+                    self.on_result(text, error)
+                except Exception as e:
+                    logger.error(f"Transcript handler error: {str(e)}")
+
+    def close(self):
+        for _ in self.threads:
+            self.queue.put(None)
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import threading
+import time
+
+# Speech-to-text backends behind one interface: recognize(audio) -> text.
+# `audio` is a speech_recognition AudioData; every backend raises
+# sr.UnknownValueError when it hears no words, like recognize_google does.
+BACKENDS = ("google", "local", "stub", "local-first")
+
+
+class CloudRecognizer:
+    """Google's free web speech API (a network round trip per phrase)"""
+
+    name = "google"
+
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+
+    def recognize(self, audio):
+        return self.recognizer.recognize_google(audio)
+
+
+class LocalRecognizer:
+    """Offline recognition on the CPU through speech_recognition's local engines.
+
+    engine="whisper" (default) needs the openai-whisper package; the model is
+    loaded on the first phrase. engine="sphinx" needs pocketsphinx and is
+    much lighter but less accurate. Calls are serialized: the model is not
+    safe to load twice at once and already uses every core for one phrase.
+    """
+
+    name = "local"
+
+    def __init__(self, recognizer, engine="whisper", model="base.en"):
+        if engine not in ("whisper", "sphinx"):
+            raise ValueError(f"Unknown local speech engine: {engine}")
+        self.recognizer = recognizer
+        self.engine = engine
+        self.model = model
+        self.lock = threading.Lock()
+
+    def recognize(self, audio):
+        import speech_recognition as sr
+
+        with self.lock:
+            if self.engine == "sphinx":
+                return self.recognizer.recognize_sphinx(audio)
+            text = self.recognizer.recognize_whisper(audio, model=self.model).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class StubRecognizer:
+    """Deterministic recognizer for tests and benchmarks (no model, no network).
+
+    Returns transcripts[digest] for known audio (digest = sha1 of the raw
+    PCM, see audio_digest) and otherwise a description of the phrase length.
+    `delay` simulates recognition time.
+    """
+
+    name = "stub"
+
+    def __init__(self, transcripts=None, delay=0.0):
+        self.transcripts = transcripts or {}
+        self.delay = delay
+
+    def recognize(self, audio):
+        if self.delay:
+            time.sleep(self.delay)
+        digest = audio_digest(audio)
+        if digest in self.transcripts:
+            return self.transcripts[digest]
+        seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        return f"phrase of {seconds:.1f} seconds"
+
+
+class FallbackRecognizer:
+    """Local first; the cloud only when the local engine fails or hears nothing"""
+
+    name = "local-first"
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+        self.fallbacks = 0
+
+    def recognize(self, audio):
+        try:
+            return self.primary.recognize(audio)
+        except Exception:
+            self.fallbacks += 1
+            return self.fallback.recognize(audio)
+
+
+def audio_digest(audio):
+    return hashlib.sha1(audio.frame_data).hexdigest()
+
+
+def create_recognizer(backend, recognizer, local_engine=None, local_model=None):
+    """Backend by name; local options default to LIBERATE_LOCAL_SPEECH_ENGINE / _MODEL"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown speech backend: {backend}")
+    if backend == "google":
+        return CloudRecognizer(recognizer)
+    if backend == "stub":
+        return StubRecognizer()
+    local = LocalRecognizer(
+        recognizer,
+        engine=local_engine or os.getenv("LIBERATE_LOCAL_SPEECH_ENGINE", "whisper"),
+        model=local_model or os.getenv("LIBERATE_LOCAL_SPEECH_MODEL", "base.en")
+    )
+    if backend == "local":
+        return local
+    return FallbackRecognizer(local, CloudRecognizer(recognizer))
@@ -0,0 +1,173 @@
+import numpy as np
+
+
+class StreamingVAD:
+    """Splits a stream of 16-bit mono PCM into phrases as it arrives.
+
+    Each `frame_ms` frame gets two features, computed with NumPy for a whole
+    chunk at once: RMS energy and zero-crossing rate. A frame is speech when
+    its energy is `energy_ratio` times above the adaptive noise floor, or
+    when it is quieter but still above the floor with a high zero-crossing
+    rate (unvoiced consonants like "s" and "f"). A phrase starts after
+    `start_frames` speech frames (with `pre_roll_ms` of audio kept from
+    before, so onsets aren't clipped) and ends `end_silence_ms` after the
+    last speech frame. Phrases longer than `split_after_s` are cut at the
+    next short pause (`split_silence_ms`); if there isn't one by
+    `max_phrase_s`, at the quietest frame of the last second.
+    """
+
+    def __init__(self, sample_rate=16000, frame_ms=20, energy_ratio=3.0, zcr_ratio=1.5,
+                 fricative_zcr=0.25, min_energy=150.0, start_frames=3, pre_roll_ms=200,
+                 end_silence_ms=300, tail_ms=100, split_after_s=6.0, split_silence_ms=120, max_phrase_s=10.0,
+                 noise_adapt=0.05, calibration_ms=300):
+        self.sample_rate = sample_rate
+        self.frame_samples = int(sample_rate * frame_ms / 1000)
+        self.frames_per_second = 1000 // frame_ms
+        self.energy_ratio = energy_ratio
+        self.zcr_ratio = zcr_ratio            # quieter frames count if this far above the floor...
+        self.fricative_zcr = fricative_zcr    # ...and crossing zero this often (per sample)
+        self.min_energy = min_energy          # RMS below this is never speech
+        self.start_frames = start_frames
+        self.pre_roll = max(1, pre_roll_ms // frame_ms)
+        self.end_frames = max(1, end_silence_ms // frame_ms)
+        self.tail_frames = tail_ms // frame_ms    # trailing silence kept so the last word isn't clipped
+        self.split_after = int(split_after_s * 1000 / frame_ms)
+        self.split_frames = max(1, split_silence_ms // frame_ms)
+        self.max_frames = int(max_phrase_s * 1000 / frame_ms)
+        self.noise_adapt = noise_adapt        # EMA weight of a non-speech frame in the noise floor
+        self.calibration_frames = max(1, calibration_ms // frame_ms)
+        self.noise_floor = None
+        self.spans = []               # (start, end) seconds of the phrases the last feed()/flush() returned
+        self.reset()
+
+    def reset(self):
+        self.remainder = np.zeros(0, dtype=np.int16)
+        self.frames = []              # frames of the current phrase (or pre-roll while idle)
+        self.energies = []
+        self.flags = []               # speech / not speech per frame
+        self.first_frame = 0          # stream index of frames[0]
+        self.in_phrase = False
+        self.speech_run = 0
+        self.silence_run = 0
+        self.seen = 0
+
+    def features(self, frames):
+        """(rms energy, zero-crossing rate) per row of a (n, frame_samples) int16 array"""
+        samples = frames.astype(np.float32)
+        energy = np.sqrt(np.mean(samples * samples, axis=1))
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frames.shape[1] - 1)
+        return energy, zcr
+
+    def is_speech(self, energy, zcr):
+        floor = max(self.noise_floor, 1.0)
+        if energy < self.min_energy:
+            return False
+        return energy > floor * self.energy_ratio or \
+            (energy > floor * self.zcr_ratio and zcr > self.fricative_zcr)
+
+    def feed(self, data):
+        """Add raw PCM bytes; returns the phrases (bytes) completed by them"""
+        self.spans = []
+        samples = np.concatenate([self.remainder, np.frombuffer(data, dtype=np.int16)])
+        count = len(samples) // self.frame_samples
+        self.remainder = samples[count * self.frame_samples:]
+        if not count:
+            return []
+        frames = samples[:count * self.frame_samples].reshape(count, self.frame_samples)
+        energies, zcrs = self.features(frames)
+
+        phrases = []
+        for frame, energy, zcr in zip(frames, energies, zcrs):
+            phrase = self._step(frame, float(energy), float(zcr))
+            if phrase is not None:
+                phrases.append(phrase)
+        return phrases
+
+    def flush(self):
+        """End of stream: the phrase in progress, if any"""
+        self.spans = []
+        phrase = self._emit(len(self.frames)) if self.in_phrase and any(self.flags) else None
+        self.reset()
+        return phrase
+
+    def _step(self, frame, energy, zcr):
+        self.seen += 1
+        if self.seen <= self.calibration_frames:
+            # The first frames after opening the microphone set the noise floor
+            self.noise_floor = energy if self.noise_floor is None else \
+                (self.noise_floor * (self.seen - 1) + energy) / self.seen
+            return None
+
+        speech = self.is_speech(energy, zcr)
+        if not speech:
+            self.noise_floor += (energy - self.noise_floor) * self.noise_adapt
+        if not self.frames:
+            self.first_frame = self.seen - 1
+        self.frames.append(frame)
+        self.energies.append(energy)
+        self.flags.append(speech)
+
+        if not self.in_phrase:
+            self.speech_run = self.speech_run + 1 if speech else 0
+            if self.speech_run >= self.start_frames:
+                self.in_phrase = True
+                self.silence_run = 0
+            elif len(self.frames) > self.pre_roll + self.start_frames:
+                del self.frames[0]
+                del self.energies[0]
+                del self.flags[0]
+                self.first_frame += 1
+            return None
+
+        self.silence_run = 0 if speech else self.silence_run + 1
+        if self.silence_run >= self.end_frames:
+            if not any(self.flags):
+                # Only the tail of a pause was left after a split
+                self._emit(0, idle=True)
+                return None
+            return self._emit(len(self.frames) - self.silence_run + self.tail_frames, idle=True)
+        if len(self.frames) >= self.split_after and self.silence_run >= self.split_frames:
+            return self._emit(len(self.frames) - self.silence_run // 2)
+        if len(self.frames) >= self.max_frames:
+            recent = self.energies[-self.frames_per_second:]
+            quietest = len(self.frames) - len(recent) + int(np.argmin(recent))
+            return self._emit(quietest + 1)
+        return None
+
+    def _emit(self, end, idle=False):
+        """Phrase = frames[:end]; the rest starts the next phrase (or is dropped when idle)"""
+        end = min(end, len(self.frames))
+        phrase = np.concatenate(self.frames[:end]).tobytes() if end else b""
+        if end:
+            seconds = self.frame_samples / self.sample_rate
+            self.spans.append((self.first_frame * seconds, (self.first_frame + end) * seconds))
+        self.first_frame += end
+        if idle:
+            self.frames, self.energies, self.flags = [], [], []
+            self.in_phrase = False
+            self.speech_run = 0
+        else:
+            self.frames, self.energies, self.flags = self.frames[end:], self.energies[end:], self.flags[end:]
+        self.silence_run = 0
+        return phrase
+
+
+def vad_phrases(source, keep_listening, vad=None):
+    """Phrases (sr.AudioData) from an open sr.Microphone as soon as each one ends.
+
+    Reads raw chunks from the microphone stream and runs them through a
+    StreamingVAD until keep_listening() is False, then yields the phrase in
+    progress.
+    """
+    import speech_recognition as sr
+
+    if source.SAMPLE_WIDTH != 2:
+        raise ValueError("Voice activity detection needs 16-bit audio")
+    vad = vad or StreamingVAD(sample_rate=source.SAMPLE_RATE)
+    while keep_listening():
+        for phrase in vad.feed(source.stream.read(source.CHUNK)):
+            yield sr.AudioData(phrase, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+    phrase = vad.flush()
+    if phrase:
+        yield sr.AudioData(phrase, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
@@ -3,22 +3,110 @@
 import customtkinter as ctk
 import threading
 import time
-import speech_recognition as sr
-import google.generativeai as genai
 from typing import Callable
 from queue import Queue
-import pyautogui
 import os 
+import subprocess
 import webbrowser
 import logging 
+from engine.metrics import METRICS
+from core.recognition import RecognitionPipeline
+from core.recognizers import create_recognizer
+from core.llm_cache import response_cache_from_env
+from core.injection import text_injector_from_env
+from core.vad import vad_phrases
 
 logger = logging.getLogger(__name__)
 
+# speech_recognition, google.generativeai and pyautogui take most of this
+# module's import time, so they are imported where first used (opening the
+# microphone, the first Gemini request, typing) instead of at module load
+
+
+# Phrases are cut by voice activity detection on the raw microphone stream;
+# LIBERATE_VAD=0 goes back to speech_recognition's listen() with fixed timeouts
+USE_VAD = os.getenv("LIBERATE_VAD", "1") != "0"
+
+
+def speech_backend_from_env(recognizer):
+    # LIBERATE_SPEECH_BACKEND: google (default), local, local-first or stub
+    return create_recognizer(os.getenv("LIBERATE_SPEECH_BACKEND", "google"), recognizer)
+
+
+# Gemini prompts; text is the dictated transcript. Responses are cached per
+# (prompt, mode, normalized transcript), so editing a prompt starts fresh
+CHAT_PROMPT = "{text}"
+GRAMMAR_PROMPT = "You are a transcriptor who writes down what is said. Correct the grammar and improve this text (keep the original meaning):\n{text}"
+CODE_PROMPT = """Convert this natural language description into clean, functional Python code:
+            
+            Description: {text}
+            
+            Requirements:
+            - Only output the code itself with minimal comments
+            - Include all necessary imports
+            - Use Python 3.10+ syntax
+            - Ensure the code is properly indented
+            - Add type hints where appropriate
+            
+            Python Code:"""
+
+
+def load_gemini_model(api_key):
+    # LIBERATE_LLM_BACKEND=stub answers locally with streamed echoes (for testing)
+    if os.getenv("LIBERATE_LLM_BACKEND", "gemini") == "stub":
+        from core.llm_stub import StubModel
+        return StubModel()
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel("models/gemini-1.5-flash")
+
+
+def generate_cached(get_model, cache, prompt, mode, text):
+    """Gemini's answer to prompt.format(text=text), from the cache when possible.
+
+    get_model is only called on a miss, so a cache hit doesn't import or
+    configure Gemini at all.
+    """
+    if cache is not None:
+        cached = cache.get(prompt, mode, text)
+        if cached is not None:
+            return cached
+    with METRICS.voice_llm_seconds.time():
+        response = get_model().generate_content(prompt.format(text=text))
+    if cache is not None:
+        cache.put(prompt, mode, text, response.text)
+    return response.text
+
+
+def stream_cached(get_model, cache, prompt, mode, text):
+    """Like generate_cached, but yields the answer chunk by chunk as Gemini streams it.
+
+    A cache hit is a single chunk; a streamed answer is cached once complete.
+    """
+    if cache is not None:
+        cached = cache.get(prompt, mode, text)
+        if cached is not None:
+            yield cached
+            return
+    chunks = []
+    start = time.perf_counter()
+    for chunk in get_model().generate_content(prompt.format(text=text), stream=True):
+        if not chunks:
+            METRICS.voice_llm_first_chunk_seconds.observe(time.perf_counter() - start)
+        chunks.append(chunk.text)
+        yield chunk.text
+    METRICS.voice_llm_seconds.observe(time.perf_counter() - start)
+    if cache is not None:
+        cache.put(prompt, mode, text, "".join(chunks))
+
+
 class VoiceAssistantCore:
     def __init__(self, api_key: str):
-        self.recognizer = sr.Recognizer()
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("models/gemini-1.5-flash")
+        self.api_key = api_key
+        self._recognizer = None
+        self._speech_backend = None
+        self._model = None
+        self.response_cache = response_cache_from_env()
         self.is_recording = False
         self.callbacks = {
             'on_status_change': None,
@@ -27,6 +115,25 @@ class VoiceAssistantCore:
             'on_error': None
         }
 
+    @property
+    def recognizer(self):
+        if self._recognizer is None:
+            import speech_recognition as sr
+            self._recognizer = sr.Recognizer()
+        return self._recognizer
+
+    @property
+    def speech_backend(self):
+        if self._speech_backend is None:
+            self._speech_backend = speech_backend_from_env(self.recognizer)
+        return self._speech_backend
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = load_gemini_model(self.api_key)
+        return self._model
+
     def register_callback(self, event: str, callback: Callable):
         self.callbacks[event] = callback
 
@@ -44,8 +151,14 @@ class VoiceAssistantCore:
         self._trigger_callback('on_status_change', "Ready")
 
     def _recording_loop(self):
+        import speech_recognition as sr
         try:
             with sr.Microphone() as source:
+                if USE_VAD:
+                    for audio in vad_phrases(source, lambda: self.is_recording):
+                        if self.is_recording:
+                            self._process_audio(audio)
+                    return
                 self.recognizer.adjust_for_ambient_noise(source)
                 while self.is_recording:
                     audio = self.recognizer.listen(source, timeout=3, phrase_time_limit=5)
@@ -56,20 +169,24 @@ class VoiceAssistantCore:
 
     def _process_audio(self, audio):
         try:
-            text = self.recognizer.recognize_google(audio)
+            with METRICS.voice_recognition_seconds.time():
+                text = self.speech_backend.recognize(audio)
             self._trigger_callback('on_user_input', text)
             self._get_ai_response(text)
         except Exception as e:
+            METRICS.voice_errors.inc()
             self._trigger_callback('on_error', f"Processing error: {str(e)}")
 
     def _get_ai_response(self, text):
         try:
-            response = self.model.generate_content(text)
-            self._trigger_callback('on_ai_response', response.text)
+            response = generate_cached(lambda: self.model, self.response_cache, CHAT_PROMPT, "chat", text)
+            self._trigger_callback('on_ai_response', response)
         except Exception as e:
+            METRICS.voice_errors.inc()
             self._trigger_callback('on_error', f"AI error: {str(e)}")
 
     def _check_microphone(self):
+        import speech_recognition as sr
         try:
             with sr.Microphone() as source:
                 self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
@@ -93,30 +210,68 @@ class VoiceTypingAssistant:
         self.mode = "docs"  
         # Default Google Docs
         
-        # Initialize speech recognition
-        self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        # Speech recognition, the microphone and Gemini are created on first use
+        self._recognizer = None
+        self._speech_backend = None
+        self._microphone = None
+        self._model = None
+        self.response_cache = response_cache_from_env()
+        # Typed/pasted text goes through one injector per target app (see core.injection)
+        self.text_injectors = {}
         
-        # Initialize Gemini
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel("models/gemini-1.5-flash")
-        
-        # Audio and text queues
-        self.audio_queue = Queue()
+        # Captured phrases are recognized by a worker pool (LIBERATE_VOICE_WORKERS,
+        # default 2) and their text is queued for the display in capture order
         self.text_queue = Queue()
         self.is_listening = False
+        self.pipeline = None
+        self.capture_thread = None
+        self.recognition_workers = int(os.getenv("LIBERATE_VOICE_WORKERS", "2"))
         
-        self.setup_ui()
+        # Tk widgets may only be touched from the main thread; worker threads
+        # queue their UI updates here and pump_ui runs them every 50 ms
+        self.ui_queue = Queue()
         
-        # Start processing thread
-        self.processing_thread = threading.Thread(
-            target=self.process_audio_queue,
-            daemon=True
-        )
-        self.processing_thread.start()
+        self.setup_ui()
+        self.frame.after(50, self.pump_ui)
         
         logger.info("Voice typing assistant initialized")
 
+    @property
+    def recognizer(self):
+        if self._recognizer is None:
+            import speech_recognition as sr
+            self._recognizer = sr.Recognizer()
+        return self._recognizer
+
+    @property
+    def microphone(self):
+        if self._microphone is None:
+            import speech_recognition as sr
+            self._microphone = sr.Microphone()
+        return self._microphone
+
+    @property
+    def speech_backend(self):
+        if self._speech_backend is None:
+            self._speech_backend = speech_backend_from_env(self.recognizer)
+        return self._speech_backend
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = load_gemini_model(self.api_key)
+        return self._model
+
+    def start_processing(self):
+        """Start the recognition workers the first time listening starts"""
+        if self.pipeline is None:
+            self.speech_backend    # created here, not by two workers racing on the first phrase
+            self.pipeline = RecognitionPipeline(
+                self.recognize_phrase,
+                self.on_transcript,
+                workers=self.recognition_workers
+            )
+
     def setup_ui(self):
         self.frame = ctk.CTkFrame(self.parent)
         self.frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -237,10 +392,30 @@ class VoiceTypingAssistant:
 
     def log_to_ui(self, message):
         """Helper to log messages to both console and UI"""
+        if threading.current_thread() is not threading.main_thread():
+            self.run_in_ui(self.log_to_ui, message)
+            return
         logger.info(message)
         self.debug_console.insert("end", f"{message}\n")
         self.debug_console.see("end")
 
+    def run_in_ui(self, func, *args, **kwargs):
+        """Run func on the Tk main thread (safe to call from any thread)"""
+        self.ui_queue.put((func, args, kwargs))
+
+    def pump_ui(self):
+        while not self.ui_queue.empty():
+            func, args, kwargs = self.ui_queue.get()
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"UI update error: {str(e)}")
+        self.frame.after(50, self.pump_ui)
+
+    def append_text(self, text):
+        self.text_display.insert("end", text)
+        self.text_display.see("end")
+
     def start_listening(self):
         try:
             if not self.is_listening:
@@ -251,12 +426,14 @@ class VoiceTypingAssistant:
                 self.status_label.configure(text="Listening...")
                 self.text_display.delete("1.0", "end")
                 self.log_to_ui("Listening started...")
+                self.start_processing()
 
                 # Start listening in background
-                threading.Thread(
+                self.capture_thread = threading.Thread(
                     target=self.capture_audio,
                     daemon=True
-                ).start()
+                )
+                self.capture_thread.start()
         except Exception as e:
             self.log_to_ui(f"Start listening error: {str(e)}")
 
@@ -268,27 +445,43 @@ class VoiceTypingAssistant:
             self.stop_btn.configure(state="disabled")
             self.status_light.configure(text_color="red")
             self.status_label.configure(text="Processing...")
+            self.finish_processing(time.perf_counter() + 10.0)
+        except Exception as e:
+            self.log_to_ui(f"Processing error: {str(e)}")
+
+    def finish_processing(self, deadline):
+        """Send the transcript on once the phrases still being recognized are in it"""
+        try:
+            # The capture thread still submits the phrase in progress when listening stops
+            capturing = self.capture_thread is not None and self.capture_thread.is_alive()
+            if self.pipeline and (capturing or self.pipeline.depth) and time.perf_counter() < deadline:
+                self.status_label.configure(text=f"Processing... ({self.pipeline.depth} phrases left)")
+                self.frame.after(100, self.finish_processing, deadline)
+                return
+            self.update_text_display()
             
             raw_text = self.text_display.get("1.0", "end-1c").replace("Listening...\n", "")
             
             if raw_text.strip():
-                if self.mode == "docs":
-                    corrected_text = self.fix_grammar_with_gemini(raw_text)
-                    self.text_display.insert("end", f"\nCorrected Text:\n{corrected_text}\n")
-                    self.open_and_type_in_docs(corrected_text)
-                    self.status_label.configure(text="Done! Text sent to Google Docs.")
-                else:
-                    generated_code = self.generate_python_code(raw_text)
-                    self.text_display.insert("end", f"\nGenerated Code:\n{generated_code}\n")
-                    self.status_label.configure(text="Python code generated!")
+                self.status_label.configure(text="Waiting for Gemini...")
+                threading.Thread(target=self.stream_to_target, args=(raw_text,), daemon=True).start()
             else:
                 self.status_label.configure(text="No text detected.")
         except Exception as e:
             self.log_to_ui(f"Processing error: {str(e)}")
 
     def capture_audio(self):
+        import speech_recognition as sr
         try:
             with self.microphone as source:
+                if USE_VAD:
+                    # Each phrase is queued the moment speech stops, and long
+                    # dictation is split at pauses rather than every 5 seconds
+                    self.log_to_ui("Listening...")
+                    for audio in vad_phrases(source, lambda: self.is_listening):
+                        self.pipeline.submit(audio)
+                        self.log_to_ui(f"Audio captured and queued ({self.pipeline.depth} pending)")
+                    return
                 self.log_to_ui("Adjusting for ambient noise...")
                 self.recognizer.adjust_for_ambient_noise(source, duration=1)
                 
@@ -296,8 +489,8 @@ class VoiceTypingAssistant:
                     try:
                         self.log_to_ui("Listening... (timeout 1s)")
                         audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
-                        self.audio_queue.put(audio)
-                        self.log_to_ui("Audio captured and queued")
+                        self.pipeline.submit(audio)
+                        self.log_to_ui(f"Audio captured and queued ({self.pipeline.depth} pending)")
                     except sr.WaitTimeoutError:
                         continue
                     except Exception as e:
@@ -307,26 +500,28 @@ class VoiceTypingAssistant:
         except Exception as e:
             self.log_to_ui(f"Microphone error: {str(e)}")
 
-    def process_audio_queue(self):
-        """Convert audio to text"""
-        while True:
-            if not self.audio_queue.empty():
-                audio = self.audio_queue.get()
-                try:
-                    self.log_to_ui("Processing audio...")
-                    text = self.recognizer.recognize_google(audio)
-                    self.text_queue.put(text)
-                    self.log_to_ui(f"Recognized text: {text[:50]}...")  # Log first 50 chars
-                except sr.UnknownValueError:
-                    self.text_queue.put("(Could not understand audio)")
-                    self.log_to_ui("Audio not understood")
-                except Exception as e:
-                    self.text_queue.put(f"(Error: {str(e)})")
-                    self.log_to_ui(f"Recognition error: {str(e)}")
-
-            # Update UI with new text
-            self.update_text_display()
-            time.sleep(0.1)
+    def recognize_phrase(self, audio):
+        """Convert audio to text (runs on a recognition worker)"""
+        return self.speech_backend.recognize(audio)
+
+    def on_transcript(self, text, error):
+        """Add one recognized phrase to the transcript (called in capture order on a worker)"""
+        import speech_recognition as sr
+        latency_ms = self.pipeline.latencies[-1] * 1000
+        if error is None:
+            self.text_queue.put(text)
+            self.log_to_ui(f"Recognized text in {latency_ms:.0f} ms ({self.pipeline.depth} pending): "
+                           f"{text[:50]}...")  # Log first 50 chars
+        elif isinstance(error, sr.UnknownValueError):
+            self.text_queue.put("(Could not understand audio)")
+            self.log_to_ui("Audio not understood")
+        else:
+            METRICS.voice_errors.inc()
+            self.text_queue.put(f"(Error: {str(error)})")
+            self.log_to_ui(f"Recognition error: {str(error)}")
+
+        # Update UI with new text (on the Tk thread; the queue keeps the order)
+        self.run_in_ui(self.update_text_display)
 
     def update_text_display(self):
         """Show transcribed text in UI"""
@@ -335,77 +530,90 @@ class VoiceTypingAssistant:
             self.text_display.insert("end", f"{text}\n")
             self.text_display.see("end")
 
-    def fix_grammar_with_gemini(self, text):
-        """Use Gemini to correct grammar for Docs mode"""
-        try:
-            self.log_to_ui("Sending text to Gemini for grammar correction...")
-            prompt = f"You are a transcriptor who writes down what is said. Correct the grammar and improve this text (keep the original meaning):\n{text}"
-            response = self.model.generate_content(prompt)
-            self.log_to_ui("Received response from Gemini")
-            return response.text
-        except Exception as e:
-            self.log_to_ui(f"Gemini error: {str(e)}")
-            return f"Error: {str(e)}"
+    def stream_to_target(self, raw_text):
+        """Type Gemini's answer into Docs or VS Code and the display as it streams in.
+
+        Runs on a worker thread. The request runs on another while the target
+        window is opened, so the first words are typed as soon as both are
+        ready instead of after the whole answer has been generated. Display
+        updates go through run_in_ui.
+        """
+        if self.mode == "docs":
+            prompt, mode, heading = GRAMMAR_PROMPT, "grammar", "Corrected Text"
+            target, open_target = "docs", self.open_google_docs
+            done = "Done! Text sent to Google Docs."
+        else:
+            prompt, mode, heading = CODE_PROMPT, "code", "Generated Code"
+            target, open_target = "vscode", self.focus_vscode
+            done = "Python code generated!"
+
+        chunks = Queue()
+
+        def produce():
+            try:
+                for chunk in stream_cached(lambda: self.model, self.response_cache, prompt, mode, raw_text):
+                    chunks.put(chunk)
+                chunks.put(None)
+            except Exception as e:
+                chunks.put(e)
 
-    def generate_python_code(self, text):
         try:
-            self.log_to_ui("Sending text to Gemini for code generation...")
-            prompt = f"""Convert this natural language description into clean, functional Python code:
-            
-            Description: {text}
-            
-            Requirements:
-            - Only output the code itself with minimal comments
-            - Include all necessary imports
-            - Use Python 3.10+ syntax
-            - Ensure the code is properly indented
-            - Add type hints where appropriate
-            
-            Python Code:"""
-            
-            response = self.model.generate_content(prompt)
-            generated_code = response.text
-            self.log_to_ui("Received code from Gemini")
-            
-            # Display the code in the UI
-            self.text_display.insert("end", f"\nGenerated Code:\n{generated_code}\n")
-            self.status_label.configure(text="Python code generated!")
-            
-            # Type into VS Code
-            self.type_into_vscode(generated_code)
-            
-            return generated_code
+            if target not in self.text_injectors:
+                self.text_injectors[target] = text_injector_from_env(target)
+            injector = self.text_injectors[target]
+            self.log_to_ui(f"Streaming {mode} request to Gemini...")
+            start = time.perf_counter()
+            threading.Thread(target=produce, daemon=True).start()
+            open_target()
+            self.run_in_ui(self.append_text, f"\n{heading}:\n")
+            typed = 0
+            end = False
+            injector.begin()
+            try:
+                while end is False:
+                    # Chunks that arrived while the last batch was typed go out
+                    # together, so the clipboard is used once per batch
+                    batch = [chunks.get()]
+                    while not chunks.empty():
+                        batch.append(chunks.get())
+                    if batch[-1] is None or isinstance(batch[-1], Exception):
+                        end = batch.pop()
+                    text = "".join(batch)
+                    if text:
+                        if not typed:
+                            self.log_to_ui(f"First text {time.perf_counter() - start:.2f}s after the request")
+                        self.run_in_ui(self.append_text, text)
+                        injector.inject(text)
+                        typed += len(text)
+            finally:
+                injector.end()
+            if end is not None:
+                METRICS.voice_errors.inc()
+                self.log_to_ui(f"Gemini error: {str(end)}")
+                self.run_in_ui(self.append_text, f"Error: {str(end)}\n")
+                self.run_in_ui(self.status_label.configure, text="Gemini error")
+                return
+            self.run_in_ui(self.append_text, "\n")
+            self.log_to_ui(f"Typed {typed} characters in {time.perf_counter() - start:.2f}s")
+            rates = ", ".join(f"{name} {rate:.0f}" for name, rate in injector.throughput().items())
+            self.log_to_ui(f"Text injection chars/s: {rates}")
+            self.run_in_ui(self.status_label.configure, text=done)
         except Exception as e:
-            self.log_to_ui(f"Code generation error: {str(e)}")
-            return f"Error generating code: {str(e)}"
+            self.log_to_ui(f"Typing error: {str(e)}")
 
-    def type_into_vscode(self, code):
-        """Type the generated code into VS Code"""
+    def focus_vscode(self):
+        """Bring VS Code to the front with the cursor in the editor"""
+        import pyautogui
         try:
             self.log_to_ui("Preparing to type into VS Code...")
-            
-            # Activate VS Code window
             self.activate_vscode()
-            
-            # Type the code with proper delays
-            self.log_to_ui("Typing code into VS Code...")
             pyautogui.click()  # Ensure focus in editor
             time.sleep(0.5)
-            
-            # Split code into lines and type with proper indentation
-            lines = code.split('\n')
-            for line in lines:
-                pyautogui.write(line, interval=0.05)
-                pyautogui.press('enter')
-                time.sleep(0.1)
-            
-            self.log_to_ui("Successfully typed code into VS Code")
-            return True
         except Exception as e:
-            self.log_to_ui(f"Error typing into VS Code: {str(e)}")
-            return False
+            self.log_to_ui(f"Error focusing VS Code: {str(e)}")
 
     def activate_vscode(self):
+        import pyautogui
         try:
             # Try to find VS Code window
             self.log_to_ui("Looking for VS Code window...")
@@ -452,8 +660,9 @@ class VoiceTypingAssistant:
             self.log_to_ui(f"VS Code activation error: {str(e)}")
             return False
 
-    def open_and_type_in_docs(self, text):
-        """Open Google Docs and type the text (Docs mode only)"""
+    def open_google_docs(self):
+        """Open a blank Google Doc and click into it (Docs mode only)"""
+        import pyautogui
         try:
             self.log_to_ui("Opening Google Docs...")
             
@@ -483,19 +692,10 @@ class VoiceTypingAssistant:
             
             self.log_to_ui(f"Browser active window: {pyautogui.getActiveWindowTitle()}")
             
-            # Type the text with failsafe
+            # Click into the document so the text lands there
             self.log_to_ui("Starting to type...")
             pyautogui.click() 
             time.sleep(0.5)
-            
-            # Type in chunks to avoid issues
-            chunk_size = 200
-            for i in range(0, len(text), chunk_size):
-                chunk = text[i:i+chunk_size]
-                pyautogui.write(chunk, interval=0.02)
-                time.sleep(0.1)
-            
-            self.log_to_ui("Typing complete")
         except Exception as e:
             self.log_to_ui(f"Google Docs error: {str(e)}")
 
@@ -0,0 +1,59 @@
+from .facemesh_pool import FaceMeshPool
+from .camera import CameraConfigurator, open_camera
+from .actuator import PyAutoGuiActuator, FakeActuator
+from .latency import LatencyRecorder
+from .replay import ReplayCapture
+from .profiling import FrameProfiler
+from .metrics import METRICS, start_metrics_server
+from .buffers import FrameBuffers
+from .power import PowerManager
+from .motion_gate import MotionGate
+from .cursor_predictor import CursorPredictor
+from .optical_flow import LandmarkFlowTracker
+from .landmarks import LandmarkDetector
+from .filters import Calibrator, MovingAverageFilter, WeightedMovingAverageFilter
+from .gestures import MouthGestures, ScrollGesture
+from .gaze import GazePointer
+from .ballistics import GainCurve, PointerBallistics
+from .drift import DriftCorrector
+from .scroller import ScrollEngine
+from .pipeline import TrackingEngine, TrackingResult
+from .shared_frames import SharedFrameRing
+from .startup import CameraOpener, start_engine
+from .service import TrackingService, TrackingClient
+
+__all__ = [
+    "FaceMeshPool",
+    "CameraConfigurator",
+    "open_camera",
+    "PyAutoGuiActuator",
+    "FakeActuator",
+    "LatencyRecorder",
+    "ReplayCapture",
+    "FrameProfiler",
+    "METRICS",
+    "start_metrics_server",
+    "FrameBuffers",
+    "PowerManager",
+    "MotionGate",
+    "CursorPredictor",
+    "LandmarkFlowTracker",
+    "LandmarkDetector",
+    "Calibrator",
+    "MovingAverageFilter",
+    "WeightedMovingAverageFilter",
+    "MouthGestures",
+    "ScrollGesture",
+    "GazePointer",
+    "GainCurve",
+    "PointerBallistics",
+    "DriftCorrector",
+    "ScrollEngine",
+    "TrackingEngine",
+    "TrackingResult",
+    "SharedFrameRing",
+    "CameraOpener",
+    "start_engine",
+    "TrackingService",
+    "TrackingClient",
+]
@@ -0,0 +1,51 @@
+import time
+
+from engine.metrics import METRICS
+
+
+class PyAutoGuiActuator:
+    """Drives the real mouse through pyautogui"""
+
+    def __init__(self):
+        # Imported here so replay/CI runs never need a display
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def size(self):
+        return self._pyautogui.size()
+
+    # _pause=False skips pyautogui's default 0.1 s sleep after every call,
+    # which otherwise stalls the frame loop on each cursor update
+    def move_to(self, x, y):
+        self._pyautogui.moveTo(x, y, _pause=False)
+
+    def click(self):
+        self._pyautogui.click(_pause=False)
+        METRICS.clicks.inc()
+
+    def scroll(self, amount):
+        self._pyautogui.scroll(amount, _pause=False)
+        METRICS.scrolls.inc()
+
+
+class FakeActuator:
+    """Records actions instead of performing them, for replay runs and CI"""
+
+    def __init__(self, screen_size=(1920, 1080)):
+        self.screen_size = screen_size
+        self.actions = []  # (perf_counter time, action, args)
+
+    def size(self):
+        return self.screen_size
+
+    def move_to(self, x, y):
+        self.actions.append((time.perf_counter(), "move_to", (x, y)))
+
+    def click(self):
+        self.actions.append((time.perf_counter(), "click", ()))
+
+    def scroll(self, amount):
+        self.actions.append((time.perf_counter(), "scroll", (amount,)))
+
+    def count(self, action):
+        return sum(1 for _, name, _ in self.actions if name == action)
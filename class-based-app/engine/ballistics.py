@@ -0,0 +1,81 @@
+import math
+
+# Gain curves: (head speed, gain) control points. Speed is nose travel in
+# normalized frame units per second; gain multiplies the sensitivity slider.
+# Slow, deliberate movement gets a low gain for precision, fast movement a
+# high one for reach, like mouse pointer acceleration.
+PRESETS = {
+    "linear": ((0.0, 1.0), (1.0, 1.0)),
+    "precise": ((0.0, 0.35), (0.05, 0.5), (0.3, 1.0), (1.0, 1.6)),
+    "balanced": ((0.0, 0.5), (0.05, 0.7), (0.25, 1.3), (0.8, 2.2)),
+    "fast": ((0.0, 0.6), (0.05, 1.0), (0.2, 2.0), (0.6, 3.2)),
+}
+
+
+class GainCurve:
+    """Piecewise-linear gain curve sampled into a lookup table.
+
+    The control points are interpolated once into `size` evenly spaced bins
+    up to `max_speed`, so the per-frame lookup is one multiply and an index.
+    Speeds past `max_speed` use the last bin.
+    """
+
+    def __init__(self, points, size=256, max_speed=1.0):
+        self.points = sorted(points)
+        self.max_speed = max_speed
+        self.scale = (size - 1) / max_speed
+        self.table = [self._interpolate(i / self.scale) for i in range(size)]
+
+    def _interpolate(self, speed):
+        if speed <= self.points[0][0]:
+            return self.points[0][1]
+        for (s0, g0), (s1, g1) in zip(self.points, self.points[1:]):
+            if speed <= s1:
+                return g0 + (g1 - g0) * (speed - s0) / (s1 - s0)
+        return self.points[-1][1]
+
+    def gain(self, speed):
+        return self.table[min(int(speed * self.scale), len(self.table) - 1)]
+
+
+class PointerBallistics:
+    """Relative cursor control: each frame's head movement times a speed-dependent gain.
+
+    The cursor starts where the linear mapping would put it and from then on
+    moves by the nose delta * sensitivity * gain(speed). It is kept on screen,
+    so pushing past an edge and coming back re-centres it like a mouse.
+    """
+
+    def __init__(self, screen_size, curve="balanced"):
+        self.screen_width, self.screen_height = screen_size
+        if isinstance(curve, str) and curve not in PRESETS:
+            raise ValueError(f"Unknown gain curve: {curve}")
+        self.curve = GainCurve(PRESETS[curve]) if isinstance(curve, str) else GainCurve(curve)
+        self.reset()
+
+    def reset(self):
+        self.position = None
+        self.last_nose = None
+        self.last_time = None
+        self.speed = 0.0
+
+    def update(self, nose, calibrator, sensitivity, now):
+        """Cursor target in screen pixels for this frame's nose position"""
+        if self.position is None:
+            self.position = (
+                self.screen_width * (0.5 + (nose[0] - calibrator.neutral_x) * sensitivity),
+                self.screen_height * (0.5 + (nose[1] - calibrator.neutral_y) * sensitivity),
+            )
+        else:
+            dx = nose[0] - self.last_nose[0]
+            dy = nose[1] - self.last_nose[1]
+            dt = now - self.last_time
+            self.speed = math.hypot(dx, dy) / dt if dt > 0 else 0.0
+            gain = sensitivity * self.curve.gain(self.speed)
+            self.position = (
+                max(0.0, min(self.screen_width, self.position[0] + dx * gain * self.screen_width)),
+                max(0.0, min(self.screen_height, self.position[1] + dy * gain * self.screen_height)),
+            )
+        self.last_nose = nose
+        self.last_time = now
+        return self.position
@@ -0,0 +1,28 @@
+import numpy as np
+
+
+class FrameBuffers:
+    """Named, preallocated frame buffers reused across frames.
+
+    Buffers are (re)allocated only when the frame shape changes, so the
+    steady-state frame path writes into the same memory every frame via
+    cv2's dst= arguments.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, name, shape, dtype=np.uint8):
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype)
+            self._buffers[name] = buffer
+        return buffer
+
+    def read_into(self, cap, name="raw"):
+        """cap.read() that decodes into the same array every frame"""
+        ret, image = cap.read(self._buffers.get(name))
+        if ret:
+            # cv2 returns a new array on the first read or after a mode change
+            self._buffers[name] = image
+        return ret, image
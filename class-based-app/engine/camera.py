@@ -0,0 +1,152 @@
+import json
+import os
+import time
+from collections import namedtuple
+
+import cv2
+
+CameraMode = namedtuple("CameraMode", ["fourcc", "width", "height", "fps"])
+
+# Modes to try, roughly cheapest first. Face Mesh works on ~256px crops, so
+# anything past 720p only costs decode and colour conversion time.
+CANDIDATE_MODES = [
+    CameraMode("MJPG", 640, 480, 60),
+    CameraMode("MJPG", 640, 480, 30),
+    CameraMode("YUYV", 640, 480, 30),
+    CameraMode("MJPG", 848, 480, 60),
+    CameraMode("MJPG", 1280, 720, 60),
+    CameraMode("MJPG", 1280, 720, 30),
+    CameraMode("MJPG", 320, 240, 60),
+]
+
+# Minimum mode that still tracks reliably at arm's length
+DEFAULT_TARGET = {"min_width": 480, "min_height": 360, "min_fps": 24}
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".liberate", "camera_modes.json")
+
+
+def _decode_fourcc(value):
+    value = int(value)
+    return "".join(chr((value >> 8 * i) & 0xFF) for i in range(4)).strip("\x00")
+
+
+class CameraConfigurator:
+    """Probes webcam modes and opens the camera in the lowest-latency one"""
+
+    def __init__(self, target=None, cache_path=DEFAULT_CACHE_PATH, samples=15):
+        self.target = dict(DEFAULT_TARGET, **(target or {}))
+        self.cache_path = cache_path
+        self.samples = samples
+
+    def open(self, device=0, reprobe=False):
+        """Open a device, applying the cached mode or probing for a new one"""
+        cap = cv2.VideoCapture(device)
+        if not cap.isOpened():
+            return cap
+
+        mode = None if reprobe else self._load_cached(device)
+        if mode is None:
+            mode = self.probe(cap)
+            if mode is not None:
+                self._save_cached(device, mode)
+
+        if mode is not None:
+            self.apply(cap, mode)
+        else:
+            # Nothing met the target; at least stop the driver queueing frames
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
+
+    def apply(self, cap, mode):
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.fourcc))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+        cap.set(cv2.CAP_PROP_FPS, mode.fps)
+        # Only keep the newest frame so reads never return stale images
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def probe(self, cap, modes=CANDIDATE_MODES):
+        """Try each mode and return the lowest-latency one meeting the quality target"""
+        best_mode = None
+        best_latency = None
+
+        for mode in modes:
+            measured = self.measure(cap, mode)
+            if measured is None:
+                continue
+            actual, measured_fps, latency = measured
+            if not self._meets_target(actual, measured_fps):
+                continue
+            if best_latency is None or latency < best_latency:
+                best_mode = actual
+                best_latency = latency
+
+        return best_mode
+
+    def measure(self, cap, mode):
+        """Apply a mode and estimate its capture latency in seconds.
+
+        Returns the mode the driver actually accepted (drivers silently fall
+        back to something else), the measured fps and the expected age of a frame when read():
+        the frames queued in the driver plus half an interval of exposure.
+        """
+        self.apply(cap, mode)
+
+        # Drain frames captured with the previous mode
+        for _ in range(3):
+            if not cap.read()[0]:
+                return None
+
+        intervals = []
+        last = time.perf_counter()
+        for _ in range(self.samples):
+            if not cap.read()[0]:
+                return None
+            now = time.perf_counter()
+            intervals.append(now - last)
+            last = now
+
+        intervals.sort()
+        frame_interval = intervals[len(intervals) // 2]
+        buffered = max(1, int(cap.get(cv2.CAP_PROP_BUFFERSIZE) or 1))
+
+        actual = CameraMode(
+            _decode_fourcc(cap.get(cv2.CAP_PROP_FOURCC)) or mode.fourcc,
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            mode.fps
+        )
+        measured_fps = 1.0 / frame_interval if frame_interval > 0 else 0.0
+        return actual, measured_fps, (buffered + 0.5) * frame_interval
+
+    def _meets_target(self, mode, measured_fps):
+        return (mode.width >= self.target["min_width"]
+                and mode.height >= self.target["min_height"]
+                and measured_fps >= self.target["min_fps"])
+
+    def _load_cached(self, device):
+        try:
+            with open(self.cache_path) as f:
+                entry = json.load(f).get(str(device))
+            return CameraMode(**entry) if entry else None
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_cached(self, device, mode):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            try:
+                with open(self.cache_path) as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            cache[str(device)] = mode._asdict()
+            with open(self.cache_path, "w") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            print(f"Could not cache camera mode: {e}")
+
+
+def open_camera(device=0, reprobe=False, target=None):
+    """cv2.VideoCapture replacement that negotiates a low-latency mode"""
+    return CameraConfigurator(target=target).open(device, reprobe=reprobe)
@@ -0,0 +1,127 @@
+import math
+import threading
+import time
+
+
+class CursorPredictor:
+    """Moves the cursor at display rate between Face Mesh results.
+
+    The tracker calls update() with each new target (15-30 Hz). A background
+    thread runs at `rate_hz`, extrapolates the target with a smoothed velocity
+    estimate and eases the cursor towards it, so motion looks continuous
+    without running inference more often.
+    """
+
+    def __init__(self, actuator, rate_hz=120, bounds=None, velocity_smoothing=0.5,
+                 follow_time=0.03, max_horizon=0.1, stale_after=0.25):
+        self.actuator = actuator
+        self.interval = 1.0 / rate_hz
+        self.bounds = bounds                          # (min_x, min_y, max_x, max_y)
+        self.velocity_smoothing = velocity_smoothing  # EMA weight of the newest velocity
+        self.follow_time = follow_time                # easing time constant, seconds
+        self.max_horizon = max_horizon                # never extrapolate further than this
+        self.stale_after = stale_after                # no updates for this long = hold still
+
+        self.lock = threading.Lock()
+        self.running = False
+        self.thread = None
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.last_target = None
+            self.last_time = None
+            self.velocity = (0.0, 0.0)
+            self.position = None
+            self.emitted = None
+            self.on_move = None
+
+    def update(self, x, y, timestamp=None, on_move=None):
+        """Feed a new cursor target from the tracker.
+
+        on_move, if given, is called on the predictor thread right after the
+        next cursor move, e.g. to stamp latency where the cursor really moves.
+        """
+        now = timestamp if timestamp is not None else time.perf_counter()
+        with self.lock:
+            if on_move is not None:
+                self.on_move = on_move
+            if self.last_target is not None:
+                dt = now - self.last_time
+                if 0 < dt < self.stale_after:
+                    a = self.velocity_smoothing
+                    vx = (x - self.last_target[0]) / dt
+                    vy = (y - self.last_target[1]) / dt
+                    self.velocity = (a * vx + (1 - a) * self.velocity[0],
+                                     a * vy + (1 - a) * self.velocity[1])
+                else:
+                    self.velocity = (0.0, 0.0)
+            if self.position is None:
+                self.position = (float(x), float(y))
+            self.last_target = (x, y)
+            self.last_time = now
+
+    def predict(self, now):
+        """Extrapolated target at time `now`"""
+        age = now - self.last_time
+        if age > self.stale_after:
+            return self.last_target
+        horizon = min(age, self.max_horizon)
+        return (self.last_target[0] + self.velocity[0] * horizon,
+                self.last_target[1] + self.velocity[1] * horizon)
+
+    def step(self, now, dt):
+        """Advance the cursor one tick; returns the position moved to, if any"""
+        with self.lock:
+            if self.last_target is None:
+                return None
+            target_x, target_y = self.predict(now)
+            follow = 1.0 - math.exp(-dt / self.follow_time)
+            x = self.position[0] + (target_x - self.position[0]) * follow
+            y = self.position[1] + (target_y - self.position[1]) * follow
+            if self.bounds:
+                min_x, min_y, max_x, max_y = self.bounds
+                x = max(min_x, min(x, max_x))
+                y = max(min_y, min(y, max_y))
+            self.position = (x, y)
+
+            pixel = (int(round(x)), int(round(y)))
+            if pixel == self.emitted:
+                return None
+            self.emitted = pixel
+            on_move, self.on_move = self.on_move, None
+
+        self.actuator.move_to(*pixel)
+        if on_move is not None:
+            on_move()
+        return pixel
+
+    def _run(self):
+        # Python 3.11+ uses high-resolution timers for sleep on Windows, so
+        # 8 ms ticks are honoured instead of rounding up to ~15.6 ms
+        last = time.perf_counter()
+        next_tick = last
+        while self.running:
+            now = time.perf_counter()
+            self.step(now, now - last)
+            last = now
+            next_tick += self.interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()  # fell behind; don't try to catch up
+
+    def start(self):
+        if self.running:
+            return
+        self.reset()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=0.5)
+            self.thread = None
@@ -0,0 +1,91 @@
+from collections import deque
+from statistics import median
+
+from engine.gestures import cheek_distance
+from engine.landmarks import NOSE_TIP
+from engine.metrics import METRICS
+
+
+class DriftCorrector:
+    """Slowly re-centres the calibrated neutral pose from the user's rest periods.
+
+    A rest period is the head holding within `rest_radius` of one spot for at
+    least `rest_after` seconds with the mouth closed and no scrolling. Each one
+    contributes its median nose position and cheek distance; once `min_rests`
+    are known, the neutral pose moves a fraction `rate` of the way towards the
+    median of the last `history` rest medians, at most `max_step` per rest.
+    Medians of medians ignore the odd outlier. Corrections are applied when
+    the rest ends, so the cursor doesn't creep while the user is still.
+
+    The pointer mapping is absolute, so the head also rests wherever the user
+    holds the cursor to read or hover. Only rests that put the cursor within
+    `center_radius` (a fraction of the screen) of the centre count as
+    evidence of the neutral pose; rests anywhere else are where the user
+    works, not drift.
+    """
+
+    def __init__(self, rest_after=3.0, rest_radius=0.01, history=15, min_rests=3, rate=0.2,
+                 max_step=0.005, max_offset=0.02, center_radius=0.05):
+        self.rest_after = rest_after
+        self.rest_radius = rest_radius    # normalized nose travel still counted as resting
+        self.history = history
+        self.min_rests = min_rests
+        self.rate = rate
+        self.max_step = max_step          # largest neutral shift per rest, normalized
+        self.max_offset = max_offset      # farther than this from neutral is not drift
+        self.center_radius = center_radius  # cursor offset from screen centre, fraction of the screen
+        self.rests = deque(maxlen=history)
+        self.corrections = 0
+        self.reset()
+
+    def reset(self):
+        self.rests.clear()
+        self.anchor = None
+        self.started_at = None
+        self.samples = []
+
+    def update(self, landmarks, calibrator, now, sensitivity, busy=False):
+        """Feed one tracked frame; returns True when the neutral pose was adjusted.
+
+        sensitivity is the pointer's, to tell where the resting cursor is.
+        """
+        nose = landmarks[NOSE_TIP]
+        if self.anchor is not None and not busy and \
+                abs(nose.x - self.anchor[0]) <= self.rest_radius and \
+                abs(nose.y - self.anchor[1]) <= self.rest_radius:
+            self.samples.append((nose.x, nose.y, cheek_distance(landmarks)))
+            return False
+
+        corrected = self._end_rest(calibrator, now, sensitivity)
+        # A busy frame (clicking, scrolling) can't start a rest
+        self.anchor = None if busy else (nose.x, nose.y)
+        self.started_at = now
+        self.samples = []
+        return corrected
+
+    def _end_rest(self, calibrator, now, sensitivity):
+        if self.anchor is None or now - self.started_at < self.rest_after or not self.samples:
+            return False
+        rest = tuple(median(s[i] for s in self.samples) for i in range(3))
+        if abs(rest[0] - calibrator.neutral_x) * sensitivity > self.center_radius or \
+                abs(rest[1] - calibrator.neutral_y) * sensitivity > self.center_radius:
+            return False
+        self.rests.append(rest)
+        if len(self.rests) < self.min_rests:
+            return False
+
+        rest_x = median(r[0] for r in self.rests)
+        rest_y = median(r[1] for r in self.rests)
+        offset_x = rest_x - calibrator.neutral_x
+        offset_y = rest_y - calibrator.neutral_y
+        if abs(offset_x) > self.max_offset or abs(offset_y) > self.max_offset:
+            return False
+
+        calibrator.neutral_x += max(-self.max_step, min(self.max_step, offset_x * self.rate))
+        calibrator.neutral_y += max(-self.max_step, min(self.max_step, offset_y * self.rate))
+        if calibrator.neutral_cheek_distance is not None:
+            rest_cheek = median(r[2] for r in self.rests)
+            calibrator.neutral_cheek_distance += (rest_cheek - calibrator.neutral_cheek_distance) * self.rate
+        self.corrections += 1
+        METRICS.drift_corrections.inc()
+        return True
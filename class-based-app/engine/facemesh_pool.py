@@ -0,0 +1,101 @@
+import multiprocessing
+import time
+from collections import deque, namedtuple
+
+# Lightweight, picklable stand-ins for the MediaPipe result objects so the
+# gesture code can keep using results.multi_face_landmarks[0].landmark[i].x
+Landmark = namedtuple("Landmark", ["x", "y", "z"])
+FaceLandmarks = namedtuple("FaceLandmarks", ["landmark"])
+FaceMeshResult = namedtuple("FaceMeshResult", ["timestamp", "multi_face_landmarks", "latency"])
+
+EMPTY_RESULT = FaceMeshResult(None, None, 0.0)
+
+# One FaceMesh per worker process
+_face_mesh = None
+
+
+def _init_worker(options):
+    global _face_mesh
+    import mediapipe as mp
+    _face_mesh = mp.solutions.face_mesh.FaceMesh(**options)
+
+
+def _process_frame(timestamp, rgb_frame):
+    results = _face_mesh.process(rgb_frame)
+    if not results.multi_face_landmarks:
+        return timestamp, None
+    faces = [
+        [(lm.x, lm.y, lm.z) for lm in face.landmark]
+        for face in results.multi_face_landmarks
+    ]
+    return timestamp, faces
+
+
+def _to_result(timestamp, faces, released_at):
+    if faces is None:
+        face_list = None
+    else:
+        face_list = [FaceLandmarks([Landmark(*lm) for lm in face]) for face in faces]
+    return FaceMeshResult(timestamp, face_list, released_at - timestamp)
+
+
+class FaceMeshPool:
+    """Runs N Face Mesh workers on interleaved frames, results in capture order"""
+
+    def __init__(self, workers=2, max_in_flight=None, **face_mesh_options):
+        self.workers = workers
+        # Enough frames in flight to keep every worker busy without queueing forever
+        self.max_in_flight = max_in_flight or workers * 2
+        ctx = multiprocessing.get_context("spawn")
+        self.pool = ctx.Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(face_mesh_options,)
+        )
+        self.pending = deque()  # (timestamp, AsyncResult), oldest capture first
+
+    def submit(self, rgb_frame, timestamp=None):
+        """Queue a frame; blocks on the oldest frame if too many are in flight"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        released = []
+        if len(self.pending) >= self.max_in_flight:
+            released.extend(self.collect(block=True, limit=1))
+
+        self.pending.append(
+            (timestamp, self.pool.apply_async(_process_frame, (timestamp, rgb_frame)))
+        )
+        return released
+
+    def collect(self, block=False, limit=None):
+        """Release finished results strictly in capture timestamp order.
+
+        A result that finishes early waits for every older frame, so gesture
+        logic never sees time go backwards.
+        """
+        released = []
+        while self.pending and (limit is None or len(released) < limit):
+            timestamp, async_result = self.pending[0]
+            if not block and not async_result.ready():
+                break
+            self.pending.popleft()
+            _, faces = async_result.get()
+            result = _to_result(timestamp, faces, time.perf_counter())
+            released.append(result)
+        return released
+
+    def process(self, rgb_frame, timestamp=None):
+        """Submit a frame; returns every result released so far, oldest first (often none)"""
+        released = self.submit(rgb_frame, timestamp)
+        released.extend(self.collect())
+        return released
+
+    def drain(self):
+        """Wait for every in-flight frame and return the ordered results"""
+        return self.collect(block=True)
+
+    def close(self):
+        self.pending.clear()
+        self.pool.terminate()
+        self.pool.join()
@@ -0,0 +1,107 @@
+from collections import deque
+
+import numpy as np
+
+from engine.gaze import iris_ratio
+from engine.landmarks import NOSE_TIP, LEFT_CHEEK, RIGHT_CHEEK
+
+
+class MovingAverageFilter:
+    """Plain average of the last `size` cursor targets"""
+
+    def __init__(self, size=10):
+        self.size = size
+        self.x_points = deque(maxlen=size)
+        self.y_points = deque(maxlen=size)
+
+    def set_size(self, size):
+        """Resize the window, keeping the newest targets"""
+        self.size = max(1, int(size))
+        self.x_points = deque(self.x_points, maxlen=self.size)
+        self.y_points = deque(self.y_points, maxlen=self.size)
+
+    def reset(self):
+        self.x_points.clear()
+        self.y_points.clear()
+
+    def apply(self, x, y):
+        self.x_points.append(x)
+        self.y_points.append(y)
+        return self._average()
+
+    def _average(self):
+        count = len(self.x_points)
+        return sum(self.x_points) / count, sum(self.y_points) / count
+
+
+class WeightedMovingAverageFilter(MovingAverageFilter):
+    """Linearly weighted average (newest target counts double the oldest)"""
+
+    def _average(self):
+        count = len(self.x_points)
+        if count <= 3:
+            # Simple average for the first few frames
+            return super()._average()
+        weights = np.linspace(0.5, 1.0, count)
+        weights /= weights.sum()
+        return float(np.dot(self.x_points, weights)), float(np.dot(self.y_points, weights))
+
+
+FILTERS = {
+    "average": MovingAverageFilter,
+    "weighted": WeightedMovingAverageFilter,
+}
+
+
+class Calibrator:
+    """Neutral head pose from the trimmed mean of `frames` calibration frames"""
+
+    def __init__(self, frames=30, trim=0.2):
+        self.frames = frames
+        self.trim = trim                  # fraction dropped from each end as outliers
+        self.neutral_x = 0.5
+        self.neutral_y = 0.5
+        self.neutral_cheek_distance = None
+        self.neutral_gaze = None          # iris ratio looking straight ahead (iris tier only)
+        self.reset()
+
+    def reset(self):
+        self.calibrated = False
+        self.samples_x = []
+        self.samples_y = []
+        self.samples_cheek = []
+        self.samples_gaze = []
+
+    @property
+    def count(self):
+        return len(self.samples_x)
+
+    def _trimmed_mean(self, values):
+        values = sorted(values)
+        trim = int(len(values) * self.trim)
+        if trim:
+            values = values[trim:-trim]
+        return sum(values) / len(values)
+
+    def add(self, landmarks):
+        """Add one frame's landmarks; True once calibration is complete"""
+        nose = landmarks[NOSE_TIP]
+        self.samples_x.append(nose.x)
+        self.samples_y.append(nose.y)
+        self.samples_cheek.append(abs(landmarks[LEFT_CHEEK].y - landmarks[RIGHT_CHEEK].y))
+        gaze = iris_ratio(landmarks)
+        if gaze is not None:
+            self.samples_gaze.append(gaze)
+
+        if self.count < self.frames:
+            return False
+        self.neutral_x = self._trimmed_mean(self.samples_x)
+        self.neutral_y = self._trimmed_mean(self.samples_y)
+        self.neutral_cheek_distance = self._trimmed_mean(self.samples_cheek)
+        if self.samples_gaze:
+            self.neutral_gaze = (self._trimmed_mean([g[0] for g in self.samples_gaze]),
+                                 self._trimmed_mean([g[1] for g in self.samples_gaze]))
+        else:
+            self.neutral_gaze = None
+        self.calibrated = True
+        return True
@@ -0,0 +1,117 @@
+import math
+
+from engine.landmarks import NOSE_TIP, LEFT_EYE_TOP, LEFT_EYE_BOTTOM, RIGHT_EYE_TOP, RIGHT_EYE_BOTTOM
+
+GAZE_JUMP = "gaze_jump"
+
+# Iris centres from the refinement model (mesh_iris tier only)
+LEFT_IRIS = 468
+RIGHT_IRIS = 473
+
+# Eye corners: (outer, inner) in image order for each eye
+LEFT_EYE_CORNERS = (33, 133)
+RIGHT_EYE_CORNERS = (362, 263)
+
+
+def iris_ratio(landmarks):
+    """Iris position inside the eye openings, (x, y) in 0-1, averaged over both eyes.
+
+    None when the landmarks have no iris points (plain mesh tier).
+    """
+    if len(landmarks) <= RIGHT_IRIS:
+        return None
+    ratios = []
+    for iris, (a, b), (top, bottom) in (
+        (LEFT_IRIS, LEFT_EYE_CORNERS, (LEFT_EYE_TOP, LEFT_EYE_BOTTOM)),
+        (RIGHT_IRIS, RIGHT_EYE_CORNERS, (RIGHT_EYE_TOP, RIGHT_EYE_BOTTOM)),
+    ):
+        width = landmarks[b].x - landmarks[a].x
+        height = landmarks[bottom].y - landmarks[top].y
+        if abs(width) < 1e-6 or abs(height) < 1e-6:
+            return None
+        ratios.append(((landmarks[iris].x - landmarks[a].x) / width,
+                       (landmarks[iris].y - landmarks[top].y) / height))
+    return (sum(r[0] for r in ratios) / 2, sum(r[1] for r in ratios) / 2)
+
+
+class GazePointer:
+    """Eyes pick the screen region, the head places the cursor inside it.
+
+    The iris position (relative to the calibrated straight-ahead ratio) gives
+    a coarse, smoothed gaze point. When it settles for `dwell` seconds in a
+    grid cell other than the cursor's and far enough away, the cursor jumps to
+    that point. Between jumps the cursor moves from the jump point by head
+    motion at `fine_sensitivity`, which is lower than the plain head mode so
+    small targets are easy to hit.
+    """
+
+    def __init__(self, screen_size, grid=(3, 3), gaze_gain=(4.0, 5.0), fine_sensitivity=2.0,
+                 smoothing=0.3, dwell=0.25, min_jump=0.2):
+        self.screen_width, self.screen_height = screen_size
+        self.grid = grid                      # (columns, rows) of jump regions
+        self.gaze_gain = gaze_gain            # screen fraction per unit of iris ratio offset
+        self.fine_sensitivity = fine_sensitivity
+        self.smoothing = smoothing            # EMA weight of the newest gaze sample
+        self.dwell = dwell                    # seconds the gaze must hold a new region
+        self.min_jump = min_jump              # jump only if gaze is this far (screen fraction)
+        self.jumps = 0
+        self.reset()
+
+    def reset(self):
+        self.gaze = None                      # smoothed gaze point, screen fraction (x, y)
+        self.anchor = None                    # cursor position at the last jump, pixels
+        self.anchor_nose = None               # nose position at the last jump, normalized
+        self.pending_region = None
+        self.pending_since = None
+
+    def region(self, point):
+        columns, rows = self.grid
+        column = min(columns - 1, max(0, int(point[0] * columns)))
+        row = min(rows - 1, max(0, int(point[1] * rows)))
+        return column, row
+
+    def gaze_point(self, ratio, neutral_ratio):
+        x = 0.5 + (ratio[0] - neutral_ratio[0]) * self.gaze_gain[0]
+        y = 0.5 + (ratio[1] - neutral_ratio[1]) * self.gaze_gain[1]
+        return min(1.0, max(0.0, x)), min(1.0, max(0.0, y))
+
+    def jump(self, point, nose):
+        self.anchor = (point[0] * self.screen_width, point[1] * self.screen_height)
+        self.anchor_nose = nose
+        self.pending_region = None
+        self.jumps += 1
+
+    def update(self, landmarks, calibrator, now):
+        """Cursor target in screen pixels, or None without iris landmarks"""
+        ratio = iris_ratio(landmarks)
+        if ratio is None or calibrator.neutral_gaze is None:
+            return None
+        nose = (landmarks[NOSE_TIP].x, landmarks[NOSE_TIP].y)
+
+        sample = self.gaze_point(ratio, calibrator.neutral_gaze)
+        if self.gaze is None:
+            self.gaze = sample
+        else:
+            a = self.smoothing
+            self.gaze = (a * sample[0] + (1 - a) * self.gaze[0], a * sample[1] + (1 - a) * self.gaze[1])
+
+        if self.anchor is None:
+            self.jump(self.gaze, nose)
+
+        # Fine positioning: head motion since the last jump
+        x = self.anchor[0] + (nose[0] - self.anchor_nose[0]) * self.fine_sensitivity * self.screen_width
+        y = self.anchor[1] + (nose[1] - self.anchor_nose[1]) * self.fine_sensitivity * self.screen_height
+
+        # Coarse jump: gaze holding a different, distant region
+        cursor = (x / self.screen_width, y / self.screen_height)
+        gaze_region = self.region(self.gaze)
+        distance = math.hypot(self.gaze[0] - cursor[0], self.gaze[1] - cursor[1])
+        if gaze_region == self.region(cursor) or distance < self.min_jump:
+            self.pending_region = None
+        elif gaze_region != self.pending_region:
+            self.pending_region = gaze_region
+            self.pending_since = now
+        elif now - self.pending_since >= self.dwell:
+            self.jump(self.gaze, nose)
+            return self.anchor
+        return x, y
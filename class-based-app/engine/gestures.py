@@ -0,0 +1,156 @@
+from engine.landmarks import (
+    NOSE_TIP, UPPER_LIP, LOWER_LIP, FOREHEAD, CHIN, LEFT_CHEEK, RIGHT_CHEEK,
+    LEFT_EYE_TOP, LEFT_EYE_BOTTOM, RIGHT_EYE_TOP, RIGHT_EYE_BOTTOM
+)
+
+CLICK = "click"
+TOGGLE_KEYBOARD = "toggle_keyboard"
+
+
+def mouth_ratio(landmarks):
+    """Lip gap relative to face height (independent of distance to the camera)"""
+    mouth_dist = abs(landmarks[UPPER_LIP].y - landmarks[LOWER_LIP].y)
+    face_height = abs(landmarks[FOREHEAD].y - landmarks[CHIN].y)
+    return mouth_dist / face_height
+
+
+class MouthGestures:
+    """Mouth opens -> click (1 open) and keyboard toggle (3 opens in a window).
+
+    An open counts once, on the frame the mouth goes from closed to open, and
+    only if the previous open was at least `reopen_gap` seconds ago. The first
+    open of a sequence clicks; the third toggles the keyboard.
+    """
+
+    def __init__(self, click_threshold=0.05, click_cooldown=0.5, sequence_window=2.0,
+                 reopen_gap=0.5, toggle_count=3, toggle_cooldown=2.0):
+        self.click_threshold = click_threshold
+        self.click_cooldown = click_cooldown      # minimum seconds between clicks
+        self.sequence_window = sequence_window    # opens must fall within this many seconds
+        self.reopen_gap = reopen_gap
+        self.toggle_count = toggle_count
+        self.toggle_cooldown = toggle_cooldown    # minimum seconds between keyboard toggles
+        self.reset()
+
+    def reset(self):
+        self.was_open = False
+        self.sequence = []
+        self.last_open_time = 0
+        self.last_click_time = 0
+        self.last_toggle_time = 0
+        self.ratio = 0.0
+
+    def update(self, landmarks, now):
+        """Returns (mouth_open, events) for this frame"""
+        self.ratio = mouth_ratio(landmarks)
+        mouth_open = self.ratio > self.click_threshold
+        events = []
+
+        if mouth_open and not self.was_open and now - self.last_open_time > self.reopen_gap:
+            self.last_open_time = now
+            # Drop opens that fell out of the window before counting this one
+            self.sequence = [t for t in self.sequence if now - t <= self.sequence_window]
+            self.sequence.append(now)
+
+            if (len(self.sequence) >= self.toggle_count and
+                    now - self.last_toggle_time > self.toggle_cooldown):
+                self.last_toggle_time = now
+                self.sequence = []
+                events.append(TOGGLE_KEYBOARD)
+            elif len(self.sequence) == 1 and now - self.last_click_time > self.click_cooldown:
+                self.last_click_time = now
+                events.append(CLICK)
+
+        self.was_open = mouth_open
+        return mouth_open, events
+
+
+def cheek_distance(landmarks):
+    return abs(landmarks[LEFT_CHEEK].y - landmarks[RIGHT_CHEEK].y)
+
+
+class ScrollGesture:
+    """Puffed cheeks switch on scroll mode; gaze or head pitch sets the speed.
+
+    The deflection (eye openness away from its neutral band, or the nose
+    above/below its calibrated height) is mapped through a dead zone and a
+    power curve to a velocity in wheel units per second, so a small glance
+    creeps and a strong one flies through long documents.
+    """
+
+    def __init__(self, source="gaze", inflation_threshold=0.04, activation_frames=10,
+                 max_speed=1500.0, deadzone=0.05, exponent=1.3, pitch_range=0.08):
+        if source not in ("gaze", "pitch"):
+            raise ValueError(f"Unknown scroll source: {source}")
+        self.source = source
+        self.inflation_threshold = inflation_threshold
+        self.activation_frames = activation_frames    # frames of puffed cheeks before scrolling
+        self.max_speed = max_speed                    # wheel units per second at full deflection
+        # Gaze already has its own neutral band, so the dead zone only absorbs jitter.
+        # With these defaults a quarter deflection (~200 units/s) matches the old
+        # fixed 30 units per 0.15 s; less creeps, more goes up to 1500 units/s.
+        self.deadzone = deadzone                      # deflection ignored around neutral, 0-1
+        self.exponent = exponent                      # >1 gives finer control at low speed
+        self.pitch_range = pitch_range                # nose travel (normalized) for full speed
+        self.reset()
+
+    def reset(self):
+        self.active = False
+        self.inflation_frames = 0
+        self.deflection = 0.0
+
+    def cheeks_inflated(self, landmarks, neutral_cheek_distance):
+        if neutral_cheek_distance is None:
+            return False
+        cheek_expansion = cheek_distance(landmarks) - neutral_cheek_distance
+
+        # Mouth gets narrower when puffing cheeks
+        mouth_width = abs(landmarks[61].x - landmarks[291].x)   # mouth corners
+        face_width = abs(landmarks[234].x - landmarks[454].x)   # ear to ear
+        return cheek_expansion > self.inflation_threshold and mouth_width / face_width < 0.25
+
+    def gaze_deflection(self, landmarks):
+        """Wider eyes = looking up (+), narrower = looking down (-), 0 inside 0.2-0.3"""
+        left_eye_h = abs(landmarks[LEFT_EYE_TOP].y - landmarks[LEFT_EYE_BOTTOM].y)
+        right_eye_h = abs(landmarks[RIGHT_EYE_TOP].y - landmarks[RIGHT_EYE_BOTTOM].y)
+        left_eye_w = abs(landmarks[33].x - landmarks[133].x)
+        right_eye_w = abs(landmarks[362].x - landmarks[263].x)
+        avg_ratio = (left_eye_h / left_eye_w + right_eye_h / right_eye_w) / 2
+
+        if avg_ratio > 0.3:
+            return min(1.0, (avg_ratio - 0.3) / 0.1)
+        elif avg_ratio < 0.2:
+            return max(-1.0, (avg_ratio - 0.2) / 0.1)
+        return 0.0
+
+    def pitch_deflection(self, landmarks, neutral_y):
+        """Head tilted up (+) or down (-) from the calibrated pose"""
+        offset = (neutral_y - landmarks[NOSE_TIP].y) / self.pitch_range
+        return max(-1.0, min(1.0, offset))
+
+    def velocity(self, deflection):
+        magnitude = abs(deflection)
+        if magnitude <= self.deadzone:
+            return 0.0
+        scaled = (magnitude - self.deadzone) / (1.0 - self.deadzone)
+        speed = self.max_speed * scaled ** self.exponent
+        return speed if deflection > 0 else -speed
+
+    def update(self, landmarks, calibrator):
+        """Scroll velocity for this frame in wheel units per second (0 when not scrolling)"""
+        if not self.cheeks_inflated(landmarks, calibrator.neutral_cheek_distance):
+            self.inflation_frames = 0
+            self.active = False
+            self.deflection = 0.0
+            return 0.0
+
+        self.inflation_frames += 1
+        if self.inflation_frames < self.activation_frames:
+            return 0.0
+        self.active = True
+
+        if self.source == "pitch":
+            self.deflection = self.pitch_deflection(landmarks, calibrator.neutral_y)
+        else:
+            self.deflection = self.gaze_deflection(landmarks)
+        return self.velocity(self.deflection)
@@ -0,0 +1,171 @@
+import time
+
+import cv2
+
+from engine.buffers import FrameBuffers
+from engine.facemesh_pool import FaceMeshPool, EMPTY_RESULT, FaceMeshResult, FaceLandmarks
+from engine.metrics import METRICS
+from engine.model_tiers import FEATURE_LANDMARKS, select_tier, face_mesh_options
+from engine.motion_gate import MotionGate
+from engine.optical_flow import LandmarkFlowTracker
+from engine.power import PowerManager, IDLE
+
+# Face Mesh landmark indices used by the filters and gestures
+NOSE_TIP = 1
+UPPER_LIP = 13
+LOWER_LIP = 14
+LEFT_CHEEK = 123
+RIGHT_CHEEK = 352
+FOREHEAD = 10
+CHIN = 152
+LEFT_EYE_TOP = 159
+LEFT_EYE_BOTTOM = 145
+RIGHT_EYE_TOP = 386
+RIGHT_EYE_BOTTOM = 374
+
+
+class LandmarkDetector:
+    """Face Mesh plus everything that decides whether it has to run.
+
+    Power saving, the motion gate and optical flow can each answer a frame
+    without inference; otherwise the frame is converted to RGB and sent to
+    Face Mesh (or the worker pool). detect() returns a list of results: one
+    per frame normally, but with the pool whatever it released in capture
+    order, which can be none or several. The list is cached per frame, so
+    callers reusing one frame buffer must call new_frame() between frames.
+    """
+
+    def __init__(self, features, workers=0, power_save=True, motion_gate=True, optical_flow=False,
+                 profiler=None, mark_stage=None):
+        # Imported here so the landmark indices and gestures load without mediapipe
+        import mediapipe as mp
+        self.mp_face_mesh = mp.solutions.face_mesh
+
+        # Enabled features decide the model tier: iris refinement only loads
+        # when something actually reads the iris landmarks
+        self.features = set(features)
+        if motion_gate and workers <= 1:
+            self.features.add("motion_gate")
+        self.workers = workers
+        self.face_mesh = None
+        self.pool = None
+        self.model_tier = None
+        self._build_face_mesh()
+
+        self.buffers = FrameBuffers()
+        self.profiler = profiler
+        self.mark_stage = mark_stage or (lambda stage: None)
+        self._last_frame = None
+        self._last_results = None       # newest landmark result, reused while idle or gated
+        self._last_detections = []      # what detect() returned for _last_frame
+
+        # Active/idle/absent states; skips Face Mesh while the face is still or gone
+        self.power = PowerManager(enabled=power_save)
+
+        # Reuses the last landmarks while the face (incl. mouth and eyes) is unchanged
+        # (off with the pool: its landmarks lag the frame they would be compared to)
+        self.motion_gate = MotionGate(enabled=motion_gate and self.pool is None)
+
+        # Hybrid mode: Face Mesh on keyframes, LK optical flow in between
+        self.flow = LandmarkFlowTracker(enabled=optical_flow and self.pool is None)
+
+    def _build_face_mesh(self):
+        """(Re)create Face Mesh (and the pool) for the cheapest tier the features need"""
+        tier = select_tier(self.features)
+        if tier == self.model_tier:
+            return
+
+        if self.face_mesh:
+            self.face_mesh.close()
+        if self.pool:
+            self.pool.close()
+
+        self.model_tier = tier
+        self.face_mesh_options = face_mesh_options(tier)
+        self.face_mesh = self.mp_face_mesh.FaceMesh(**self.face_mesh_options)
+
+        # Optional multi-process Face Mesh (results come back in capture order)
+        self.pool = FaceMeshPool(self.workers, **self.face_mesh_options) if self.workers > 1 else None
+        self._last_results = None
+
+    def warm_up(self, shape=(480, 640, 3)):
+        """One inference on a blank frame, so the first camera frame doesn't pay graph setup"""
+        blank = self.buffers.get("rgb", shape)
+        blank.fill(0)
+        self.face_mesh.process(blank)
+
+    def set_feature(self, feature, enabled):
+        """Enable/disable a feature, switching model tier if its landmark needs change"""
+        if feature not in FEATURE_LANDMARKS:
+            raise ValueError(f"Unknown feature: {feature}")
+        if enabled:
+            self.features.add(feature)
+        else:
+            self.features.discard(feature)
+        self._build_face_mesh()
+
+    def new_frame(self):
+        self._last_frame = None
+
+    def detect(self, frame):
+        """Landmark results for a frame, reusing them if it was already processed"""
+        if frame is self._last_frame:
+            return self._last_detections
+
+        if not self.power.should_infer(frame):
+            # Idle: the head is still, so the last landmarks are still valid
+            if self.power.state == IDLE and self._last_results is not None:
+                results = self._last_results
+            else:
+                results = EMPTY_RESULT
+            METRICS.inferences_skipped.inc()
+            return self._detected(frame, [results])
+
+        if self.motion_gate.should_skip(frame):
+            METRICS.inferences_skipped.inc()
+            return self._detected(frame, [self._last_results])
+
+        flowed = self.flow.track(frame)
+        if flowed is not None:
+            METRICS.inferences_skipped.inc()
+            return self._detected(frame, [FaceMeshResult(None, [FaceLandmarks(flowed)], 0.0)])
+
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.buffers.get("rgb", frame.shape))
+        self.mark_stage("convert")
+        inference_start = time.perf_counter()
+        if self.pool:
+            # The pool pickles frames after apply_async returns, so it needs its own copy.
+            # Only results released by this call are returned, so none is seen twice
+            detections = self.pool.process(rgb_frame.copy())
+        else:
+            detections = [self.face_mesh.process(rgb_frame)]
+        METRICS.inference_seconds.observe(time.perf_counter() - inference_start)
+        METRICS.frames_processed.inc()
+        self.mark_stage("inference")
+
+        for results in detections:
+            if self.profiler:
+                self.profiler.record_face(bool(results.multi_face_landmarks))
+            if results.multi_face_landmarks:
+                landmarks = results.multi_face_landmarks[0].landmark
+                nose = landmarks[NOSE_TIP]
+                self.power.update(True, (nose.x, nose.y))
+                self.motion_gate.update(frame, landmarks)
+                self.flow.keyframe(frame, landmarks)
+            else:
+                self.power.update(False)
+                self.motion_gate.reset()
+                self.flow.reset()
+        return self._detected(frame, detections)
+
+    def _detected(self, frame, detections):
+        self._last_frame = frame
+        self._last_detections = detections
+        if detections:
+            self._last_results = detections[-1]
+        return detections
+
+    def release(self):
+        self.face_mesh.close()
+        if self.pool:
+            self.pool.close()
@@ -0,0 +1,87 @@
+import time
+from collections import deque
+
+import numpy as np
+
+# Stage boundaries in pipeline order. Each stage's duration is measured from
+# the previous boundary. The profiler's "decode" includes waiting on the
+# driver in read(); the LatencyRecorder stamps "capture" once read() has
+# returned, so its "decode" is only the mirroring.
+STAGES = ("capture", "decode", "convert", "inference", "filter", "actuation")
+
+
+class LatencyRecorder:
+    """Stamps frames at capture and at each stage boundary up to the cursor move.
+
+    Covers the software part of motion-to-photon latency: camera exposure
+    and display scanout happen outside the process and are not included.
+    When the cursor is moved from another thread (the cursor predictor),
+    hand_off() passes the frame to that thread to stamp its "actuation".
+    """
+
+    def __init__(self, max_frames=10000):
+        self.frames = deque(maxlen=max_frames)
+        self.current = None
+
+    def begin_frame(self, timestamp=None):
+        self.current = {"capture": timestamp if timestamp is not None else time.perf_counter()}
+
+    def mark(self, stage):
+        if self.current is not None:
+            self.current[stage] = time.perf_counter()
+
+    def hand_off(self, stage):
+        """Detach the current frame; the returned callback stamps `stage` and keeps it.
+
+        None if there is no frame. A frame whose callback is never called
+        (superseded before the cursor moved) is not recorded.
+        """
+        stamps, self.current = self.current, None
+        if stamps is None:
+            return None
+
+        def finish():
+            stamps[stage] = time.perf_counter()
+            self.frames.append(stamps)
+        return finish
+
+    def end_frame(self):
+        """Keep the frame only if it reached the cursor (no face = no actuation)"""
+        if self.current is not None and "actuation" in self.current:
+            self.frames.append(self.current)
+        self.current = None
+
+    def report(self):
+        """p50/p95/p99 in milliseconds for end-to-end and each stage"""
+        if not self.frames:
+            return {}
+
+        durations = {"end_to_end": []}
+        for stamps in list(self.frames):    # the predictor thread may still be appending
+            durations["end_to_end"].append(stamps["actuation"] - stamps["capture"])
+            previous = stamps["capture"]
+            for stage in STAGES[1:]:
+                if stage in stamps:
+                    durations.setdefault(stage, []).append(stamps[stage] - previous)
+                    previous = stamps[stage]
+
+        report = {}
+        for name, values in durations.items():
+            p50, p95, p99 = np.percentile(values, [50, 95, 99]) * 1000
+            report[name] = {"p50": p50, "p95": p95, "p99": p99, "count": len(values)}
+        return report
+
+    def format_report(self, title="Motion-to-photon latency"):
+        report = self.report()
+        if not report:
+            return f"{title}: no frames reached actuation"
+
+        lines = [
+            f"{title} ({report['end_to_end']['count']} frames)",
+            f"{'stage':<12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}",
+        ]
+        for name in STAGES[1:] + ("end_to_end",):
+            if name in report:
+                r = report[name]
+                lines.append(f"{name:<12}{r['p50']:>9.1f}{r['p95']:>9.1f}{r['p99']:>9.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,248 @@
+import bisect
+import os
+import socketserver
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Latency buckets in seconds, from a fast Face Mesh frame up to a slow LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.02, 0.035, 0.05, 0.075, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0
+        # += is a read-modify-write: the voice workers would lose increments without it
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self.lock:
+            self.value += amount
+
+    def state(self):
+        return self.value
+
+    def load(self, state):
+        with self.lock:
+            self.value = state
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {self.value}",
+        ]
+
+
+class Gauge(Counter):
+    """A value that goes up and down (e.g. a queue depth)"""
+
+    def set(self, value):
+        with self.lock:
+            self.value = value
+
+    def dec(self, amount=1):
+        with self.lock:
+            self.value -= amount
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {self.value}",
+        ]
+
+
+class Histogram:
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.bounds = list(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self):
+        return _HistogramTimer(self)
+
+    def state(self):
+        with self.lock:
+            return list(self.counts), self.sum, self.count
+
+    def load(self, state):
+        with self.lock:
+            self.counts, self.sum, self.count = list(state[0]), state[1], state[2]
+
+    def render(self):
+        # Copy first so the numbers are consistent even while the loop keeps writing
+        counts, total, count = self.state()
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, bucket in zip(self.bounds + ["+Inf"], counts):
+            cumulative += bucket
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {total}")
+        lines.append(f"{self.name}_count {count}")
+        return lines
+
+
+class _HistogramTimer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class MetricsRegistry:
+    """Process-wide counters and histograms for the tracking and voice subsystems.
+
+    Each metric has its own lock, held only for the update itself, so
+    concurrent writers (voice workers, the frame loop) don't lose counts; the
+    scrape thread copies values as it renders them, which never holds a lock
+    for longer than the copy.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+
+        # Tracking (owned by the tracking process, see TRACKING_METRICS)
+        self.frames_captured = Counter("liberate_frames_captured_total", "Frames read from the camera")
+        self.frames_processed = Counter("liberate_frames_processed_total", "Frames run through Face Mesh")
+        self.frames_dropped = Counter("liberate_frames_dropped_total", "Frames lost to failed reads or a slow loop")
+        self.inference_seconds = Histogram("liberate_inference_seconds", "Face Mesh inference time")
+        self.inferences_skipped = Counter(
+            "liberate_inferences_skipped_total", "Face Mesh calls skipped by power saving, the motion gate or optical flow")
+        self.drift_corrections = Counter(
+            "liberate_drift_corrections_total", "Neutral pose adjustments made from rest periods")
+
+        # Actions
+        self.clicks = Counter("liberate_clicks_total", "Mouse clicks issued")
+        self.scrolls = Counter("liberate_scrolls_total", "Scroll events issued")
+        self.keyboard_toggles = Counter("liberate_keyboard_toggles_total", "Virtual keyboard show/hide toggles")
+
+        # Voice
+        self.voice_recognition_seconds = Histogram(
+            "liberate_voice_recognition_seconds", "Speech recognition time per phrase")
+        self.voice_llm_seconds = Histogram("liberate_voice_llm_seconds", "Gemini request time")
+        self.voice_llm_first_chunk_seconds = Histogram(
+            "liberate_voice_llm_first_chunk_seconds", "Time from a streamed Gemini request to its first text")
+        self.voice_errors = Counter("liberate_voice_errors_total", "Voice recognition and LLM errors")
+        self.voice_llm_cache_hits = Counter("liberate_voice_llm_cache_hits_total", "Gemini requests answered from the cache")
+        self.voice_llm_cache_misses = Counter("liberate_voice_llm_cache_misses_total", "Gemini requests sent to the API")
+        self.voice_chars_injected = Counter(
+            "liberate_voice_chars_injected_total", "Characters typed or pasted into Google Docs and VS Code")
+        self.voice_injection_seconds = Histogram(
+            "liberate_voice_injection_seconds", "Time to type or paste one piece of text")
+        self.voice_queue_depth = Gauge(
+            "liberate_voice_queue_depth", "Captured phrases not yet added to the transcript")
+        self.voice_phrase_latency_seconds = Histogram(
+            "liberate_voice_phrase_latency_seconds", "Time from a phrase being captured to its text being added")
+
+    def all(self):
+        return [m for m in vars(self).values() if isinstance(m, (Counter, Histogram))]
+
+    def snapshot(self, names):
+        """Picklable values of the named metrics, for sending to another process"""
+        return {name: getattr(self, name).state() for name in names}
+
+    def load(self, snapshot):
+        for name, state in snapshot.items():
+            getattr(self, name).load(state)
+
+    def render(self):
+        lines = [
+            "# HELP liberate_uptime_seconds Seconds since the app started",
+            "# TYPE liberate_uptime_seconds gauge",
+            f"liberate_uptime_seconds {time.time() - self.started_at:.0f}",
+        ]
+        for metric in self.all():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+# Metrics written by the tracking loop; a tracking process ships these to the
+# UI process, which serves them alongside the voice metrics
+TRACKING_METRICS = (
+    "frames_captured", "frames_processed", "frames_dropped", "inference_seconds",
+    "inferences_skipped", "drift_corrections", "clicks", "scrolls",
+)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = METRICS.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the console
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def start_metrics_server(address):
+    """Serve METRICS on localhost in a daemon thread.
+
+    address is a port ("9464"), "127.0.0.1:9464", or "unix:/path/to.sock".
+    """
+    if address.startswith("unix:"):
+        path = address[len("unix:"):]
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            mode = None
+        if mode is not None:
+            # Only a stale socket from an earlier run is ours to remove
+            if not stat.S_ISSOCK(mode):
+                raise ValueError(f"Metrics socket path exists and is not a socket: {path}")
+            os.unlink(path)
+        server = _UnixHTTPServer(path, _MetricsHandler)
+    else:
+        host, _, port = address.rpartition(":")
+        host = host or "127.0.0.1"
+        if host not in ("127.0.0.1", "localhost"):
+            raise ValueError(f"Metrics endpoint must bind to localhost, got {host}")
+        server = ThreadingHTTPServer((host, int(port)), _MetricsHandler)
+        server.daemon_threads = True
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_from_env():
+    """Start the endpoint if LIBERATE_METRICS is set; returns the server or None"""
+    address = os.getenv("LIBERATE_METRICS")
+    if not address:
+        return None
+    try:
+        return start_metrics_server(address)
+    except (OSError, ValueError) as e:
+        print(f"Could not start metrics endpoint on {address}: {e}")
+        return None
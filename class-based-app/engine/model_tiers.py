@@ -0,0 +1,49 @@
+from collections import namedtuple
+
+ModelTier = namedtuple("ModelTier", ["name", "landmark_count", "options"])
+
+# Cheapest first. The iris tier runs an extra refinement model around the
+# eyes and lips and adds landmarks 468-477.
+TIERS = [
+    ModelTier("mesh", 468, {"refine_landmarks": False}),
+    ModelTier("mesh_iris", 478, {"refine_landmarks": True}),
+]
+
+BASE_OPTIONS = dict(
+    max_num_faces=1,
+    min_detection_confidence=0.5,
+    min_tracking_confidence=0.5
+)
+
+IRIS_LANDMARKS = frozenset(range(468, 478))
+
+# Landmarks each gesture/feature reads
+FEATURE_LANDMARKS = {
+    "cursor": frozenset({1}),
+    "click": frozenset({13, 14, 10, 152}),
+    "scroll": frozenset({123, 352, 61, 291, 234, 454, 159, 386, 145, 374, 33, 133, 362, 263}),
+    "motion_gate": frozenset({10, 152, 234, 454, 61, 291, 13, 14, 0, 17,
+                              33, 133, 159, 145, 362, 263, 386, 374}),
+    "gaze_pointer": IRIS_LANDMARKS | frozenset({1, 33, 133, 159, 145, 362, 263, 386, 374}),
+}
+
+
+def required_landmarks(features):
+    needed = set()
+    for feature in features:
+        needed |= FEATURE_LANDMARKS[feature]
+    return needed
+
+
+def select_tier(features):
+    """Cheapest tier that produces every landmark the enabled features read"""
+    needed = required_landmarks(features)
+    highest = max(needed) if needed else 0
+    for tier in TIERS:
+        if highest < tier.landmark_count:
+            return tier
+    return TIERS[-1]
+
+
+def face_mesh_options(tier):
+    return dict(BASE_OPTIONS, **tier.options)
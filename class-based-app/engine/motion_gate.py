@@ -0,0 +1,106 @@
+import cv2
+import numpy as np
+
+from engine.buffers import FrameBuffers
+
+# Landmarks bounding each region that is diffed before inference
+FACE_REGION = (10, 152, 234, 454)            # forehead, chin, ear to ear
+MOUTH_REGION = (61, 291, 13, 14, 0, 17)      # corners, inner lips, outer lips
+LEFT_EYE_REGION = (33, 133, 159, 145)
+RIGHT_EYE_REGION = (362, 263, 386, 374)
+
+
+class MotionGate:
+    """Skips Face Mesh when the face hasn't moved since the last inference.
+
+    The face region is compared at low resolution (48x48 grayscale) to catch
+    head motion, while the mouth and both eyes are compared separately at a
+    higher relative resolution, so a mouth opening or a blink always forces a
+    fresh inference even if the head is perfectly still.
+    """
+
+    # name: (landmarks, patch size (w, h), padding as a fraction of the box)
+    REGIONS = {
+        "face": (FACE_REGION, (48, 48), 0.1),
+        "mouth": (MOUTH_REGION, (32, 16), 0.4),
+        "left_eye": (LEFT_EYE_REGION, (24, 12), 0.5),
+        "right_eye": (RIGHT_EYE_REGION, (24, 12), 0.5),
+    }
+
+    def __init__(self, enabled=True, face_threshold=2.0, region_threshold=3.0, max_skips=5):
+        self.enabled = enabled
+        self.face_threshold = face_threshold      # mean abs grayscale change, 0-255
+        self.region_threshold = region_threshold
+        self.max_skips = max_skips                # force a refresh so drift can't build up
+        self.buffers = FrameBuffers()
+        self.checked = 0
+        self.skipped = 0
+        self.reset()
+
+    def reset(self):
+        self.boxes = None
+        self.consecutive_skips = 0
+
+    def _patch(self, frame, name, box):
+        x0, y0, x1, y1 = box
+        size = self.REGIONS[name][1]
+        small = cv2.resize(frame[y0:y1, x0:x1], size,
+                           dst=self.buffers.get(name + "_small", (size[1], size[0], 3)),
+                           interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY,
+                            dst=self.buffers.get(name, (size[1], size[0])))
+
+    def _box(self, landmarks, indices, padding, width, height):
+        xs = [landmarks[i].x for i in indices]
+        ys = [landmarks[i].y for i in indices]
+        pad_x = (max(xs) - min(xs)) * padding
+        pad_y = (max(ys) - min(ys)) * padding
+        x0 = int(max(0.0, min(xs) - pad_x) * width)
+        y0 = int(max(0.0, min(ys) - pad_y) * height)
+        x1 = int(min(1.0, max(xs) + pad_x) * width)
+        y1 = int(min(1.0, max(ys) + pad_y) * height)
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        return x0, y0, x1, y1
+
+    def should_skip(self, frame):
+        """True if the last landmarks can be reused for this frame"""
+        if not self.enabled or self.boxes is None:
+            return False
+        self.checked += 1
+        if self.consecutive_skips >= self.max_skips:
+            return False
+
+        for name, box in self.boxes.items():
+            patch = self._patch(frame, name, box)
+            reference = self.buffers.get(name + "_ref", patch.shape)
+            change = cv2.norm(patch, reference, cv2.NORM_L1) / patch.size
+            threshold = self.face_threshold if name == "face" else self.region_threshold
+            if change > threshold:
+                return False
+
+        self.consecutive_skips += 1
+        self.skipped += 1
+        return True
+
+    def update(self, frame, landmarks):
+        """Store reference patches from a frame that just went through Face Mesh"""
+        if not self.enabled:
+            return
+        self.consecutive_skips = 0
+        height, width = frame.shape[:2]
+
+        boxes = {}
+        for name, (indices, _, padding) in self.REGIONS.items():
+            box = self._box(landmarks, indices, padding, width, height)
+            if box is None:
+                # Face too small or off-frame; don't gate on a partial view
+                self.boxes = None
+                return
+            boxes[name] = box
+            patch = self._patch(frame, name, box)
+            np.copyto(self.buffers.get(name + "_ref", patch.shape), patch)
+        self.boxes = boxes
+
+    def skip_rate(self):
+        return self.skipped / self.checked if self.checked else 0.0
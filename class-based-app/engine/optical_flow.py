@@ -0,0 +1,132 @@
+import cv2
+import numpy as np
+
+from engine.buffers import FrameBuffers
+from engine.facemesh_pool import Landmark
+
+# Points propagated between keyframes: nose tip, lips and mouth corners, eye
+# lids and corners, cheeks, plus forehead/chin for the face height used by
+# detect_mouth_open
+KEY_POINTS = (1, 13, 14, 61, 291, 159, 145, 386, 374, 33, 133, 362, 263, 123, 352, 10, 152)
+
+
+class LandmarkFlowTracker:
+    """Propagates Face Mesh landmarks between keyframes with pyramidal LK flow.
+
+    Key points are tracked on a small grayscale patch around the face. The
+    remaining landmarks follow the median motion of the key points, so every
+    landmark index stays valid for the gesture code. A forward-backward check
+    (track forward, then back, compare with the start) rejects bad flow and
+    asks for a fresh Face Mesh keyframe.
+    """
+
+    def __init__(self, enabled=True, patch_width=160, fb_threshold=1.0, max_interval=6):
+        self.enabled = enabled
+        self.patch_width = patch_width      # face patch is resized to this width
+        self.fb_threshold = fb_threshold    # max forward-backward error, patch pixels
+        self.max_interval = max_interval    # force a keyframe at least this often
+        self.lk_params = dict(
+            winSize=(15, 15),
+            maxLevel=2,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03)
+        )
+        self.buffers = FrameBuffers()
+        self.keyframes = 0
+        self.tracked = 0
+        self.reset()
+
+    def reset(self):
+        self.roi = None
+        self.previous = None
+        self.points = None
+        self.landmarks = None
+        self.since_keyframe = 0
+
+    def _patch(self, frame, name):
+        x0, y0, x1, y1 = self.roi
+        small = cv2.resize(frame[y0:y1, x0:x1], self.patch_size,
+                           dst=self.buffers.get(name + "_small", (self.patch_size[1], self.patch_size[0], 3)),
+                           interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY,
+                            dst=self.buffers.get(name, (self.patch_size[1], self.patch_size[0])))
+
+    def keyframe(self, frame, landmarks):
+        """Start propagating from a fresh Face Mesh result"""
+        if not self.enabled:
+            return
+        height, width = frame.shape[:2]
+        xs = np.array([lm.x for lm in landmarks])
+        ys = np.array([lm.y for lm in landmarks])
+
+        # Face box with room for the head to move until the next keyframe
+        pad_x = (xs.max() - xs.min()) * 0.3
+        pad_y = (ys.max() - ys.min()) * 0.3
+        x0 = int(max(0.0, xs.min() - pad_x) * width)
+        y0 = int(max(0.0, ys.min() - pad_y) * height)
+        x1 = int(min(1.0, xs.max() + pad_x) * width)
+        y1 = int(min(1.0, ys.max() + pad_y) * height)
+        if x1 - x0 < 16 or y1 - y0 < 16:
+            self.reset()
+            return
+
+        self.roi = (x0, y0, x1, y1)
+        self.scale = self.patch_width / (x1 - x0)
+        self.patch_size = (self.patch_width, max(16, int((y1 - y0) * self.scale)))
+        self.frame_size = (width, height)
+
+        previous = self._patch(frame, "gray")
+        self.previous = self.buffers.get("previous", previous.shape)
+        np.copyto(self.previous, previous)
+        self.points = np.array(
+            [self._to_patch(landmarks[i].x, landmarks[i].y) for i in KEY_POINTS], dtype=np.float32
+        ).reshape(-1, 1, 2)
+        self.landmarks = list(landmarks)
+        self.since_keyframe = 0
+        self.keyframes += 1
+
+    def _to_patch(self, x, y):
+        return ((x * self.frame_size[0] - self.roi[0]) * self.scale,
+                (y * self.frame_size[1] - self.roi[1]) * self.scale)
+
+    def _to_normalized(self, px, py):
+        return ((px / self.scale + self.roi[0]) / self.frame_size[0],
+                (py / self.scale + self.roi[1]) / self.frame_size[1])
+
+    def track(self, frame):
+        """Propagated landmarks for this frame, or None if a keyframe is needed"""
+        if not self.enabled or self.points is None:
+            return None
+        if self.since_keyframe >= self.max_interval or frame.shape[1::-1] != self.frame_size:
+            return None
+
+        current = self._patch(frame, "gray")
+        forward, status, _ = cv2.calcOpticalFlowPyrLK(self.previous, current, self.points, None, **self.lk_params)
+        if forward is None or not status.all():
+            return None
+        backward, back_status, _ = cv2.calcOpticalFlowPyrLK(current, self.previous, forward, None, **self.lk_params)
+        if backward is None or not back_status.all():
+            return None
+        fb_error = np.abs(backward - self.points).reshape(-1, 2).max(axis=1)
+        if fb_error.max() > self.fb_threshold:
+            return None
+
+        # Key points move exactly; everything else follows their median motion
+        moved = [self._to_normalized(px, py) for px, py in forward.reshape(-1, 2)]
+        starts = [(self.landmarks[i].x, self.landmarks[i].y) for i in KEY_POINTS]
+        dx = float(np.median([m[0] - s[0] for m, s in zip(moved, starts)]))
+        dy = float(np.median([m[1] - s[1] for m, s in zip(moved, starts)]))
+
+        landmarks = [Landmark(lm.x + dx, lm.y + dy, lm.z) for lm in self.landmarks]
+        for index, (x, y) in zip(KEY_POINTS, moved):
+            landmarks[index] = Landmark(x, y, self.landmarks[index].z)
+
+        np.copyto(self.previous, current)
+        self.points = forward
+        self.landmarks = landmarks
+        self.since_keyframe += 1
+        self.tracked += 1
+        return landmarks
+
+    def keyframe_rate(self):
+        total = self.keyframes + self.tracked
+        return self.keyframes / total if total else 0.0
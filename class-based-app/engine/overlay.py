@@ -0,0 +1,57 @@
+import cv2
+
+from engine.power import ABSENT
+
+
+def _text(frame, text, origin, color, scale=0.6, thickness=1):
+    cv2.putText(frame, text, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+
+
+def draw_tracking_overlay(frame, result, engine, keyboard_visible=None):
+    """Draw the tracking state of one frame onto the preview (BGR, in place)"""
+    height, width = frame.shape[:2]
+
+    if not result.face_found:
+        if result.calibrating:
+            _text(frame, "No face detected! Please look at the camera", (20, 50), (0, 0, 255), 0.7, 2)
+        else:
+            _text(frame, "Face not detected", (20, 50), (0, 0, 255), 0.7, 2)
+        if engine.power.state == ABSENT:
+            _text(frame, "Power saving - waiting for face", (20, 80), (0, 165, 255))
+        return
+
+    nose_pixel = (int(result.nose[0] * width), int(result.nose[1] * height))
+    if result.calibrating:
+        _text(frame, f"Calibrating: {engine.calibrator.count}/{engine.calibrator.frames}",
+              (20, 50), (0, 255, 0), 0.7, 2)
+        cv2.circle(frame, nose_pixel, 5, (0, 255, 0), -1)
+        return
+
+    neutral = engine.calibrator
+    cv2.circle(frame, nose_pixel, 5, (0, 255, 0), -1)
+    cv2.circle(frame, (int(neutral.neutral_x * width), int(neutral.neutral_y * height)), 3, (0, 0, 255), -1)
+
+    status_y = 80
+    if result.mouth_open:
+        _text(frame, "Mouth: OPEN", (20, status_y), (0, 255, 0), thickness=2)
+    else:
+        _text(frame, "Mouth: closed", (20, status_y), (255, 0, 0))
+    status_y += 30
+
+    if keyboard_visible is not None:
+        if keyboard_visible:
+            _text(frame, "Keyboard: ACTIVE", (20, status_y), (0, 255, 0), thickness=2)
+        else:
+            _text(frame, "Keyboard: inactive", (20, status_y), (255, 0, 0))
+        status_y += 30
+
+    if result.scroll_mode:
+        _text(frame, "SCROLL MODE: ON", (20, status_y), (0, 255, 255), thickness=2)
+
+    # Visual feedback for scrolling action
+    if result.scroll_velocity > 0:
+        _text(frame, f"SCROLLING UP {result.scroll_velocity:.0f}/s", (width // 2 - 100, height - 50),
+              (0, 255, 255), 0.7, 2)
+    elif result.scroll_velocity < 0:
+        _text(frame, f"SCROLLING DOWN {-result.scroll_velocity:.0f}/s", (width // 2 - 100, height - 50),
+              (0, 255, 255), 0.7, 2)
@@ -0,0 +1,373 @@
+import copy
+import time
+
+import cv2
+
+from engine.actuator import PyAutoGuiActuator
+from engine.ballistics import PointerBallistics
+from engine.buffers import FrameBuffers
+from engine.camera import open_camera
+from engine.cursor_predictor import CursorPredictor
+from engine.drift import DriftCorrector
+from engine.filters import FILTERS, Calibrator
+from engine.gaze import GazePointer, GAZE_JUMP
+from engine.gestures import MouthGestures, ScrollGesture, CLICK
+from engine.landmarks import LandmarkDetector, NOSE_TIP
+from engine.metrics import METRICS
+from engine.profiling import FrameProfiler
+from engine.scroller import ScrollEngine
+
+CALIBRATED = "calibrated"
+
+
+class TrackingResult:
+    """What the engine made of one frame, for the front end to draw or act on"""
+
+    def __init__(self):
+        self.face_found = False
+        self.landmarks = None
+        self.nose = None                # normalized (x, y)
+        self.calibrating = False
+        self.cursor = None              # screen (x, y) after filtering and clamping
+        self.mouth_open = False
+        self.mouth_ratio = 0.0
+        self.scroll_mode = False
+        self.scroll_velocity = 0.0      # wheel units per second, positive = up
+        self.events = []                # CLICK, TOGGLE_KEYBOARD, CALIBRATED, GAZE_JUMP
+
+
+class TrackingEngine:
+    """Headless capture -> landmarks -> filters -> gestures -> actions pipeline.
+
+    Both front ends drive it: they hand it frames (or let it read them with
+    read_frame()), call process() and draw the returned TrackingResult.
+    Mouse actions go straight to the actuator; anything that needs the UI,
+    like the keyboard toggle, comes back as an event.
+    """
+
+    def __init__(self, actuator=None, features=("cursor", "click", "scroll"), smoothing="average",
+                 smoothing_factor=10, sensitivity=3.5, safe_margin=15, cursor_hz=0, workers=0,
+                 power_save=True, motion_gate=True, optical_flow=False, toggle_cooldown=2.0,
+                 scroll_source="gaze", scroll_hz=60, pointer_mode="head",
+                 gain_curve=None, drift_correction=False):
+        # Mouse output (FakeActuator for replay runs)
+        self.actuator = actuator or PyAutoGuiActuator()
+        self.screen_width, self.screen_height = self.actuator.size()
+        self.sensitivity = sensitivity
+        self.safe_margin = safe_margin
+
+        # Frame timing: profiler for the debug panel, optional LatencyRecorder
+        self.profiler = FrameProfiler()
+        self.latency = None
+        self.debug_info = {}
+        self.buffers = FrameBuffers()
+
+        # "gaze" mode needs the iris landmarks, so it selects the refined model tier
+        if pointer_mode not in ("head", "gaze"):
+            raise ValueError(f"Unknown pointer mode: {pointer_mode}")
+        features = set(features)
+        if pointer_mode == "gaze":
+            features.add("gaze_pointer")
+        self.detector = LandmarkDetector(
+            features, workers=workers, power_save=power_save, motion_gate=motion_gate,
+            optical_flow=optical_flow, profiler=self.profiler, mark_stage=self.mark_stage
+        )
+        self.power = self.detector.power
+        self.power.on_state_change = self.on_power_state_change
+
+        self.calibrator = Calibrator()
+        self.filter = FILTERS[smoothing](smoothing_factor)
+        self.mouth = MouthGestures(toggle_cooldown=toggle_cooldown)
+        self.gaze_pointer = GazePointer(self.actuator.size()) if pointer_mode == "gaze" else None
+        # None keeps the linear absolute mapping; a preset name enables pointer acceleration
+        self.ballistics = PointerBallistics(self.actuator.size(), gain_curve) if gain_curve else None
+        self.drift = DriftCorrector() if drift_correction else None
+        self.scroll = None
+        self.scroller = None
+        if "scroll" in features:
+            self.scroll = ScrollGesture(source=scroll_source)
+            # Own scheduler thread: small wheel steps at scroll_hz, independent of clicks
+            self.scroller = ScrollEngine(self.actuator, rate_hz=scroll_hz)
+
+        # Cursor thread at display rate, interpolating between Face Mesh results
+        self.cursor_predictor = None
+        if cursor_hz > 0:
+            self.cursor_predictor = CursorPredictor(
+                self.actuator,
+                rate_hz=cursor_hz,
+                bounds=(safe_margin, safe_margin,
+                        self.screen_width - safe_margin, self.screen_height - safe_margin)
+            )
+
+        # Capture source and its frame interval, used to spot frames the driver overwrote
+        self.cap = None
+        self.camera_fps = 0
+        self.frame_interval = None
+        self._last_frame_start = None
+        # Returned again (without events) when the Face Mesh pool releases nothing
+        self._last_result = None
+        # perf_counter capture time of the newest result fed to the cursor predictor
+        self._predicted_at = None
+
+    @property
+    def calibrated(self):
+        return self.calibrator.calibrated
+
+    @property
+    def features(self):
+        return self.detector.features
+
+    def set_feature(self, feature, enabled):
+        self.detector.set_feature(feature, enabled)
+
+    def set_pointer_mode(self, mode):
+        """"head": head position maps to the screen; "gaze": eyes jump, head fine-tunes"""
+        if mode not in ("head", "gaze"):
+            raise ValueError(f"Unknown pointer mode: {mode}")
+        self.set_feature("gaze_pointer", mode == "gaze")
+        if mode == "gaze":
+            self.gaze_pointer = GazePointer(self.actuator.size())
+            if self.calibrator.neutral_gaze is None:
+                # Calibrated without iris landmarks; the straight-ahead gaze is needed
+                self.recalibrate()
+        else:
+            self.gaze_pointer = None
+            self.filter.reset()
+
+    def set_gain_curve(self, curve):
+        """Preset name (or control points) for pointer acceleration; None for the linear mapping"""
+        self.ballistics = PointerBallistics(self.actuator.size(), curve) if curve else None
+
+    def warm_up(self, shape=(480, 640, 3)):
+        """Initialize the Face Mesh graph ahead of the first frame (not counted in metrics)"""
+        self.detector.warm_up(shape)
+
+    # ---- capture ----
+
+    def open_camera(self, device=0, reprobe=False):
+        """Open the webcam in its cached low-latency mode; returns the capture"""
+        return self.attach(open_camera(device, reprobe=reprobe))
+
+    def attach(self, cap):
+        """Use an already opened capture (webcam or ReplayCapture)"""
+        self.cap = cap
+        self.camera_fps = cap.get(cv2.CAP_PROP_FPS) if cap.isOpened() else 0
+        self.frame_interval = 1.0 / self.camera_fps if self.camera_fps > 0 else None
+        return cap
+
+    def read_frame(self, dst=None):
+        """Begin a frame, read it into the shared buffer and mirror it; None if the read failed.
+
+        dst, if its shape matches, receives the mirrored frame instead of the
+        engine's own buffer (e.g. a shared-memory preview slot).
+        """
+        self.begin_frame()
+        ret, raw = self.buffers.read_into(self.cap)
+        if not ret:
+            self.drop_frame()
+            return None
+        # Latency starts when the frame is in hand, not while read() waits on the driver
+        if self.latency:
+            self.latency.begin_frame()
+        METRICS.frames_captured.inc()
+        if dst is None or dst.shape != raw.shape:
+            dst = self.buffers.get("frame", raw.shape)
+        frame = cv2.flip(raw, 1, dst=dst)
+        self.mark_stage("decode")
+        return frame
+
+    def on_power_state_change(self, state):
+        """Lower camera fps while idle/absent, restore the negotiated rate when active"""
+        if self.cap is None:
+            return
+        fps = self.power.camera_fps[state] or self.camera_fps
+        if fps and fps > 0:
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+            self.frame_interval = 1.0 / fps
+
+    @property
+    def loop_delay_ms(self):
+        return self.power.loop_delay_ms[self.power.state]
+
+    # ---- frame timing ----
+
+    def begin_frame(self):
+        """Start stage timing for a newly captured frame"""
+        now = time.perf_counter()
+        if self._last_frame_start and self.frame_interval:
+            missed = int((now - self._last_frame_start) / self.frame_interval + 0.5) - 1
+            if missed > 0:
+                self.drop_frame(missed)
+        self._last_frame_start = now
+        self.detector.new_frame()
+        self.profiler.begin_frame()
+
+    def drop_frame(self, count=1):
+        METRICS.frames_dropped.inc(count)
+        self.profiler.drop(count)
+
+    def mark_stage(self, stage):
+        if self.latency:
+            self.latency.mark(stage)
+        self.profiler.mark(stage)
+
+    def end_frame(self):
+        self.detector.new_frame()
+        if self.latency:
+            self.latency.end_frame()
+        self.profiler.end_frame()
+
+    def update_debug_info(self):
+        """Refresh debug_info from the profiler's rolling stats"""
+        self.debug_info = self.profiler.summary() if self.profiler.enabled else {}
+        return self.debug_info
+
+    # ---- control ----
+
+    def start(self):
+        if self.cursor_predictor:
+            self.cursor_predictor.start()
+        if self.scroller:
+            self.scroller.start()
+
+    def stop(self):
+        if self.cursor_predictor:
+            self.cursor_predictor.stop()
+        if self.scroller:
+            self.scroller.stop()
+
+    def recalibrate(self):
+        self.calibrator.reset()
+        self.filter.reset()
+        self.mouth.reset()
+        if self.gaze_pointer:
+            self.gaze_pointer.reset()
+        if self.ballistics:
+            self.ballistics.reset()
+        if self.drift:
+            self.drift.reset()
+        if self.scroll:
+            self.scroll.reset()
+            self.scroller.reset()
+
+    # ---- processing ----
+
+    def process(self, frame, actions=True, now=None):
+        """Run one frame through the pipeline.
+
+        With actions=False (paused) the frame is still tracked and gestures
+        are still reported, but the mouse isn't touched. With the Face Mesh
+        pool a frame can release several results (each runs the filters and
+        gestures in capture order, events are merged) or none (the previous
+        state comes back without events).
+        """
+        now = now if now is not None else time.time()
+        detections = self.detector.detect(frame)
+        if not detections:
+            if self._last_result is None:
+                result = TrackingResult()
+                result.calibrating = not self.calibrated
+                return result
+            result = copy.copy(self._last_result)
+            result.events = []
+            return result
+
+        events = []
+        for results in detections:
+            # Gesture timing follows when the frame was captured, not when the pool released it
+            timestamp = getattr(results, "timestamp", None)
+            captured_at = timestamp if timestamp is not None else time.perf_counter()
+            captured = now - (time.perf_counter() - captured_at)
+            result = self._track(results, actions, captured, captured_at)
+            events.extend(result.events)
+        result.events = events
+        self._last_result = result
+        return result
+
+    def _track(self, results, actions, now, captured_at):
+        result = TrackingResult()
+        if not results.multi_face_landmarks:
+            result.calibrating = not self.calibrated
+            return result
+
+        landmarks = results.multi_face_landmarks[0].landmark
+        nose = landmarks[NOSE_TIP]
+        result.face_found = True
+        result.landmarks = landmarks
+        result.nose = (nose.x, nose.y)
+
+        if not self.calibrated:
+            result.calibrating = True
+            if self.calibrator.add(landmarks):
+                self.filter.reset()
+                result.events.append(CALIBRATED)
+            return result
+
+        # Filters: neutral pose -> screen target -> smoothing -> safe margin
+        target = None
+        if self.gaze_pointer:
+            jumps = self.gaze_pointer.jumps
+            target = self.gaze_pointer.update(landmarks, self.calibrator, now)
+            if self.gaze_pointer.jumps != jumps:
+                # Snap to the new region instead of smoothing across the screen
+                self.filter.reset()
+                result.events.append(GAZE_JUMP)
+        if target is None and self.ballistics:
+            target = self.ballistics.update((nose.x, nose.y), self.calibrator, self.sensitivity, now)
+        if target is None:
+            offset_x = (nose.x - self.calibrator.neutral_x) * self.sensitivity
+            offset_y = (nose.y - self.calibrator.neutral_y) * self.sensitivity
+            target = (self.screen_width * (0.5 + offset_x), self.screen_height * (0.5 + offset_y))
+        smoothed_x, smoothed_y = self.filter.apply(*target)
+        margin = self.safe_margin
+        cursor_x = int(max(margin, min(smoothed_x, self.screen_width - margin)))
+        cursor_y = int(max(margin, min(smoothed_y, self.screen_height - margin)))
+        result.cursor = (cursor_x, cursor_y)
+        self.mark_stage("filter")
+
+        # Gestures
+        result.mouth_open, mouth_events = self.mouth.update(landmarks, now)
+        result.events.extend(mouth_events)
+        result.mouth_ratio = self.mouth.ratio
+        if self.scroll:
+            result.scroll_velocity = self.scroll.update(landmarks, self.calibrator)
+            result.scroll_mode = self.scroll.active
+
+        # Background recalibration from rest periods (puffed cheeks aren't rest)
+        if self.drift:
+            puffing = self.scroll is not None and self.scroll.inflation_frames > 0
+            self.drift.update(landmarks, self.calibrator, now, self.sensitivity,
+                              busy=result.mouth_open or puffing)
+
+        if actions:
+            self._act(result, captured_at)
+        return result
+
+    def _act(self, result, captured_at):
+        """Actions: cursor and clicks go straight to the actuator, scrolling to its scheduler"""
+        if self.cursor_predictor:
+            # Velocity comes from capture times: results the pool releases together
+            # are really a frame apart, and a result reused while idle is not new
+            if self._predicted_at is None or captured_at > self._predicted_at:
+                # The cursor moves later, on the predictor thread: the frame's latency ends there
+                on_move = self.latency.hand_off("actuation") if self.latency else None
+                self.cursor_predictor.update(*result.cursor, timestamp=captured_at, on_move=on_move)
+                self._predicted_at = captured_at
+            self.profiler.mark("actuation")
+        else:
+            self.actuator.move_to(*result.cursor)
+            self.mark_stage("actuation")
+
+        for event in result.events:
+            if event == CLICK:
+                self.actuator.click()
+        if self.scroller:
+            self.scroller.update(result.scroll_velocity)
+
+    def release(self):
+        """Clean up resources"""
+        self.stop()
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        self.detector.release()
@@ -0,0 +1,133 @@
+import time
+
+import cv2
+
+from engine.buffers import FrameBuffers
+
+ACTIVE = "active"
+IDLE = "idle"
+ABSENT = "absent"
+
+
+class PowerManager:
+    """Active / idle / absent power states for the tracker.
+
+    - active: face present and moving, Face Mesh on every frame
+    - idle: face present but still for `idle_after` seconds, Face Mesh on
+      every `idle_stride`-th frame
+    - absent: no face for `absent_after` seconds, Face Mesh only on an
+      exponential retry schedule (retry_min doubling up to retry_max)
+
+    Every frame a 32x24 grayscale thumbnail is compared with the one from the
+    last inference. A large change (someone sits down, the head moves) runs
+    Face Mesh on that frame, so full rate resumes on the first frame the face
+    is back.
+    """
+
+    THUMB_SIZE = (32, 24)
+
+    def __init__(self, enabled=True, idle_after=5.0, absent_after=1.0, idle_stride=2,
+                 retry_min=0.1, retry_max=2.0, still_threshold=0.004, wake_threshold=8.0):
+        self.enabled = enabled
+        self.idle_after = idle_after
+        self.absent_after = absent_after
+        self.idle_stride = idle_stride
+        self.retry_min = retry_min
+        self.retry_max = retry_max
+        self.still_threshold = still_threshold  # nose movement, normalized coords
+        self.wake_threshold = wake_threshold    # mean abs thumbnail change, 0-255
+
+        # Camera fps and UI loop delay per state (None = leave the negotiated fps)
+        self.camera_fps = {ACTIVE: None, IDLE: 15, ABSENT: 5}
+        self.loop_delay_ms = {ACTIVE: 10, IDLE: 20, ABSENT: 50}
+
+        self.on_state_change = None
+        self.buffers = FrameBuffers()
+        self.reset()
+
+    def reset(self):
+        self.state = ACTIVE
+        self.frame_count = 0
+        self.last_motion_time = time.time()
+        self.last_nose = None
+        self.absent_since = None
+        self.retry_delay = self.retry_min
+        self.next_retry = 0.0
+        self.reference = None
+        self.skipped = 0
+
+    def _thumbnail(self, frame):
+        small = cv2.resize(frame, self.THUMB_SIZE, dst=self.buffers.get("small", (24, 32, 3)),
+                           interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=self.buffers.get("thumb", (24, 32)))
+
+    def should_infer(self, frame, now=None):
+        """Decide before inference whether this frame needs Face Mesh"""
+        if not self.enabled:
+            return True
+        now = now if now is not None else time.time()
+        self.frame_count += 1
+
+        thumb = self._thumbnail(frame)
+        if self.state == ACTIVE or self.reference is None:
+            return True
+
+        # Wake check: a big scene change always gets a fresh inference
+        change = cv2.norm(thumb, self.reference, cv2.NORM_L1) / thumb.size
+        if change > self.wake_threshold:
+            return True
+
+        if self.state == IDLE:
+            infer = self.frame_count % self.idle_stride == 0
+        else:
+            infer = now >= self.next_retry
+        if not infer:
+            self.skipped += 1
+        return infer
+
+    def update(self, face_found, nose=None, now=None):
+        """Feed an inference result back in; may change state"""
+        if not self.enabled:
+            return
+        now = now if now is not None else time.time()
+
+        # Reference for the wake check is the frame we last inferred on
+        thumb = self.buffers.get("thumb", (24, 32))
+        reference = self.buffers.get("reference", thumb.shape)
+        reference[:] = thumb
+        self.reference = reference
+
+        if face_found:
+            self.absent_since = None
+            self.retry_delay = self.retry_min
+            moved = (self.last_nose is None or
+                     abs(nose[0] - self.last_nose[0]) + abs(nose[1] - self.last_nose[1]) > self.still_threshold)
+            self.last_nose = nose
+            if moved or self.state == ABSENT:
+                self.last_motion_time = now
+                self._set_state(ACTIVE)
+            elif now - self.last_motion_time > self.idle_after:
+                self._set_state(IDLE)
+            return
+
+        if self.absent_since is None:
+            self.absent_since = now
+        if now - self.absent_since > self.absent_after:
+            self._set_state(ABSENT)
+        if self.state == ABSENT:
+            self.next_retry = now + self.retry_delay
+            self.retry_delay = min(self.retry_delay * 2, self.retry_max)
+
+    def _set_state(self, state):
+        if state == self.state:
+            return
+        self.state = state
+        if state == ACTIVE:
+            self.retry_delay = self.retry_min
+        if self.on_state_change:
+            self.on_state_change(state)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self._set_state(ACTIVE)
+        self.reset()
@@ -0,0 +1,79 @@
+import time
+from collections import deque
+
+from engine.latency import STAGES
+
+
+class FrameProfiler:
+    """Rolling per-stage timings, FPS, dropped frames and face detection rate.
+
+    Every hook returns immediately unless enabled, so it can stay wired into
+    the frame loop permanently.
+    """
+
+    def __init__(self, window=120, enabled=False):
+        self.enabled = enabled
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.stage_times = {stage: deque(maxlen=self.window) for stage in STAGES[1:]}
+        self.frame_times = deque(maxlen=self.window)
+        self.face_found = deque(maxlen=self.window)
+        self.dropped = 0
+        self._last = None
+
+    def set_enabled(self, enabled):
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame_times.append(now)
+        self._last = now
+
+    def mark(self, stage):
+        if not self.enabled or self._last is None:
+            return
+        now = time.perf_counter()
+        self.stage_times[stage].append(now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        self._last = None
+
+    def record_face(self, found):
+        if self.enabled:
+            self.face_found.append(found)
+
+    def drop(self, count=1):
+        if self.enabled:
+            self.dropped += count
+
+    def summary(self):
+        """Rolling averages over the last `window` frames"""
+        summary = {"fps": 0.0, "dropped": self.dropped, "stages_ms": {}}
+        if len(self.frame_times) > 1:
+            span = self.frame_times[-1] - self.frame_times[0]
+            if span > 0:
+                summary["fps"] = (len(self.frame_times) - 1) / span
+        for stage, times in self.stage_times.items():
+            if times:
+                summary["stages_ms"][stage] = 1000 * sum(times) / len(times)
+        # The Face Mesh solution API exposes no per-face score, so the share of
+        # frames with a detected face stands in for inference confidence
+        if self.face_found:
+            summary["face_rate"] = sum(self.face_found) / len(self.face_found)
+        return summary
+
+    def format_summary(self):
+        summary = self.summary()
+        lines = [f"FPS:      {summary['fps']:5.1f}", f"Dropped:  {summary['dropped']:5d}"]
+        if "face_rate" in summary:
+            lines.append(f"Face:     {summary['face_rate'] * 100:5.0f}%")
+        for stage, ms in summary["stages_ms"].items():
+            lines.append(f"{stage + ':':<10}{ms:5.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,64 @@
+import time
+
+import cv2
+
+
+class ReplayCapture:
+    """Plays a recorded session back through the cv2.VideoCapture interface.
+
+    With realtime=True frames are released at the recorded frame rate and,
+    like a webcam with a 1-frame buffer, frames the consumer was too slow
+    for are dropped rather than queued.
+    """
+
+    def __init__(self, path, realtime=True, loop=False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_interval = 1.0 / self.fps
+        self.start_time = None
+        self.frame_index = 0
+        self.dropped = 0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def read(self, image=None):
+        if self.realtime:
+            now = time.perf_counter()
+            if self.start_time is None:
+                self.start_time = now
+            due_index = int((now - self.start_time) / self.frame_interval)
+
+            # Skip frames a live camera would have overwritten
+            while self.frame_index < due_index:
+                if not self._grab():
+                    return False, None
+                self.dropped += 1
+
+            # Wait for the next frame to be "captured"
+            wait = self.start_time + self.frame_index * self.frame_interval - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+        ret, frame = self.cap.read(image)
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read(image)
+        if ret:
+            self.frame_index += 1
+        return ret, frame
+
+    def _grab(self):
+        if self.cap.grab():
+            self.frame_index += 1
+            return True
+        return False
+
+    def release(self):
+        self.cap.release()
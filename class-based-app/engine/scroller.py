@@ -0,0 +1,86 @@
+import threading
+import time
+
+
+class ScrollEngine:
+    """Turns a scroll velocity into small, frequent wheel steps on its own thread.
+
+    The tracker sets a velocity (wheel units per second, positive = up) every
+    frame. A scheduler thread at `rate_hz` adds velocity * dt to an accumulator
+    and emits only its whole part, carrying the fraction to the next tick, so
+    slow speeds still creep (one unit every few ticks) and fast ones stay smooth.
+    Without the thread, update() steps inline once per frame.
+    """
+
+    def __init__(self, actuator, rate_hz=60, stale_after=0.25):
+        self.actuator = actuator
+        self.interval = 1.0 / rate_hz
+        self.stale_after = stale_after      # no velocity update for this long = stop
+
+        self.lock = threading.Lock()
+        self.running = False
+        self.thread = None
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.velocity = 0.0
+            self.updated_at = None
+            self.accumulated = 0.0
+            self.last_step = None
+
+    def update(self, velocity, now=None):
+        """Set the current scroll velocity from the latest frame"""
+        now = now if now is not None else time.perf_counter()
+        with self.lock:
+            if velocity and not self.velocity:
+                self.last_step = now            # don't count the time spent standing still
+            self.velocity = velocity
+            self.updated_at = now
+            if not velocity:
+                self.accumulated = 0.0
+        if not self.running:
+            self.step(now)
+
+    def step(self, now):
+        """Advance one tick; returns the wheel units emitted"""
+        with self.lock:
+            if self.last_step is None:
+                self.last_step = now
+                return 0
+            dt = now - self.last_step
+            self.last_step = now
+            if not self.velocity or now - self.updated_at > self.stale_after:
+                self.accumulated = 0.0
+                return 0
+            self.accumulated += self.velocity * dt
+            units = int(self.accumulated)     # truncates toward zero for both directions
+            self.accumulated -= units
+        if units:
+            self.actuator.scroll(units)
+        return units
+
+    def _run(self):
+        next_tick = time.perf_counter()
+        while self.running:
+            self.step(time.perf_counter())
+            next_tick += self.interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()  # fell behind; don't try to catch up
+
+    def start(self):
+        if self.running:
+            return
+        self.reset()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=0.5)
+            self.thread = None
@@ -0,0 +1,256 @@
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+
+from engine.latency import LatencyRecorder
+from engine.metrics import METRICS, TRACKING_METRICS
+from engine.overlay import draw_tracking_overlay
+from engine.pipeline import CALIBRATED
+from engine.power import ACTIVE
+from engine.shared_frames import SharedFrameRing
+from engine.startup import start_engine
+
+DEBUG_INTERVAL = 0.5     # seconds between profiler summaries while profiling is on
+METRICS_INTERVAL = 1.0   # seconds between tracking metric snapshots
+
+
+class TrackingService:
+    """Camera + TrackingEngine loop driven over a pipe, for a process of its own.
+
+    Preview frames are mirrored and annotated straight into a SharedFrameRing;
+    only small messages cross the pipe.
+
+    In:  ("start",) ("stop",) ("calibrate",) ("set", name, value)
+         ("profiling", enabled) ("keyboard", visible) ("quit",)
+    Out: ("ring", name, shape, slots) ("event", event) ("status", calibrated)
+         ("power", state, loop_delay_ms) ("debug", text) ("metrics", snapshot)
+         ("ready", timings) ("error", message) ("setting_error", message)
+    """
+
+    def __init__(self, conn, options, other_process=True):
+        self.conn = conn
+        self.options = options
+        self.other_process = other_process
+        self.engine = None
+        self.ring = None
+        self.running = True
+        self.tracking = False
+        self.keyboard_visible = False
+        self.power_state = ACTIVE
+        self.last_debug = 0.0
+        self.last_metrics = 0.0
+
+    def send(self, *message):
+        try:
+            self.conn.send(message)
+        except (BrokenPipeError, OSError):
+            self.running = False     # UI is gone
+
+    def run(self):
+        # Face Mesh loads and warms up while the camera negotiates its mode
+        try:
+            engine, timings = start_engine(self.options.get("engine", {}), self.options.get("device", 0),
+                                           reprobe=self.options.get("reprobe", False))
+        except Exception as e:
+            self.send("error", str(e))
+            return
+        self.engine = engine
+        if self.options.get("latency_report"):
+            engine.latency = LatencyRecorder()
+
+        if not engine.cap.isOpened():
+            self.send("error", "Could not open webcam")
+            engine.release()
+            return
+        self.send("ready", timings)
+
+        try:
+            while self.running:
+                self.handle_messages()
+                self.step()
+        finally:
+            engine.release()
+            if self.ring:
+                self.ring.close()
+            if engine.latency:
+                print(engine.latency.format_report(f"{self.options.get('name', 'Tracking')} motion-to-photon latency"))
+
+    def step(self):
+        engine = self.engine
+        slot = self.ring.begin_write() if self.ring else None
+        frame = engine.read_frame(dst=slot)
+        if frame is None:
+            time.sleep(engine.loop_delay_ms / 1000)
+            return
+
+        if self.ring is None or frame.shape != self.ring.shape:
+            # First frame, or the camera changed resolution: new ring, this frame copied in once
+            self.open_ring(frame.shape)
+            slot = self.ring.begin_write()
+            np.copyto(slot, frame)
+            frame = slot
+
+        if self.tracking:
+            result = engine.process(frame)
+            for event in result.events:
+                self.send("event", event)
+                if event == CALIBRATED:
+                    self.send("status", True)
+            draw_tracking_overlay(frame, result, engine, keyboard_visible=self.keyboard_visible)
+
+        engine.end_frame()
+        self.ring.publish()
+        self.send_periodic()
+
+        if engine.power.state != ACTIVE:
+            # The camera is slowed down too; no need to spin between frames
+            time.sleep(engine.loop_delay_ms / 1000)
+
+    def open_ring(self, shape):
+        if self.ring:
+            self.ring.close()
+        self.ring = SharedFrameRing(shape)
+        self.send("ring", self.ring.name, shape, self.ring.slots)
+
+    def send_periodic(self):
+        engine = self.engine
+        if engine.power.state != self.power_state:
+            self.power_state = engine.power.state
+            self.send("power", self.power_state, engine.loop_delay_ms)
+
+        now = time.perf_counter()
+        if engine.profiler.enabled and now - self.last_debug > DEBUG_INTERVAL:
+            self.last_debug = now
+            self.send("debug", engine.profiler.format_summary())
+        if self.other_process and now - self.last_metrics > METRICS_INTERVAL:
+            self.last_metrics = now
+            self.send("metrics", METRICS.snapshot(TRACKING_METRICS))
+
+    def handle_messages(self):
+        try:
+            while self.conn.poll():
+                self.handle(self.conn.recv())
+        except (EOFError, OSError):
+            self.running = False
+
+    def handle(self, message):
+        command = message[0]
+        engine = self.engine
+        if command == "start":
+            self.tracking = True
+            engine.start()
+        elif command == "stop":
+            self.tracking = False
+            engine.stop()
+        elif command == "calibrate":
+            engine.recalibrate()
+            self.send("status", False)
+            self.tracking = True
+            engine.start()
+        elif command == "set":
+            self.apply_setting(message[1], message[2])
+        elif command == "profiling":
+            engine.profiler.set_enabled(message[1])
+        elif command == "keyboard":
+            self.keyboard_visible = message[1]
+        elif command == "quit":
+            self.running = False
+
+    def apply_setting(self, name, value):
+        engine = self.engine
+        if name == "sensitivity":
+            engine.sensitivity = value
+        elif name == "click_threshold":
+            engine.mouth.click_threshold = value
+        elif name == "click_cooldown":
+            engine.mouth.click_cooldown = value
+        elif name == "smoothing":
+            engine.filter.set_size(value)
+        elif name == "gain_curve":
+            try:
+                engine.set_gain_curve(value)
+            except ValueError as e:
+                self.send("setting_error", str(e))
+        else:
+            self.send("setting_error", f"Unknown setting: {name}")
+
+
+def run_tracking(conn, options, other_process=True):
+    """Entry point of the tracking process (or thread)"""
+    TrackingService(conn, options, other_process).run()
+
+
+class TrackingClient:
+    """UI-side handle on a TrackingService in its own process.
+
+    With use_process=False the service runs in a thread instead, with the
+    same pipe and shared-memory transport.
+    """
+
+    def __init__(self, options, use_process=True):
+        self.use_process = use_process
+        if use_process:
+            ctx = multiprocessing.get_context("spawn")
+            self.conn, child = ctx.Pipe()
+            # A Face Mesh pool needs child processes, which daemon processes can't have
+            daemon = options.get("engine", {}).get("workers", 0) <= 1
+            self.worker = ctx.Process(target=run_tracking, args=(child, options),
+                                      name="liberate-tracking", daemon=daemon)
+        else:
+            self.conn, child = multiprocessing.Pipe()
+            self.worker = threading.Thread(target=run_tracking, args=(child, options, False),
+                                           name="liberate-tracking", daemon=True)
+        self.worker.start()
+
+        self.ring = None
+        self.calibrated = False
+        self.power_state = ACTIVE
+        self.poll_delay_ms = 10
+
+    def send(self, *message):
+        try:
+            self.conn.send(message)
+        except (BrokenPipeError, OSError):
+            pass
+
+    def poll(self):
+        """Messages from the tracking side since the last call.
+
+        Ring, status, power and metrics messages are applied here as well as
+        returned.
+        """
+        messages = []
+        try:
+            while self.conn.poll():
+                message = self.conn.recv()
+                kind = message[0]
+                if kind == "ring":
+                    if self.ring:
+                        self.ring.close()
+                    self.ring = SharedFrameRing(message[2], slots=message[3], name=message[1],
+                                                other_process=self.use_process)
+                elif kind == "status":
+                    self.calibrated = message[1]
+                elif kind == "power":
+                    self.power_state, self.poll_delay_ms = message[1], message[2]
+                elif kind == "metrics":
+                    METRICS.load(message[1])
+                messages.append(message)
+        except (EOFError, OSError):
+            pass
+        return messages
+
+    def read_frame(self, consume):
+        """Hand the newest preview frame to consume(view); True if one was consumed"""
+        return self.ring.read(consume) if self.ring else False
+
+    def close(self, timeout=3.0):
+        self.send("quit")
+        self.worker.join(timeout)
+        if self.use_process and self.worker.is_alive():
+            self.worker.terminate()
+        if self.ring:
+            self.ring.close()
+            self.ring = None
@@ -0,0 +1,96 @@
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+HEADER_SLOTS = 8  # int64 header words: latest slot index + one sequence number per slot
+
+
+class SharedFrameRing:
+    """Ring of preview frames in shared memory, one writer and one reader.
+
+    The writer gets a numpy view of the next slot and draws the frame straight
+    into it, then publishes it; the reader converts the latest published slot
+    into its own buffer. Nothing is pickled or copied through a pipe.
+
+    Each slot holds the sequence number of its frame, odd while it is being
+    written (a seqlock): the reader checks it before and after using the slot
+    and throws the frame away if the writer came round and overwrote it
+    meanwhile.
+    """
+
+    def __init__(self, shape, slots=3, name=None, dtype=np.uint8, other_process=True):
+        if slots > HEADER_SLOTS - 1:
+            raise ValueError(f"At most {HEADER_SLOTS - 1} slots")
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.dtype = np.dtype(dtype)
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        size = HEADER_SLOTS * 8 + slots * frame_bytes
+
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = _attach(name) if other_process else shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+
+        self.header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=self.shm.buf)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=self.dtype,
+                                 buffer=self.shm.buf, offset=HEADER_SLOTS * 8)
+        if self.owner:
+            self.header[:] = 0
+            self.header[0] = -1     # nothing published yet
+        self.next_slot = 0
+        self.count = 0
+        self.last_seen = 0
+
+    # ---- writer ----
+
+    def begin_write(self):
+        """View of the slot to draw the next frame into (marked busy until publish)"""
+        slot = self.next_slot
+        self.header[1 + slot] = 2 * self.count + 1      # odd: being written
+        return self.frames[slot]
+
+    def publish(self):
+        slot = self.next_slot
+        self.count += 1
+        self.header[1 + slot] = 2 * self.count          # even: complete
+        self.header[0] = slot
+        self.next_slot = (slot + 1) % self.slots
+
+    # ---- reader ----
+
+    def read(self, consume):
+        """Call consume(view) with the newest unseen frame; True if it was consistent"""
+        slot = int(self.header[0])
+        if slot < 0:
+            return False
+        seq = int(self.header[1 + slot])
+        if seq % 2 or seq == self.last_seen:
+            return False
+        consume(self.frames[slot])
+        if int(self.header[1 + slot]) != seq:
+            return False                     # overwritten while we read it
+        self.last_seen = seq
+        return True
+
+    def close(self):
+        # Drop the numpy views first, or the buffer can't be released
+        self.header = None
+        self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _attach(name):
+    """Open a segment created by another process without letting this one's tracker unlink it"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if sys.platform != "win32":
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
@@ -0,0 +1,61 @@
+import threading
+import time
+
+from engine.camera import open_camera
+from engine.pipeline import TrackingEngine
+
+
+class CameraOpener:
+    """Opens the webcam (probing its mode if needed) on a background thread.
+
+    Camera negotiation mostly waits on the driver, so it overlaps well with
+    loading Face Mesh or building the UI.
+    """
+
+    def __init__(self, device=0, reprobe=False):
+        self.device = device
+        self.reprobe = reprobe
+        self.cap = None
+        self.error = None
+        self.seconds = None
+        self.thread = threading.Thread(target=self._open, name="liberate-camera-open", daemon=True)
+        self.thread.start()
+
+    def _open(self):
+        start = time.perf_counter()
+        try:
+            self.cap = open_camera(self.device, reprobe=self.reprobe)
+        except Exception as e:
+            self.error = e
+        self.seconds = time.perf_counter() - start
+
+    def result(self, timeout=None):
+        """The opened capture (check isOpened()); re-raises an error from the thread"""
+        self.thread.join(timeout)
+        if self.error:
+            raise self.error
+        return self.cap
+
+
+def start_engine(engine_options, device=0, reprobe=False, warm_up=True):
+    """Build a TrackingEngine while the camera opens, then warm the model up.
+
+    Returns (engine, timings): the engine has the capture attached, and
+    timings holds the seconds spent on each step and in total.
+    """
+    start = time.perf_counter()
+    opener = CameraOpener(device, reprobe=reprobe)
+    engine = TrackingEngine(**engine_options)
+    timings = {"model": time.perf_counter() - start}
+    if warm_up:
+        warm_start = time.perf_counter()
+        engine.warm_up()
+        timings["warm_up"] = time.perf_counter() - warm_start
+    try:
+        engine.attach(opener.result())
+    except Exception:
+        engine.release()
+        raise
+    timings["camera"] = opener.seconds
+    timings["total"] = time.perf_counter() - start
+    return engine, timings
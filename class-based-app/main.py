@@ -4,7 +4,6 @@ from tkinter import ttk
 import os 
 import cv2
 from dotenv import load_dotenv
-import pyautogui
 import time
 from PIL import Image, ImageTk
 import numpy as np
@@ -12,35 +11,66 @@ import threading
 
 
 # Import your components
-from core.facialtracker import FacialTracker
-from UI.voice_ui import VoiceAssistantUI
-from collections import deque
 from core.keyboard import VirtualKeyboard
-from core.voiceassist import VoiceTypingAssistant
+from engine.service import TrackingClient
+from engine.pipeline import CALIBRATED
+from engine.gestures import CLICK, TOGGLE_KEYBOARD
+from engine.buffers import FrameBuffers
+from engine.metrics import start_from_env as start_metrics_server
 
 # Load environment variables
 load_dotenv()
 
 class FacialMouseApp(ctk.CTk):
     def __init__(self):
+        self.started_at = time.perf_counter()
         super().__init__()
         self.title("Liberate")
         self.geometry("1200x800")
         
         # Initialize components
-        self.tracker = FacialTracker()
+        # Shared headless tracking engine, run by the webcam setup in its own process
+        # (LIBERATE_TRACKING_PROCESS=0 runs it in a thread of this one instead);
+        # this window only draws previews and routes UI events
+        # LIBERATE_FACEMESH_WORKERS > 1 runs Face Mesh in a process pool, and
+        # LIBERATE_CURSOR_HZ=0 moves the cursor only when a result arrives
+        self.tracking_options = {
+            "name": "FacialMouseApp",
+            "engine": dict(
+                safe_margin=15,
+                cursor_hz=int(os.getenv("LIBERATE_CURSOR_HZ", "120")),
+                workers=int(os.getenv("LIBERATE_FACEMESH_WORKERS", "0")),
+                power_save=os.getenv("LIBERATE_POWER_SAVE", "1") != "0",
+                motion_gate=os.getenv("LIBERATE_MOTION_GATE", "1") != "0",
+                optical_flow=os.getenv("LIBERATE_OPTICAL_FLOW") == "1",
+                scroll_source=os.getenv("LIBERATE_SCROLL_SOURCE", "gaze"),
+                pointer_mode=os.getenv("LIBERATE_POINTER", "head"),
+                gain_curve=os.getenv("LIBERATE_GAIN_CURVE") or None,
+                drift_correction=os.getenv("LIBERATE_DRIFT_CORRECTION", "0") == "1"
+            ),
+            "device": 0,
+            "reprobe": os.getenv("LIBERATE_CAMERA_REPROBE") == "1",
+            # LIBERATE_LATENCY_REPORT=1 prints motion-to-photon percentiles on exit
+            "latency_report": os.getenv("LIBERATE_LATENCY_REPORT") == "1",
+        }
+        self.tracking = None
+        self.tracking_error = None
+        # Started before the UI is built: the tracking side loads and warms up
+        # Face Mesh and negotiates the camera while the widgets below are created
+        self.start_tracking()
+        
+        # LIBERATE_METRICS=9464 (or unix:/path.sock) serves counters on localhost
+        self.metrics_server = start_metrics_server()
 
         # Keyboard Initlization
         self.keyboard = VirtualKeyboard(self)
-
-        self.mouth_open_count = 0
-        self.last_mouth_open_time = 0
-        self.keyboard_cooldown = False
         
         # Track app state
         self.tracking_active = False
-        self.calibrating = False
         self.cam_active = False
+        self.preview_image = None
+        self.preview_photo = None
+        self.preview_buffers = FrameBuffers()
         
         # Setup UI
         self.setup_ui()
@@ -48,7 +78,7 @@ class FacialMouseApp(ctk.CTk):
         
     def setup_ui(self):
         # Create tab view
-        self.tabview = ctk.CTkTabview(self)
+        self.tabview = ctk.CTkTabview(self, command=self.on_tab_change)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Add tabs
@@ -171,6 +201,14 @@ class FacialMouseApp(ctk.CTk):
         )
         self.debug_label.pack(pady=5)
         
+        # Profiling hooks stay wired in but cost nothing until switched on
+        self.profiling_switch = ctk.CTkSwitch(
+            debug_frame,
+            text="Live profiling",
+            command=self.toggle_profiling
+        )
+        self.profiling_switch.pack(pady=5)
+        
         # Instructions
         instr_frame = ctk.CTkFrame(controls_frame)
         instr_frame.pack(fill="x", pady=20)
@@ -195,10 +233,20 @@ class FacialMouseApp(ctk.CTk):
         ).pack(pady=5)
 
     def setup_voice_tab(self):
-        """Setup voice assistant tab"""
-        voice_frame = ctk.CTkFrame(self.tab_voice)
-        voice_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
+        """Setup voice assistant tab (the assistant itself is built when the tab is first opened)"""
+        self.voice_frame = ctk.CTkFrame(self.tab_voice)
+        self.voice_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.voice_typing = None
+
+    def on_tab_change(self):
+        if self.tabview.get() == "Voice Assistant" and self.voice_typing is None:
+            self.load_voice_assistant()
+
+    def load_voice_assistant(self):
+        """Import and build the voice typing assistant on first use"""
+        from core.voiceassist import VoiceTypingAssistant
+
+        voice_frame = self.voice_frame
         # Initialize the voice typing assistant with Google Docs functionality
         try:
             self.voice_typing = VoiceTypingAssistant(
@@ -221,6 +269,7 @@ class FacialMouseApp(ctk.CTk):
                 text_color="yellow"
             )
             help_label.pack(pady=10)
+            self.voice_typing = False     # don't retry on every tab switch
 
     def setup_settings_tab(self):
         """Setup settings tab"""
@@ -367,113 +416,135 @@ class FacialMouseApp(ctk.CTk):
         
         return content_frame
 
-    def setup_webcam(self):
-        """Initialize webcam capture"""
+    def start_tracking(self):
+        """Start the tracking process; it opens the webcam and streams previews back"""
         try:
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap.isOpened():
-                raise Exception("Could not open webcam")
-                
-            self.cam_active = True
-            self.update_camera_preview()
+            # The camera negotiates format/resolution/fps/buffer once, then reuses the cached mode
+            self.tracking = TrackingClient(
+                self.tracking_options,
+                use_process=os.getenv("LIBERATE_TRACKING_PROCESS", "1") != "0"
+            )
         except Exception as e:
-            self.show_error(f"Error initializing webcam: {str(e)}")
+            self.tracking_error = e
+
+    def setup_webcam(self):
+        """Show previews from the tracking side once the UI exists"""
+        if self.tracking is None:
+            self.show_error(f"Error initializing webcam: {str(self.tracking_error)}")
+            # Nothing to start, calibrate or tune without the tracking side
+            for control in (self.btn_tracking, self.btn_calibrate, self.profiling_switch, self.sensitivity,
+                            self.click_threshold, self.click_cooldown, self.smoothing):
+                control.configure(state="disabled")
+            return
+        self.cam_active = True
+        self.update_camera_preview()
     
     def update_camera_preview(self):
-        if self.cam_active and hasattr(self, 'cap'):
-            ret, frame = self.cap.read()
+        if self.cam_active:
+            for message in self.tracking.poll():
+                self.handle_tracking_message(message)
             
-            if ret:
-                frame = cv2.flip(frame, 1)
-                
-                if self.tracking_active:
-                    if self.calibrating:
-                        if self.tracker.calibrate(frame):
-                            self.calibrating = False
-                            self.status_label.configure(text="Calibration complete!")
-                    else:
-                        cursor_pos = self.tracker.track_face(frame)
-                        
-                        if cursor_pos:
-                            screen_width, screen_height = pyautogui.size()
-                            safe_margin = 15
-                            safe_x = max(safe_margin, min(cursor_pos[0], screen_width - safe_margin))
-                            safe_y = max(safe_margin, min(cursor_pos[1], screen_height - safe_margin))
-                            pyautogui.moveTo(safe_x, safe_y)
-                            
-                            # Check for mouth open events
-                            if self.tracker.check_mouth_open(frame):
-                                current_time = time.time()
-                                
-                                # Check if we should register a click (single mouth open)
-                                if current_time - self.last_mouth_open_time > 0.5:  # 500ms cooldown
-                                    self.mouth_open_count += 1
-                                    self.last_mouth_open_time = current_time
-                                    
-                                    # Single click
-                                    pyautogui.click()
-                                    self.status_label.configure(text="Click detected!")
-                                
-                                # Check for triple mouth open (keyboard toggle)
-                                if self.mouth_open_count >= 3 and not self.keyboard_cooldown:
-                                    self.keyboard.toggle()
-                                    self.mouth_open_count = 0
-                                    self.keyboard_cooldown = True
-                                    self.after(2000, lambda: setattr(self, 'keyboard_cooldown', False))  # 2s cooldown
-                                    self.status_label.configure(text="Keyboard toggled!")
-                            
-                            # Reset mouth open count if too much time has passed
-                            if time.time() - self.last_mouth_open_time > 1.5:
-                                self.mouth_open_count = 0
-                
-                # Convert and display the frame
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(rgb_frame)
-                photo = ImageTk.PhotoImage(image=img)
-                self.cam_label.configure(image=photo)
-                self.cam_label.image = photo
-        
-        self.after(10, self.update_camera_preview)
+            # Convert the newest shared-memory frame straight into the preview buffer
+            if self.tracking.read_frame(self.convert_preview):
+                self.show_preview(self.preview_rgb)
+        
+            self.after(self.tracking.poll_delay_ms, self.update_camera_preview)
+    
+    def convert_preview(self, frame):
+        self.preview_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.preview_buffers.get("preview", frame.shape))
+    
+    def handle_tracking_message(self, message):
+        """Status from the tracking process (the mouse actions already happened there)"""
+        kind = message[0]
+        if kind == "event":
+            event = message[1]
+            if event == CALIBRATED:
+                self.status_label.configure(text="Calibration complete!")
+            elif event == CLICK:
+                self.status_label.configure(text="Click detected!")
+            elif event == TOGGLE_KEYBOARD:
+                self.keyboard.toggle()
+                self.tracking.send("keyboard", self.keyboard.visible)
+                self.status_label.configure(text="Keyboard toggled!")
+        elif kind == "ready":
+            self.status_label.configure(
+                text=f"Camera ready in {time.perf_counter() - self.started_at:.1f}s - ready to start tracking")
+        elif kind == "debug":
+            if self.profiling_switch.get():
+                self.debug_label.configure(text=message[1])
+        elif kind == "error":
+            self.show_error(f"Error initializing webcam: {message[1]}")
+        elif kind == "setting_error":
+            self.show_error(f"Could not apply setting: {message[1]}")
+    
+    def show_preview(self, rgb_frame):
+        """Copy a frame into the persistent preview image instead of building a new one"""
+        height, width = rgb_frame.shape[:2]
+        if self.preview_image is None or self.preview_image.size != (width, height):
+            self.preview_image = Image.new("RGB", (width, height))
+            self.preview_photo = ImageTk.PhotoImage(image=self.preview_image)
+            self.cam_label.configure(image=self.preview_photo)
+            self.cam_label.image = self.preview_photo
+        
+        self.preview_image.frombytes(rgb_frame.data)
+        self.preview_photo.paste(self.preview_image)
+    
+    def send_tracking(self, *message):
+        """Send a command to the tracking side; False if it never started"""
+        if self.tracking is None:
+            return False
+        self.tracking.send(*message)
+        return True
     
     def toggle_tracking(self):
+        if self.tracking is None:
+            self.show_error(f"Tracking is unavailable: {self.tracking_error}")
+            return
         if self.tracking_active:
             self.tracking_active = False
+            self.tracking.send("stop")
             self.btn_tracking.configure(text="Start Tracking")
             self.status_label.configure(text="Tracking stopped")
         else:
-            if not self.tracker.calibrated:
+            if not self.tracking.calibrated:
                 # Will automatically calibrate if not calibrated 
                 self.start_calibration()
             
             self.tracking_active = True
+            self.tracking.send("start")
             self.btn_tracking.configure(text="Stop Tracking")
             self.status_label.configure(text="Tracking active")
     
+    def toggle_profiling(self):
+        # Stats arrive from the tracking process twice a second while enabled
+        enabled = bool(self.profiling_switch.get())
+        self.send_tracking("profiling", enabled)
+        if not enabled:
+            self.debug_label.configure(text="No data available")
+    
     def start_calibration(self):
-        self.calibrating = True
-        self.tracker.calibrated = False
-        self.tracker.calibration_count = 0
+        if not self.send_tracking("calibrate"):
+            self.show_error(f"Tracking is unavailable: {self.tracking_error}")
+            return
         self.tracking_active = True
         self.btn_tracking.configure(text="Stop Tracking")
         self.status_label.configure(text="Calibrating... Look straight at the camera")
     
     def update_sensitivity(self, value):
-        self.tracker.sensitivity = float(value)
+        self.send_tracking("set", "sensitivity", float(value))
         self.sensitivity_label.configure(text=f"{value:.1f}")
     
     def update_click_threshold(self, value):
-        self.tracker.click_threshold = float(value)
+        self.send_tracking("set", "click_threshold", float(value))
         self.click_threshold_label.configure(text=f"{value:.2f}")
     
     def update_click_cooldown(self, value):
-        self.tracker.click_cooldown = float(value)
+        self.send_tracking("set", "click_cooldown", float(value))
         self.click_cooldown_label.configure(text=f"{value:.1f}")
     
     def update_smoothing(self, value):
         value = int(value)
-        self.tracker.smoothing_factor = value
-        self.tracker.x_points = deque(self.tracker.x_points, maxlen=value)
-        self.tracker.y_points = deque(self.tracker.y_points, maxlen=value)
+        self.send_tracking("set", "smoothing", value)
         self.smoothing_label.configure(text=str(value))
     
     def change_appearance_mode(self, new_mode):
@@ -489,14 +560,12 @@ class FacialMouseApp(ctk.CTk):
     def on_closing(self):
         # Clean up resources before closing the app to reduce lag 
         self.cam_active = False
-        if hasattr(self, 'cap'):
-            self.cap.release()
-        
-        if hasattr(self, 'tracker'):
-            self.tracker.release()
+        if self.tracking:
+            # The tracking process releases the camera and prints its latency report
+            self.tracking.close()
             
-        if hasattr(self, 'voice_ui'):
-            self.voice_ui.cleanup()
+        if self.voice_typing:
+            self.voice_typing.is_listening = False
             
         self.destroy()
 